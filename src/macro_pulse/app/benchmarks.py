@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import io
+import json
+import multiprocessing
+import resource
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from ..core.logging import get_logger
+from ..core.paths import resolve_project_path
+from ..data.snapshots import build_snapshot
+from ..domain.models import ReportDataset
+
+
+logger = get_logger(__name__)
+
+REPORT_RENDER_METHODS = ("string", "stream")
+SCREENSHOT_FIXTURE_DIR = "tests/fixtures/screenshot_pages"
+SCREENSHOT_FIXTURE_PAGES = {
+    "finviz": "finviz.html",
+    "kospi": "marketmap.html?market=kospi",
+    "kosdaq": "marketmap.html?market=kosdaq",
+}
+
+
+def build_synthetic_dataset(rows_per_category: int = 200) -> ReportDataset:
+    dataset: ReportDataset = {}
+    for category in ("indices_overseas", "commodities_rates", "exchange", "crypto"):
+        items = []
+        for index in range(rows_per_category):
+            base_price = 100.0 + index
+            history = [base_price + (step % 3) - 1 for step in range(7)]
+            items.append(
+                build_snapshot(
+                    f"{category} {index:04d}",
+                    history[-1],
+                    history[-1] - history[-2],
+                    (history[-1] - history[-2]) / history[-2] * 100,
+                    history=history,
+                    ticker=f"{category[:3].upper()}{index:04d}",
+                )
+            )
+        dataset[category] = items
+    return dataset
+
+
+def measure_report_peak_rss(
+    data: ReportDataset,
+    methods: tuple[str, ...] = REPORT_RENDER_METHODS,
+) -> dict[str, dict[str, int]]:
+    """Render the report once per method, each in a fresh process.
+
+    ``ru_maxrss`` only ever grows inside a process, so every method gets its
+    own spawned interpreter to keep the peaks comparable.
+    """
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for method in methods:
+            output_path = Path(temp_dir) / f"report_{method}.html"
+            with context.Pool(processes=1) as pool:
+                results[method] = pool.apply(
+                    _measure_render_rss, (method, data, str(output_path))
+                )
+            logger.info(
+                "Report render (%s): baseline=%s KiB peak=%s KiB",
+                method,
+                results[method]["baseline_kib"],
+                results[method]["peak_kib"],
+            )
+    return results
+
+
+def _measure_render_rss(method: str, data: ReportDataset, output_path: str):
+    from ..reporting.generator import generate_html_report, stream_html_report
+
+    # Warm the template and matplotlib caches so the peak reflects rendering.
+    stream_html_report({}, io.StringIO())
+    baseline_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    if method == "string":
+        Path(output_path).write_text(generate_html_report(data), encoding="utf-8")
+    elif method == "stream":
+        stream_html_report(data, output_path)
+    else:
+        raise ValueError(f"Unsupported report render method: {method}")
+
+    return {
+        "baseline_kib": baseline_kib,
+        "peak_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "output_bytes": Path(output_path).stat().st_size,
+    }
+
+
+@contextmanager
+def serve_fixture_pages(pages_dir=None):
+    """Serve the offline screenshot stand-in pages and yield their base URL."""
+    directory = resolve_project_path(pages_dir or SCREENSHOT_FIXTURE_DIR)
+    handler = functools.partial(_QuietRequestHandler, directory=str(directory))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def measure_screenshot_timings(
+    targets: tuple[str, ...] = tuple(SCREENSHOT_FIXTURE_PAGES),
+    pages_dir=None,
+    capture_mode=None,
+) -> dict:
+    """Capture each target from the local stand-in pages in one browser.
+
+    Reports browser launch once, then navigation, readiness and capture
+    seconds per target.
+    """
+    from ..reporting.screenshots import SCREENSHOT_HANDLERS, get_chrome_driver
+
+    with serve_fixture_pages(pages_dir) as base_url:
+        started_at = time.monotonic()
+        driver = get_chrome_driver()
+        launch_seconds = time.monotonic() - started_at
+        if driver is None:
+            raise RuntimeError("Chrome is unavailable; cannot run the benchmark.")
+
+        results = {"launch_seconds": round(launch_seconds, 3), "targets": {}}
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                for target in targets:
+                    waits, timings = {}, {}
+                    started_at = time.monotonic()
+                    path = SCREENSHOT_HANDLERS[target](
+                        str(Path(temp_dir) / f"{target}.png"),
+                        driver=driver,
+                        waits=waits,
+                        capture_mode=capture_mode,
+                        url=f"{base_url}/{SCREENSHOT_FIXTURE_PAGES[target]}",
+                        timings=timings,
+                    )
+                    results["targets"][target] = {
+                        "captured": path is not None,
+                        "navigation_seconds": round(timings.get("navigation", 0.0), 3),
+                        "readiness_seconds": round(sum(waits.values()), 3),
+                        "capture_seconds": round(timings.get("capture", 0.0), 3),
+                        "total_seconds": round(time.monotonic() - started_at, 3),
+                    }
+                    logger.info("Screenshot %s: %s", target, results["targets"][target])
+        finally:
+            driver.quit()
+    return results
+
+
+class _QuietRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        logger.debug("Fixture server: " + format, *args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Macro Pulse benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    report_memory = subparsers.add_parser(
+        "report-memory", help="Compare peak RSS of string and streaming renders"
+    )
+    report_memory.add_argument(
+        "--rows",
+        type=int,
+        default=200,
+        help="Synthetic rows per category.",
+    )
+
+    screenshot_timing = subparsers.add_parser(
+        "screenshot-timing",
+        help="Time screenshot capture against the offline stand-in pages",
+    )
+    screenshot_timing.add_argument(
+        "--target",
+        action="append",
+        choices=tuple(SCREENSHOT_FIXTURE_PAGES),
+        help="Target to capture. Repeat for several; defaults to all.",
+    )
+    screenshot_timing.add_argument(
+        "--capture-mode",
+        choices=("window", "cdp"),
+        default=None,
+        help="Screenshot capture mode. Defaults to SCREENSHOT_CAPTURE_MODE.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command == "report-memory":
+        results = measure_report_peak_rss(build_synthetic_dataset(args.rows))
+        print(json.dumps(results, indent=2))
+    elif args.command == "screenshot-timing":
+        results = measure_screenshot_timings(
+            tuple(args.target or SCREENSHOT_FIXTURE_PAGES),
+            capture_mode=args.capture_mode,
+        )
+        print(json.dumps(results, indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,13 +7,45 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from ..config.report_formats import get_screenshot_targets, load_report_format_config
-from ..core.artifacts import cleanup_files
+from ..config.report_formats import (
+    get_screenshot_target_config,
+    get_screenshot_targets,
+    get_summary_card_config,
+    load_report_format_config,
+)
+from ..core.artifacts import (
+    COMPRESSION_FORMATS,
+    finalize_report_artifact,
+)
 from ..core.logging import configure_logging, get_logger
 from ..data.market_data import fetch_all_data
-from ..delivery.notifier import send_telegram_report
-from ..reporting.generator import generate_html_report, generate_telegram_summary
-from ..reporting.screenshots import capture_screenshots
+from ..delivery.fanout import fan_out_telegram_report, resolve_telegram_chat_ids
+from ..delivery.media_cache import (
+    load_media_cache,
+    resolve_media_cache_ttl,
+    save_media_cache,
+)
+from ..delivery.notifier import close_telegram_bots, send_telegram_report
+from ..domain.models import index_dataset
+from ..reporting.generator import (
+    SPARKLINE_MODES,
+    generate_telegram_summary,
+    render_dataset,
+    stream_html_report,
+)
+from ..reporting.image_hashes import (
+    load_image_hashes,
+    mark_unchanged_screenshots,
+    record_delivered_hashes,
+    resolve_unchanged_screenshot_action,
+    save_image_hashes,
+)
+from ..reporting.image_postprocess import postprocess_screenshots
+from ..reporting.market_treemap import render_native_screenshots
+from ..reporting.render_cache import load_render_cache, save_render_cache
+from ..reporting.screenshot_service import request_service_screenshot_results
+from ..reporting.screenshots import capture_screenshot_results
+from ..reporting.summary_card import render_summary_card
 
 
 load_dotenv()
@@ -21,6 +53,9 @@ configure_logging()
 
 logger = get_logger(__name__)
 
+ALL_MODES = "ALL"
+DEFAULT_REPORT_PATH = "macro_pulse_report.html"
+
 
 def resolve_mode(market_arg: str | None, now_utc: datetime | None = None) -> str:
     normalized = (market_arg or "").strip().upper()
@@ -31,6 +66,22 @@ def resolve_mode(market_arg: str | None, now_utc: datetime | None = None) -> str
     return "KR" if 7 <= current_time.hour < 20 else "US"
 
 
+def resolve_modes(
+    market_arg: str | None,
+    format_config,
+    now_utc: datetime | None = None,
+) -> list[str]:
+    if (market_arg or "").strip().upper() == ALL_MODES:
+        return list(format_config.modes)
+    return [resolve_mode(market_arg, now_utc)]
+
+
+def resolve_report_path(mode: str, modes: list[str]) -> Path:
+    if len(modes) == 1:
+        return Path(DEFAULT_REPORT_PATH)
+    return Path(f"macro_pulse_report_{mode.lower()}.html")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Macro Pulse Bot")
     parser.add_argument(
@@ -40,7 +91,37 @@ def build_parser() -> argparse.ArgumentParser:
         "--market",
         type=str,
         default="Global",
-        help="Market context override (KR/US). Global uses time-based auto mode.",
+        help=(
+            "Market context override (KR/US). ALL renders every configured mode "
+            "from one fetch. Global uses time-based auto mode."
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-render only rows that changed since the previous run.",
+    )
+    parser.add_argument(
+        "--sparkline-mode",
+        choices=SPARKLINE_MODES,
+        default="inline",
+        help=(
+            "inline embeds one PNG per row, sprite embeds one shared sprite, "
+            "external writes the sprite next to the report."
+        ),
+    )
+    parser.add_argument(
+        "--compress",
+        action="append",
+        choices=COMPRESSION_FORMATS,
+        default=[],
+        help="Also write a precompressed .gz copy of each report.",
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=None,
+        help="gzip compression level (0-9). Defaults to max.",
     )
     return parser
 
@@ -48,40 +129,140 @@ def build_parser() -> argparse.ArgumentParser:
 async def main(argv: list[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
 
-    mode = resolve_mode(args.market)
     report_format_config = load_report_format_config()
+    modes = resolve_modes(args.market, report_format_config)
+
+    logger.info("Starting Macro Pulse Bot (mode=%s)", ", ".join(modes))
 
-    logger.info("Starting Macro Pulse Bot (mode=%s)", mode)
+    data = index_dataset(fetch_all_data())
+    # Multi-mode and incremental runs share one set of rendered rows; plain
+    # single-mode runs stream rows lazily instead.
+    rendered_data = None
+    if args.incremental:
+        render_cache = load_render_cache()
+        rendered_data = render_dataset(data, render_cache=render_cache)
+        save_render_cache(render_cache)
+    elif len(modes) > 1:
+        rendered_data = render_dataset(data)
 
-    data = fetch_all_data()
-    html_report = generate_html_report(data)
-    telegram_summary = generate_telegram_summary(data, mode, report_format_config)
-    logger.info("Telegram Summary (%s):\n%s\n", mode, telegram_summary)
+    telegram_summaries = {}
+    for mode in modes:
+        telegram_summaries[mode] = generate_telegram_summary(
+            data, mode, report_format_config
+        )
+        logger.info("Telegram Summary (%s):\n%s\n", mode, telegram_summaries[mode])
 
-    output_path = Path("macro_pulse_report.html")
-    output_path.write_text(html_report, encoding="utf-8")
-    logger.info("Report saved to %s", output_path)
+        output_path = resolve_report_path(mode, modes)
+        if rendered_data is None and args.sparkline_mode == "inline":
+            stream_html_report(data, output_path)
+        else:
+            stream_html_report(
+                data,
+                output_path,
+                rendered_data=rendered_data,
+                mode=mode if len(modes) > 1 else None,
+                format_config=report_format_config,
+                sparkline_mode=args.sparkline_mode,
+            )
+        logger.info("Report saved to %s", output_path)
+        finalize_report_artifact(
+            output_path,
+            compression_formats=args.compress,
+            compression_level=args.compression_level,
+        )
 
     if args.dry_run:
         logger.info("Dry run complete. No notifications sent.")
         return 0
 
-    screenshot_paths = capture_screenshots(
-        get_screenshot_targets(mode, report_format_config)
+    try:
+        for mode in modes:
+            await _deliver_mode_report(
+                data, mode, telegram_summaries[mode], report_format_config
+            )
+    finally:
+        await close_telegram_bots()
+
+    return 0
+
+
+async def _deliver_mode_report(data, mode, telegram_summary, report_format_config):
+    images = []
+    summary_card = get_summary_card_config(mode, report_format_config)
+    if summary_card and summary_card.enabled:
+        images.append(
+            render_summary_card(data, mode, report_format_config, as_bytes=True)
+        )
+
+    targets = get_screenshot_targets(mode, report_format_config)
+    screenshot_results = postprocess_screenshots(
+        _capture_mode_screenshots(targets),
+        {
+            target: get_screenshot_target_config(target, report_format_config)
+            for target in targets
+        },
+    )
+    delivered_hashes = load_image_hashes()
+    screenshot_results = mark_unchanged_screenshots(
+        screenshot_results, delivered_hashes
     )
+    unchanged_action = resolve_unchanged_screenshot_action()
+    unchanged_targets = []
+    for result in screenshot_results:
+        if not result.png:
+            continue
+        if result.unchanged and unchanged_action != "send":
+            unchanged_targets.append(result.target)
+        else:
+            images.append(result.png)
 
-    try:
-        telegram_token = os.environ.get("TELEGRAM_BOT_TOKEN")
-        telegram_chat_id = os.environ.get("TELEGRAM_CHAT_ID")
+    message_text = telegram_summary
+    if unchanged_targets and unchanged_action == "note":
+        unchanged_names = ", ".join(target.upper() for target in unchanged_targets)
+        message_text = (
+            f"{telegram_summary}\n\n지난 발송 이후 변화 없음: {unchanged_names}"
+        )
+
+    telegram_token = os.environ.get("TELEGRAM_BOT_TOKEN")
+    telegram_chat_ids = resolve_telegram_chat_ids()
 
-        if telegram_token and telegram_chat_id:
-            await send_telegram_report(
+    if telegram_token and telegram_chat_ids:
+        media_cache = load_media_cache() if resolve_media_cache_ttl() > 0 else None
+        if len(telegram_chat_ids) == 1:
+            delivered = await send_telegram_report(
                 telegram_token,
-                telegram_chat_id,
-                telegram_summary,
-                image_paths=screenshot_paths,
+                telegram_chat_ids[0],
+                message_text,
+                images=images,
+                media_cache=media_cache,
+            )
+        else:
+            reports = await fan_out_telegram_report(
+                telegram_token,
+                telegram_chat_ids,
+                message_text,
+                images=images,
+                media_cache=media_cache,
+            )
+            # A chat that missed this run must not have its images deduped
+            # away next time, so only a complete fan-out counts as delivered.
+            delivered = all(report.delivered for report in reports)
+        if media_cache is not None:
+            save_media_cache(media_cache)
+        if delivered:
+            save_image_hashes(
+                record_delivered_hashes(screenshot_results, delivered_hashes)
             )
-    finally:
-        cleanup_files(screenshot_paths)
 
-    return 0
+
+def _capture_mode_screenshots(targets):
+    # Market maps drawn from data skip the browser; a running screenshot
+    # service has a warm browser; otherwise start one here.
+    results = render_native_screenshots(targets)
+    remaining = [target for target in targets if target not in results]
+    if remaining:
+        browser_results = request_service_screenshot_results(remaining)
+        if browser_results is None:
+            browser_results = capture_screenshot_results(remaining)
+        results.update((result.target, result) for result in browser_results)
+    return [results[target] for target in targets if target in results]
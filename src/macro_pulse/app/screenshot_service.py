@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from ..core.logging import configure_logging
+from ..reporting.screenshot_service import (
+    DEFAULT_SERVICE_MAX_CAPTURES,
+    DEFAULT_SERVICE_MAX_RSS_MB,
+    DEFAULT_SERVICE_PROFILE_DIR,
+    WarmBrowser,
+    request_service_health,
+    resolve_service_socket,
+    serve,
+)
+from ..reporting.screenshots import warm_chromedriver_cache
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Macro Pulse screenshot service")
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="Unix socket path. Defaults to SCREENSHOT_SERVICE_SOCKET.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Keep a warm browser and serve capture requests"
+    )
+    serve_parser.add_argument(
+        "--profile-dir",
+        default=DEFAULT_SERVICE_PROFILE_DIR,
+        help="Persistent Chrome profile holding the disk cache.",
+    )
+    serve_parser.add_argument(
+        "--max-rss-mb",
+        type=int,
+        default=DEFAULT_SERVICE_MAX_RSS_MB,
+        help="Restart the browser once its process tree exceeds this RSS.",
+    )
+    serve_parser.add_argument(
+        "--max-captures",
+        type=int,
+        default=DEFAULT_SERVICE_MAX_CAPTURES,
+        help="Restart the browser after this many captures.",
+    )
+
+    subparsers.add_parser("health", help="Print the running service's health")
+    subparsers.add_parser(
+        "warm-driver", help="Resolve chromedriver once and cache the result"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "warm-driver":
+        configure_logging()
+        print(warm_chromedriver_cache())
+        return 0
+
+    socket_path = resolve_service_socket(args.socket)
+    if not socket_path:
+        raise SystemExit("Set --socket or SCREENSHOT_SERVICE_SOCKET.")
+
+    if args.command == "serve":
+        configure_logging()
+        serve(
+            socket_path,
+            WarmBrowser(
+                profile_dir=args.profile_dir,
+                max_rss_bytes=args.max_rss_mb * 1024 * 1024,
+                max_captures=args.max_captures,
+            ),
+        )
+    elif args.command == "health":
+        health = request_service_health(socket_path)
+        print(json.dumps(health, indent=2))
+        return 0 if health.get("status") == "ok" else 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,7 +3,11 @@ import os
 from functools import lru_cache
 
 from ..core.paths import resolve_project_path
-from ..domain.models import ReportFormatConfig, normalize_report_format_config
+from ..domain.models import (
+    ReportFormatConfig,
+    ScreenshotTargetConfig,
+    normalize_report_format_config,
+)
 
 
 DEFAULT_REPORT_FORMAT_CONFIG = "config/report_formats.json"
@@ -47,3 +51,14 @@ def get_screenshot_targets(mode, format_config=None):
 
 def get_workflow_schedule(mode, format_config=None):
     return get_mode_format(mode, format_config).workflow_schedule
+
+
+def get_summary_card_config(mode, format_config=None):
+    return get_mode_format(mode, format_config).summary_card
+
+
+def get_screenshot_target_config(target, format_config=None):
+    config = normalize_report_format_config(
+        format_config or load_report_format_config()
+    )
+    return config.screenshot_targets.get(target, ScreenshotTargetConfig())
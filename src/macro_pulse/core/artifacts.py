@@ -1,4 +1,9 @@
+import gzip
+import json
+import os
+import shutil
 import tempfile
+from datetime import datetime, timezone
 from pathlib import Path
 
 from .logging import get_logger
@@ -6,6 +11,13 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_REPORT_SIZE_BUDGET_BYTES = 2_000_000
+DEFAULT_REPORT_SIZE_LOG_MAX_ENTRIES = 1000
+COMPRESSION_FORMATS = ("gz",)
+MAX_COMPRESSION_LEVELS = {"gz": 9}
+
+_COPY_CHUNK_SIZE = 64 * 1024
+
 
 def create_temp_png_path(prefix: str) -> str:
     with tempfile.NamedTemporaryFile(
@@ -29,3 +41,102 @@ def cleanup_files(file_paths) -> None:
         if path.exists():
             path.unlink()
             logger.info("Removed temporary file: %s", path)
+
+
+def resolve_report_size_budget(budget_bytes: int | None = None) -> int:
+    if budget_bytes is not None:
+        return budget_bytes
+    return int(
+        os.environ.get("REPORT_SIZE_BUDGET_BYTES", DEFAULT_REPORT_SIZE_BUDGET_BYTES)
+    )
+
+
+def check_size_budget(file_path, budget_bytes: int | None = None) -> bool:
+    budget = resolve_report_size_budget(budget_bytes)
+    size = Path(file_path).stat().st_size
+    if budget > 0 and size > budget:
+        logger.warning(
+            "%s is %s bytes, over the %s byte budget", file_path, size, budget
+        )
+        return False
+    logger.info("%s is %s bytes (budget %s bytes)", file_path, size, budget)
+    return True
+
+
+def write_compressed_siblings(
+    file_path, formats=COMPRESSION_FORMATS, level: int | None = None
+) -> dict[str, int]:
+    source = Path(file_path)
+    sizes = {}
+    for compression_format in formats:
+        if compression_format not in MAX_COMPRESSION_LEVELS:
+            raise ValueError(f"Unsupported compression format: {compression_format}")
+
+        max_level = MAX_COMPRESSION_LEVELS[compression_format]
+        resolved_level = max_level if level is None else min(max(level, 0), max_level)
+        target = source.with_name(f"{source.name}.{compression_format}")
+
+        with (
+            source.open("rb") as source_handle,
+            gzip.open(target, "wb", compresslevel=resolved_level) as handle,
+        ):
+            shutil.copyfileobj(source_handle, handle, _COPY_CHUNK_SIZE)
+
+        sizes[compression_format] = target.stat().st_size
+        logger.info(
+            "Compressed %s to %s (%s bytes)", source, target, sizes[compression_format]
+        )
+    return sizes
+
+
+def resolve_report_size_log(file_path, log_path=None) -> Path | None:
+    """Return the size log path, or ``None`` when size logging is off.
+
+    Logging is opt-in through ``REPORT_SIZE_LOG``; relative paths are placed
+    next to the report artifact.
+    """
+    log_path = log_path or os.environ.get("REPORT_SIZE_LOG")
+    if not log_path:
+        return None
+    return Path(file_path).parent / log_path
+
+
+def record_report_sizes(file_path, compressed_sizes, log_path=None) -> dict:
+    entry = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "path": str(file_path),
+        "raw_bytes": Path(file_path).stat().st_size,
+        **{
+            f"{compression_format}_bytes": size
+            for compression_format, size in compressed_sizes.items()
+        },
+    }
+    resolved_log = resolve_report_size_log(file_path, log_path)
+    if resolved_log is None:
+        return entry
+
+    max_entries = int(
+        os.environ.get(
+            "REPORT_SIZE_LOG_MAX_ENTRIES", DEFAULT_REPORT_SIZE_LOG_MAX_ENTRIES
+        )
+    )
+    lines = []
+    if resolved_log.exists():
+        lines = resolved_log.read_text(encoding="utf-8").splitlines()
+    lines.append(json.dumps(entry))
+    resolved_log.parent.mkdir(parents=True, exist_ok=True)
+    resolved_log.write_text("\n".join(lines[-max_entries:]) + "\n", encoding="utf-8")
+    return entry
+
+
+def finalize_report_artifact(
+    file_path,
+    compression_formats=(),
+    compression_level: int | None = None,
+    budget_bytes: int | None = None,
+) -> dict:
+    check_size_budget(file_path, budget_bytes)
+    compressed_sizes = write_compressed_siblings(
+        file_path, compression_formats, compression_level
+    )
+    return record_report_sizes(file_path, compressed_sizes)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 
@@ -10,3 +11,13 @@ PROJECT_ROOT = Path(__file__).resolve().parents[3]
 def resolve_project_path(path: str | Path) -> Path:
     candidate = Path(path)
     return candidate if candidate.is_absolute() else PROJECT_ROOT / candidate
+
+
+def resolve_user_cache_path(name: str) -> Path:
+    """Return ``name`` inside this user's cache directory.
+
+    Caches must not default to a shared temp directory: another local user
+    could create the file first and control what the next run loads.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "macro-pulse" / name
@@ -159,39 +159,18 @@ def _append_yahoo_snapshots(results: ReportDataset) -> None:
 
 
 def _reorder_bond_snapshots(commodities_rates) -> None:
-    us_10y_index = next(
-        (
-            index
-            for index, item in enumerate(commodities_rates)
-            if item.name == "US 10Y Treasury"
-        ),
-        None,
-    )
-    korea_10y_index = next(
-        (
-            index
-            for index, item in enumerate(commodities_rates)
-            if item.name == "Korea 10Y Treasury"
-        ),
-        None,
-    )
+    positions: dict[str, int] = {}
+    for index, item in enumerate(commodities_rates):
+        positions.setdefault(item.name, index)
 
+    us_10y_index = positions.get("US 10Y Treasury")
+    korea_10y_index = positions.get("Korea 10Y Treasury")
     if us_10y_index is None or korea_10y_index is None:
         return
 
     us_10y_snapshot = commodities_rates.pop(us_10y_index)
-    korea_10y_index = next(
-        (
-            index
-            for index, item in enumerate(commodities_rates)
-            if item.name == "Korea 10Y Treasury"
-        ),
-        None,
-    )
-    if korea_10y_index is None:
-        commodities_rates.append(us_10y_snapshot)
-        return
-
+    if korea_10y_index > us_10y_index:
+        korea_10y_index -= 1
     commodities_rates.insert(korea_10y_index + 1, us_10y_snapshot)
 
 
@@ -0,0 +1,216 @@
+"""Deliver one report to many Telegram chats under rate limits.
+
+The first recipient uploads every image; the rest reuse the returned
+``file_id`` values, so each image crosses the network once per run.
+"""
+
+import os
+import time
+from asyncio import Lock, Semaphore, gather, sleep
+
+from ..core.logging import get_logger
+from ..domain.models import RecipientDelivery
+from .notifier import send_telegram_report
+
+
+logger = get_logger(__name__)
+
+# Bot API guidance: about 30 messages per second overall and about one per
+# second in a single chat, with short bursts tolerated.
+DEFAULT_TELEGRAM_GLOBAL_RATE = 25.0
+DEFAULT_TELEGRAM_CHAT_RATE = 1.0
+DEFAULT_TELEGRAM_CHAT_BURST = 3
+DEFAULT_TELEGRAM_FANOUT_CONCURRENCY = 8
+
+
+def resolve_telegram_chat_ids(value=None) -> list[str]:
+    """Split a comma-separated ``TELEGRAM_CHAT_ID`` into unique chat IDs."""
+    value = value if value is not None else os.environ.get("TELEGRAM_CHAT_ID", "")
+    chat_ids = []
+    for chat_id in value.split(","):
+        chat_id = chat_id.strip()
+        if chat_id and chat_id not in chat_ids:
+            chat_ids.append(chat_id)
+    return chat_ids
+
+
+class TokenBucket:
+    """Allow ``rate`` acquisitions per second with bursts up to ``capacity``."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = Lock()
+
+    def pause(self, seconds):
+        """Hand out nothing for ``seconds``, then refill from empty."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await sleep(self._paused_until - now)
+                    self._tokens = 0.0
+                    self._updated_at = time.monotonic()
+                    continue
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await sleep((1 - self._tokens) / self.rate)
+
+
+class TelegramRateLimiter:
+    """Global and per-chat token buckets, awaited before every API call."""
+
+    def __init__(
+        self,
+        global_rate=DEFAULT_TELEGRAM_GLOBAL_RATE,
+        chat_rate=DEFAULT_TELEGRAM_CHAT_RATE,
+        chat_burst=DEFAULT_TELEGRAM_CHAT_BURST,
+    ):
+        self.global_bucket = TokenBucket(global_rate)
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self._chat_buckets = {}
+
+    @classmethod
+    def from_environment(cls):
+        return cls(
+            global_rate=float(
+                os.environ.get("TELEGRAM_GLOBAL_RATE", DEFAULT_TELEGRAM_GLOBAL_RATE)
+            ),
+            chat_rate=float(
+                os.environ.get("TELEGRAM_CHAT_RATE", DEFAULT_TELEGRAM_CHAT_RATE)
+            ),
+            chat_burst=int(
+                os.environ.get("TELEGRAM_CHAT_BURST", DEFAULT_TELEGRAM_CHAT_BURST)
+            ),
+        )
+
+    async def __call__(self, chat_id):
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(
+                self.chat_rate, self.chat_burst
+            )
+        # Wait on the chat first so a slow chat does not hold a global token.
+        await bucket.acquire()
+        await self.global_bucket.acquire()
+
+    def pause(self, seconds):
+        """Stop every chat for ``seconds`` after Telegram's flood control."""
+        logger.warning("Telegram flood control: pausing all sends for %.1fs", seconds)
+        self.global_bucket.pause(seconds)
+
+
+def resolve_fanout_concurrency(concurrency=None) -> int:
+    if concurrency is None:
+        concurrency = int(
+            os.environ.get(
+                "TELEGRAM_FANOUT_CONCURRENCY", DEFAULT_TELEGRAM_FANOUT_CONCURRENCY
+            )
+        )
+    return max(1, concurrency)
+
+
+async def fan_out_telegram_report(
+    token,
+    chat_ids,
+    message_text,
+    images=None,
+    delivery_mode=None,
+    rate_limiter=None,
+    concurrency=None,
+    attempts=2,
+    media_cache=None,
+):
+    """Send the report to every chat and return one ``RecipientDelivery`` each.
+
+    Recipients are served in order until one accepts the uploads; its
+    ``file_id`` values then replace the image bytes for everyone else, who
+    are sent to concurrently. ``media_cache`` lets even that first send skip
+    images uploaded by an earlier run.
+    """
+    rate_limiter = rate_limiter or TelegramRateLimiter.from_environment()
+    semaphore = Semaphore(resolve_fanout_concurrency(concurrency))
+    images = list(images or [])
+    started_at = time.monotonic()
+
+    async def deliver(chat_id, photos, file_ids=None, media_cache=None):
+        async with semaphore:
+            timings, journal = {}, {}
+            chat_started_at = time.monotonic()
+            error = None
+            try:
+                delivered = await send_telegram_report(
+                    token,
+                    chat_id,
+                    message_text,
+                    images=photos,
+                    attempts=attempts,
+                    delivery_mode=delivery_mode,
+                    timings=timings,
+                    journal=journal,
+                    file_ids=file_ids,
+                    throttle=rate_limiter,
+                    media_cache=media_cache,
+                )
+            except Exception as exc:
+                logger.exception("Telegram delivery to %s failed: %s", chat_id, exc)
+                delivered, error = False, str(exc)
+            return RecipientDelivery(
+                chat_id=chat_id,
+                delivered=delivered,
+                seconds=time.monotonic() - chat_started_at,
+                timings=timings,
+                parts=journal,
+                error=error,
+            )
+
+    reports = []
+    remaining = list(chat_ids)
+    photos = images
+    while images and remaining:
+        file_ids = {}
+        reports.append(await deliver(remaining.pop(0), images, file_ids, media_cache))
+        if reports[-1].delivered:
+            photos = [
+                file_ids.get(position, image) for position, image in enumerate(images)
+            ]
+            break
+
+    reports.extend(await gather(*(deliver(chat_id, photos) for chat_id in remaining)))
+    log_fanout_summary(reports, time.monotonic() - started_at)
+    return reports
+
+
+def log_fanout_summary(reports, elapsed):
+    delivered = [report for report in reports if report.delivered]
+    calls = sum(report.calls for report in reports)
+    logger.info(
+        "Telegram fan-out delivered to %s/%s chats in %.2fs (%s calls, %.1f calls/s)",
+        len(delivered),
+        len(reports),
+        elapsed,
+        calls,
+        calls / elapsed if elapsed > 0 else 0.0,
+    )
+    for report in reports:
+        if not report.delivered:
+            logger.warning(
+                "Telegram delivery to %s failed after %s calls (%s part(s) sent)%s",
+                report.chat_id,
+                report.calls,
+                len(report.parts),
+                f": {report.error}" if report.error else "",
+            )
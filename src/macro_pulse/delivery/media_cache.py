@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from ..core.logging import get_logger
+from ..core.paths import resolve_user_cache_path
+
+
+logger = get_logger(__name__)
+
+MEDIA_CACHE_VERSION = 1
+DEFAULT_MEDIA_CACHE_TTL_HOURS = 168
+
+
+def resolve_media_cache_path(cache_path=None) -> Path:
+    """Return the cache file; it must outlive the run to save any uploads.
+
+    Defaults to the user cache directory. Ephemeral containers should point
+    ``TELEGRAM_MEDIA_CACHE_PATH`` at persisted storage.
+    """
+    return Path(
+        cache_path
+        or os.environ.get("TELEGRAM_MEDIA_CACHE_PATH")
+        or resolve_user_cache_path("telegram-media.json")
+    )
+
+
+def resolve_media_cache_ttl(ttl_hours=None) -> float:
+    if ttl_hours is None:
+        ttl_hours = float(
+            os.environ.get(
+                "TELEGRAM_MEDIA_CACHE_TTL_HOURS", DEFAULT_MEDIA_CACHE_TTL_HOURS
+            )
+        )
+    return ttl_hours
+
+
+def media_cache_key(token, data: bytes) -> str:
+    """Key an image by its bot and content; a ``file_id`` only works for its bot.
+
+    Only the bot ID before the token's colon is kept, never the secret.
+    """
+    bot_id = str(token).split(":", 1)[0]
+    return f"{bot_id}:{hashlib.sha256(data).hexdigest()}"
+
+
+def load_media_cache(cache_path=None, ttl_hours=None, now=None) -> dict[str, dict]:
+    """Return the unexpired ``{key: {"file_id", "uploaded_at"}}`` entries.
+
+    A TTL of zero or less disables the cache.
+    """
+    ttl_hours = resolve_media_cache_ttl(ttl_hours)
+    path = resolve_media_cache_path(cache_path)
+    if ttl_hours <= 0 or not path.exists():
+        return {}
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable Telegram media cache %s: %s", path, exc)
+        return {}
+    if payload.get("version") != MEDIA_CACHE_VERSION:
+        return {}
+
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(hours=ttl_hours)
+    entries = {}
+    for key, entry in payload.get("media", {}).items():
+        try:
+            uploaded_at = datetime.fromisoformat(entry["uploaded_at"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if uploaded_at > cutoff and entry.get("file_id"):
+            entries[key] = entry
+    return entries
+
+
+def save_media_cache(cache: dict[str, dict], cache_path=None) -> Path:
+    path = resolve_media_cache_path(cache_path)
+    payload = {"version": MEDIA_CACHE_VERSION, "media": cache}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    temp_path.write_text(json.dumps(payload), encoding="utf-8")
+    temp_path.replace(path)
+    return path
+
+
+def cached_file_ids(cache, token, photos):
+    """Return ``photos`` with every cached image replaced by its ``file_id``."""
+    resolved = []
+    for photo in photos:
+        entry = (
+            cache.get(media_cache_key(token, photo))
+            if isinstance(photo, bytes)
+            else None
+        )
+        resolved.append(entry["file_id"] if entry else photo)
+    reused = sum(
+        isinstance(photo, bytes) and not isinstance(sent, bytes)
+        for photo, sent in zip(photos, resolved, strict=True)
+    )
+    if reused:
+        logger.info("Reusing %s cached Telegram file_id(s)", reused)
+    return resolved
+
+
+def record_file_ids(cache, token, photos, file_ids, now=None) -> int:
+    """Remember the ``file_id`` Telegram returned for each newly uploaded image.
+
+    Entries already cached keep their original upload time, so an image
+    expires a fixed time after it was first uploaded.
+    """
+    uploaded_at = (now or datetime.now(timezone.utc)).isoformat()
+    recorded = 0
+    for position, file_id in file_ids.items():
+        photo = photos[position] if position < len(photos) else None
+        if not isinstance(photo, bytes):
+            continue
+        key = media_cache_key(token, photo)
+        if key not in cache:
+            cache[key] = {"file_id": file_id, "uploaded_at": uploaded_at}
+            recorded += 1
+    return recorded
+
+
+def forget_file_ids(cache, token, photos) -> None:
+    for photo in photos:
+        if isinstance(photo, bytes):
+            cache.pop(media_cache_key(token, photo), None)
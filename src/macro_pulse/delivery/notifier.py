@@ -1,13 +1,97 @@
 import os
-from asyncio import sleep
+import time
+import warnings
+from asyncio import get_running_loop, sleep
+from datetime import timedelta
 
-from telegram import Bot
+from telegram import Bot, InputMediaPhoto
+from telegram.error import BadRequest, RetryAfter
+from telegram.request import HTTPXRequest
 
 from ..core.logging import get_logger
+from .media_cache import cached_file_ids, forget_file_ids, record_file_ids
 
 
 logger = get_logger(__name__)
 
+TELEGRAM_DELIVERY_MODES = ("photos", "media_group")
+DEFAULT_TELEGRAM_DELIVERY_MODE = "photos"
+# Bot API limits for sendMediaGroup and photo captions.
+MEDIA_GROUP_MAX_ITEMS = 10
+CAPTION_MAX_LENGTH = 1024
+TELEGRAM_RETRY_BASE_DELAY = 1.0
+TELEGRAM_RETRY_MAX_DELAY = 60.0
+
+# Pool and timeout defaults for the shared HTTP transport, in seconds. Uploads
+# get a longer write timeout than plain API calls.
+TELEGRAM_REQUEST_DEFAULTS = {
+    "connection_pool_size": ("TELEGRAM_POOL_SIZE", 8),
+    "connect_timeout": ("TELEGRAM_CONNECT_TIMEOUT", 5.0),
+    "read_timeout": ("TELEGRAM_READ_TIMEOUT", 10.0),
+    "write_timeout": ("TELEGRAM_WRITE_TIMEOUT", 10.0),
+    "media_write_timeout": ("TELEGRAM_MEDIA_WRITE_TIMEOUT", 60.0),
+    "pool_timeout": ("TELEGRAM_POOL_TIMEOUT", 10.0),
+}
+
+# One initialized Bot per token, reused by every call and retry in the
+# process. Each entry remembers its event loop because the HTTP pool cannot
+# outlive it.
+_bots = {}
+
+
+def resolve_telegram_delivery_mode(mode=None):
+    mode = (
+        mode
+        or os.environ.get("TELEGRAM_DELIVERY_MODE")
+        or DEFAULT_TELEGRAM_DELIVERY_MODE
+    ).lower()
+    if mode not in TELEGRAM_DELIVERY_MODES:
+        raise ValueError(f"Unsupported Telegram delivery mode: {mode}")
+    return mode
+
+
+def resolve_telegram_request_settings():
+    settings = {}
+    for name, (env_name, default) in TELEGRAM_REQUEST_DEFAULTS.items():
+        value = os.environ.get(env_name)
+        settings[name] = type(default)(value) if value else default
+    return settings
+
+
+async def get_telegram_bot(token):
+    """Return the process-wide Bot for ``token``, creating it on first use."""
+    loop = get_running_loop()
+    entry = _bots.get(token)
+    if entry is not None and entry[1] is not loop:
+        # The loop that owned this pool is gone; its connections went with it.
+        _bots.pop(token)
+        entry = None
+
+    if entry is None:
+        settings = resolve_telegram_request_settings()
+        bot = Bot(token=token, request=HTTPXRequest(**settings))
+        logger.info(
+            "Created Telegram client (pool size %s)", settings["connection_pool_size"]
+        )
+        _bots[token] = entry = (bot, loop)
+
+    bot = entry[0]
+    await bot.initialize()
+    return bot
+
+
+async def close_telegram_bots():
+    """Shut down every cached Bot created on the running event loop."""
+    loop = get_running_loop()
+    for token, (bot, bot_loop) in list(_bots.items()):
+        _bots.pop(token)
+        if bot_loop is not loop:
+            continue
+        try:
+            await bot.shutdown()
+        except Exception as exc:
+            logger.warning("Failed to close Telegram client: %s", exc)
+
 
 async def send_telegram_report(
     token,
@@ -16,35 +100,253 @@ async def send_telegram_report(
     image_path=None,
     image_paths=None,
     attempts=2,
+    images=None,
+    delivery_mode=None,
+    timings=None,
+    journal=None,
+    file_ids=None,
+    throttle=None,
+    media_cache=None,
 ):
+    """Send the summary and images, resuming only the parts that failed.
+
+    ``photos`` mode sends the summary and then one message per image.
+    ``media_group`` mode sends the images as albums with the summary as the
+    caption, or as a preceding message when it is too long for a caption.
+
+    ``journal`` maps each delivered part (``send_message``, ``send_photo[1]``,
+    ``send_media_group[1]``...) to its Telegram message IDs; parts already in
+    it are never sent again. ``timings`` receives each call's latency.
+
+    ``file_ids`` receives the Telegram ``file_id`` of each uploaded photo by
+    its position (paths first, then ``images``); passing those IDs back as
+    ``images`` sends the same photos without uploading them again.
+    ``throttle``, when given, is awaited with ``chat_id`` before every call;
+    if it has a ``pause(seconds)`` method it is told about flood-control waits.
+    ``media_cache`` (see ``media_cache.load_media_cache``) swaps in known
+    ``file_id`` values before sending and learns new ones after uploading.
+    """
     if not token or not chat_id:
         logger.info("Telegram token or chat_id missing. Skipping Telegram.")
         return False
 
-    photo_paths = list(image_paths or [])
-    if image_path and not photo_paths:
-        photo_paths.append(image_path)
+    delivery_mode = resolve_telegram_delivery_mode(delivery_mode)
+    timings = {} if timings is None else timings
+    journal = {} if journal is None else journal
+    file_ids = {} if file_ids is None else file_ids
+
+    photo_paths = [
+        path
+        for path in list(image_paths or []) or [image_path]
+        if path and os.path.exists(path)
+    ]
+    photos = _read_photos(photo_paths) + list(images or [])
+    plan = _plan_media_groups if delivery_mode == "media_group" else _plan_photos
+    sent_photos = photos
+    if media_cache is not None:
+        sent_photos = cached_file_ids(media_cache, token, photos)
+    parts = plan(chat_id, message_text, sent_photos)
 
     for attempt in range(1, attempts + 1):
         try:
-            bot = Bot(token=token)
-            await bot.send_message(chat_id=chat_id, text=message_text)
-
-            for photo_path in photo_paths:
-                if photo_path and os.path.exists(photo_path):
-                    with open(photo_path, "rb") as image_handle:
-                        await bot.send_photo(chat_id=chat_id, photo=image_handle)
-                    logger.info("Telegram photo sent: %s", photo_path)
-
+            bot = await get_telegram_bot(token)
+            for part in parts:
+                if part[0] not in journal:
+                    await _deliver_part(
+                        bot, chat_id, part, journal, timings, file_ids, throttle
+                    )
+            logger.info(
+                "Telegram report sent in %s calls (%.2fs total call time)",
+                len(timings),
+                sum(timings.values()),
+            )
+            _record_media_cache(media_cache, token, photos, file_ids)
             return True
         except Exception as exc:
+            if sent_photos != photos and _is_file_reference_error(exc):
+                # A cached file_id can stop working; upload the bytes instead.
+                logger.warning("Telegram rejected a cached file_id; re-uploading")
+                forget_file_ids(media_cache, token, photos)
+                sent_photos = photos
+                parts = plan(chat_id, message_text, photos)
+            remaining = sum(label not in journal for label, *_ in parts)
             logger.warning(
-                "Failed to send Telegram message (attempt %s/%s): %s",
+                "Failed to send Telegram message (attempt %s/%s, %s part(s) left): %s",
                 attempt,
                 attempts,
+                remaining,
                 exc,
             )
             if attempt == attempts:
                 logger.exception("Telegram delivery failed after retries")
+                _record_media_cache(media_cache, token, photos, file_ids)
                 return False
-            await sleep(1)
+            await sleep(telegram_retry_delay(exc, attempt))
+
+
+# Fragments of the BadRequest messages Telegram returns for unusable file_ids.
+_FILE_REFERENCE_ERRORS = (
+    "wrong file identifier",
+    "wrong remote file identifier",
+    "wrong file_id",
+    "file reference expired",
+)
+
+
+def _is_file_reference_error(exc):
+    message = str(exc).lower()
+    return isinstance(exc, BadRequest) and any(
+        fragment in message for fragment in _FILE_REFERENCE_ERRORS
+    )
+
+
+def _record_media_cache(media_cache, token, photos, file_ids):
+    if media_cache is not None:
+        record_file_ids(media_cache, token, photos, file_ids)
+
+
+def telegram_retry_delay(exc, attempt):
+    """Seconds to wait before retry ``attempt + 1``.
+
+    Flood-control errors carry the wait Telegram asks for; anything else backs
+    off exponentially.
+    """
+    if isinstance(exc, RetryAfter):
+        with warnings.catch_warnings():
+            # PTB warns that ``retry_after`` will become a timedelta.
+            warnings.simplefilter("ignore")
+            retry_after = exc.retry_after
+        if isinstance(retry_after, timedelta):
+            retry_after = retry_after.total_seconds()
+        return float(retry_after)
+    return min(TELEGRAM_RETRY_BASE_DELAY * 2 ** (attempt - 1), TELEGRAM_RETRY_MAX_DELAY)
+
+
+def _plan_photos(chat_id, message_text, photos):
+    """The summary, then one part per image."""
+
+    def send_photo(photo):
+        async def send(bot):
+            message = await bot.send_photo(chat_id=chat_id, photo=photo)
+            if isinstance(photo, str):
+                logger.info("Telegram photo sent by file_id")
+            else:
+                logger.info("Telegram photo sent (%s bytes)", len(photo))
+            return message
+
+        return send
+
+    return [
+        _message_part(chat_id, message_text),
+        *(
+            (f"send_photo[{index}]", index - 1, send_photo(photo))
+            for index, photo in enumerate(photos, start=1)
+        ),
+    ]
+
+
+def _plan_media_groups(chat_id, message_text, photos):
+    parts = []
+    caption = message_text if len(message_text) <= CAPTION_MAX_LENGTH else None
+    if caption is None or not photos:
+        parts.append(_message_part(chat_id, message_text))
+        caption = None
+
+    # Albums go out one after another: Telegram does not keep the order of
+    # concurrent sends, and they would only add to the chat's call rate.
+    for index, start in enumerate(
+        range(0, len(photos), MEDIA_GROUP_MAX_ITEMS), start=1
+    ):
+        parts.append(
+            _album_part(
+                chat_id,
+                photos[start : start + MEDIA_GROUP_MAX_ITEMS],
+                index,
+                start,
+                caption if index == 1 else None,
+            )
+        )
+    return parts
+
+
+def _album_part(chat_id, photos, index, position, caption=None):
+    # sendMediaGroup needs at least two items.
+    if len(photos) == 1:
+
+        async def send_single(bot):
+            return await bot.send_photo(
+                chat_id=chat_id, photo=photos[0], caption=caption
+            )
+
+        return f"send_photo[{index}]", position, send_single
+
+    async def send_album(bot):
+        media = [
+            InputMediaPhoto(media=photo, caption=caption if offset == 0 else None)
+            for offset, photo in enumerate(photos)
+        ]
+        messages = await bot.send_media_group(chat_id=chat_id, media=media)
+        logger.info("Telegram sent %s photos as media group %s", len(photos), index)
+        return messages
+
+    return f"send_media_group[{index}]", position, send_album
+
+
+def _message_part(chat_id, message_text):
+    async def send(bot):
+        return await bot.send_message(chat_id=chat_id, text=message_text)
+
+    return "send_message", None, send
+
+
+async def _deliver_part(bot, chat_id, part, journal, timings, file_ids, throttle):
+    """Send one part and journal its message IDs and uploaded ``file_id`` values.
+
+    A part is ``(label, position, send)``; ``position`` is the index of its
+    first photo, or ``None`` for the text message.
+    """
+    label, position, send = part
+    if throttle is not None:
+        await throttle(chat_id)
+    try:
+        outcome = await _timed(timings, label, send(bot))
+    except RetryAfter as exc:
+        # Flood control applies to the whole bot, not just this chat.
+        pause = getattr(throttle, "pause", None)
+        if pause is not None:
+            pause(telegram_retry_delay(exc, 1))
+        raise
+
+    messages = outcome if isinstance(outcome, (list, tuple)) else [outcome]
+    journal[label] = [getattr(message, "message_id", None) for message in messages]
+    if position is not None:
+        for offset, message in enumerate(messages):
+            file_id = _photo_file_id(message)
+            if file_id:
+                file_ids[position + offset] = file_id
+
+
+def _photo_file_id(message):
+    # ``Message.photo`` lists the stored sizes, smallest first.
+    sizes = getattr(message, "photo", None)
+    if not isinstance(sizes, (list, tuple)) or not sizes:
+        return None
+    file_id = getattr(sizes[-1], "file_id", None)
+    return file_id if isinstance(file_id, str) else None
+
+
+async def _timed(timings, label, call):
+    started_at = time.monotonic()
+    try:
+        return await call
+    finally:
+        timings[label] = time.monotonic() - started_at
+        logger.info("Telegram %s took %.2fs", label, timings[label])
+
+
+def _read_photos(photo_paths):
+    photos = []
+    for photo_path in photo_paths:
+        with open(photo_path, "rb") as image_handle:
+            photos.append(image_handle.read())
+    return photos
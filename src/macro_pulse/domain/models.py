@@ -107,6 +107,37 @@ class RenderedAssetSnapshot:
     change_pct_str: str
     color_class: str
     sparkline: str
+    sparkline_offset: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ScreenshotResult:
+    target: str
+    path: str | None = None
+    png: bytes | None = None
+    waits: dict[str, float] = field(default_factory=dict)
+    network: dict[str, int] = field(default_factory=dict)
+    image_hash: str | None = None
+    unchanged: bool = False
+    image_bytes: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def waited(self) -> float:
+        return sum(self.waits.values())
+
+
+@dataclass(slots=True, frozen=True)
+class RecipientDelivery:
+    chat_id: str
+    delivered: bool
+    seconds: float
+    timings: dict[str, float] = field(default_factory=dict)
+    parts: dict[str, list[int]] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def calls(self) -> int:
+        return len(self.timings)
 
 
 @dataclass(slots=True, frozen=True)
@@ -141,12 +172,37 @@ class WorkflowScheduleConfig:
         )
 
 
+@dataclass(slots=True, frozen=True)
+class SummaryCardConfig:
+    enabled: bool = False
+    width: int = 1080
+    show_sparklines: bool = True
+    font_family: list[str] = field(
+        default_factory=lambda: ["DejaVu Sans", "NanumGothic"]
+    )
+
+    @classmethod
+    def from_mapping(cls, raw_card: Mapping[str, Any]) -> "SummaryCardConfig":
+        defaults = cls()
+        return cls(
+            enabled=bool(raw_card.get("enabled", defaults.enabled)),
+            width=int(raw_card.get("width", defaults.width)),
+            show_sparklines=bool(
+                raw_card.get("show_sparklines", defaults.show_sparklines)
+            ),
+            font_family=[
+                str(font) for font in raw_card.get("font_family", defaults.font_family)
+            ],
+        )
+
+
 @dataclass(slots=True, frozen=True)
 class ModeFormatConfig:
     description: str = ""
     summary_sections: list[SummarySectionConfig] = field(default_factory=list)
     screenshot_targets: list[str] = field(default_factory=list)
     workflow_schedule: WorkflowScheduleConfig | None = None
+    summary_card: SummaryCardConfig | None = None
 
     @classmethod
     def from_mapping(cls, raw_mode: Mapping[str, Any]) -> "ModeFormatConfig":
@@ -164,12 +220,95 @@ class ModeFormatConfig:
                 if raw_mode.get("workflow_schedule")
                 else None
             ),
+            summary_card=(
+                SummaryCardConfig.from_mapping(raw_mode["summary_card"])
+                if raw_mode.get("summary_card")
+                else None
+            ),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class MarketMapConstituent:
+    name: str
+    sector: str
+    market_cap: float
+    change_pct: float | None = None
+
+    @classmethod
+    def from_mapping(cls, raw_item: Mapping[str, Any]) -> "MarketMapConstituent":
+        change_pct = raw_item.get("change_pct")
+        return cls(
+            name=str(raw_item["name"]),
+            sector=str(raw_item.get("sector") or "기타"),
+            market_cap=float(raw_item["market_cap"]),
+            change_pct=None if change_pct is None else float(change_pct),
+        )
+
+
+SCREENSHOT_IMAGE_FORMATS = ("png", "webp", "jpeg")
+
+
+@dataclass(slots=True, frozen=True)
+class ScreenshotPostprocessConfig:
+    enabled: bool = False
+    trim_borders: bool = True
+    border_tolerance: int = 8
+    max_width: int | None = None
+    image_format: str = "png"
+    palette_colors: int | None = None
+    quality: int = 85
+
+    @classmethod
+    def from_mapping(
+        cls, raw_postprocess: Mapping[str, Any]
+    ) -> "ScreenshotPostprocessConfig":
+        defaults = cls()
+        image_format = str(raw_postprocess.get("format", defaults.image_format)).lower()
+        if image_format not in SCREENSHOT_IMAGE_FORMATS:
+            raise ValueError(f"Unsupported screenshot image format: {image_format}")
+        max_width = raw_postprocess.get("max_width", defaults.max_width)
+        palette_colors = raw_postprocess.get("palette_colors", defaults.palette_colors)
+        return cls(
+            enabled=bool(raw_postprocess.get("enabled", defaults.enabled)),
+            trim_borders=bool(
+                raw_postprocess.get("trim_borders", defaults.trim_borders)
+            ),
+            border_tolerance=int(
+                raw_postprocess.get("border_tolerance", defaults.border_tolerance)
+            ),
+            max_width=int(max_width) if max_width else None,
+            image_format=image_format,
+            palette_colors=int(palette_colors) if palette_colors else None,
+            quality=int(raw_postprocess.get("quality", defaults.quality)),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ScreenshotTargetConfig:
+    blocked_url_patterns: list[str] = field(default_factory=list)
+    allowed_hosts: list[str] = field(default_factory=list)
+    postprocess: ScreenshotPostprocessConfig = field(
+        default_factory=ScreenshotPostprocessConfig
+    )
+
+    @classmethod
+    def from_mapping(cls, raw_target: Mapping[str, Any]) -> "ScreenshotTargetConfig":
+        return cls(
+            blocked_url_patterns=[
+                str(pattern) for pattern in raw_target.get("blocked_url_patterns", [])
+            ],
+            allowed_hosts=[str(host) for host in raw_target.get("allowed_hosts", [])],
+            postprocess=ScreenshotPostprocessConfig.from_mapping(
+                raw_target.get("postprocess", {})
+            ),
         )
 
 
 @dataclass(slots=True, frozen=True)
 class ReportFormatConfig:
     modes: dict[str, ModeFormatConfig]
+    screenshot_targets: dict[str, ScreenshotTargetConfig] = field(default_factory=dict)
 
     @classmethod
     def from_mapping(cls, raw_config: Mapping[str, Any]) -> "ReportFormatConfig":
@@ -180,12 +319,53 @@ class ReportFormatConfig:
         }
         if not modes:
             raise ValueError("Report format config must define at least one mode.")
-        return cls(modes=modes)
+        screenshot_targets = {
+            str(target): ScreenshotTargetConfig.from_mapping(target_config)
+            for target, target_config in raw_config.get(
+                "screenshot_targets", {}
+            ).items()
+        }
+        return cls(modes=modes, screenshot_targets=screenshot_targets)
 
 
 ReportDataset = dict[str, list[AssetSnapshot]]
 
 
+@dataclass(slots=True, frozen=True)
+class IndexedDataset:
+    categories: ReportDataset
+    by_name: dict[tuple[str, str], AssetSnapshot] = field(default_factory=dict)
+    by_ticker: dict[str, AssetSnapshot] = field(default_factory=dict)
+
+    def lookup(self, category: str, name: str) -> AssetSnapshot | None:
+        return self.by_name.get((category, name))
+
+    def lookup_ticker(self, ticker: str) -> AssetSnapshot | None:
+        return self.by_ticker.get(ticker)
+
+    def select(self, category: str, names: Sequence[str]) -> list[AssetSnapshot]:
+        return [
+            item
+            for item in (self.by_name.get((category, name)) for name in names)
+            if item is not None
+        ]
+
+    @classmethod
+    def from_dataset(
+        cls,
+        data: Mapping[str, Sequence[AssetSnapshot | Mapping[str, Any]]],
+    ) -> "IndexedDataset":
+        categories = normalize_dataset(data)
+        by_name: dict[tuple[str, str], AssetSnapshot] = {}
+        by_ticker: dict[str, AssetSnapshot] = {}
+        for category, items in categories.items():
+            for item in items:
+                by_name.setdefault((category, item.name), item)
+                if item.ticker:
+                    by_ticker.setdefault(item.ticker, item)
+        return cls(categories=categories, by_name=by_name, by_ticker=by_ticker)
+
+
 def infer_value_format(name: str) -> ValueFormat:
     if any(keyword in name for keyword in ("Bond", "Treasury", "Year")):
         return ValueFormat.YIELD_3
@@ -201,14 +381,24 @@ def coerce_asset_snapshot(item: AssetSnapshot | Mapping[str, Any]) -> AssetSnaps
 
 
 def normalize_dataset(
-    data: Mapping[str, Sequence[AssetSnapshot | Mapping[str, Any]]],
+    data: IndexedDataset | Mapping[str, Sequence[AssetSnapshot | Mapping[str, Any]]],
 ) -> ReportDataset:
+    if isinstance(data, IndexedDataset):
+        return data.categories
     return {
         str(category): [coerce_asset_snapshot(item) for item in items]
         for category, items in data.items()
     }
 
 
+def index_dataset(
+    data: IndexedDataset | Mapping[str, Sequence[AssetSnapshot | Mapping[str, Any]]],
+) -> IndexedDataset:
+    if isinstance(data, IndexedDataset):
+        return data
+    return IndexedDataset.from_dataset(data)
+
+
 def normalize_report_format_config(
     format_config: ReportFormatConfig | Mapping[str, Any],
 ) -> ReportFormatConfig:
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from ..core.logging import get_logger
+from ..core.paths import resolve_user_cache_path
+
+
+logger = get_logger(__name__)
+
+_CHROME_VERSION_TIMEOUT = 10
+
+
+@dataclass(slots=True, frozen=True)
+class ChromedriverCacheEntry:
+    driver_path: str
+    chrome_binary: str | None
+    chrome_fingerprint: str | None
+    chrome_version: str | None
+
+
+def resolve_chromedriver_cache_path(cache_path=None) -> Path:
+    return Path(
+        cache_path
+        or os.environ.get("CHROMEDRIVER_CACHE_PATH")
+        or resolve_user_cache_path("chromedriver.json")
+    )
+
+
+def chrome_binary_fingerprint(chrome_binary) -> str | None:
+    """Identify a Chrome install by its real path, size and mtime."""
+    if not chrome_binary:
+        return None
+    try:
+        real_path = os.path.realpath(chrome_binary)
+        stat = os.stat(real_path)
+    except OSError:
+        return None
+    return f"{real_path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def read_chrome_version(chrome_binary) -> str | None:
+    if not chrome_binary:
+        return None
+    try:
+        completed = subprocess.run(
+            [chrome_binary, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=_CHROME_VERSION_TIMEOUT,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        logger.debug("Could not read Chrome version from %s: %s", chrome_binary, exc)
+        return None
+    return completed.stdout.strip() or None
+
+
+def load_chromedriver_cache(cache_path=None) -> ChromedriverCacheEntry | None:
+    path = resolve_chromedriver_cache_path(cache_path)
+    if not path.exists():
+        return None
+    try:
+        return ChromedriverCacheEntry(**json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, TypeError, ValueError) as exc:
+        logger.warning("Ignoring unreadable chromedriver cache %s: %s", path, exc)
+        return None
+
+
+def save_chromedriver_cache(entry: ChromedriverCacheEntry, cache_path=None) -> Path:
+    path = resolve_chromedriver_cache_path(cache_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    temp_path.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+    temp_path.replace(path)
+    return path
+
+
+def resolve_cached_chromedriver(chrome_binary, resolve_driver, cache_path=None):
+    """Return a chromedriver path, calling ``resolve_driver`` only on a miss.
+
+    A cached path is reused while its file exists and the Chrome binary it
+    was resolved for is unchanged, so normal runs never reach the network.
+    """
+    fingerprint = chrome_binary_fingerprint(chrome_binary)
+    entry = load_chromedriver_cache(cache_path)
+    if (
+        entry is not None
+        and entry.chrome_fingerprint == fingerprint
+        and os.path.exists(entry.driver_path)
+    ):
+        return entry.driver_path
+
+    if entry is not None:
+        logger.info("Chrome binary or chromedriver changed; resolving chromedriver")
+    entry = ChromedriverCacheEntry(
+        driver_path=resolve_driver(),
+        chrome_binary=chrome_binary,
+        chrome_fingerprint=fingerprint,
+        chrome_version=read_chrome_version(chrome_binary),
+    )
+    try:
+        save_chromedriver_cache(entry, cache_path)
+    except OSError as exc:
+        logger.warning("Could not write chromedriver cache: %s", exc)
+    logger.info(
+        "Resolved chromedriver %s for %s",
+        entry.driver_path,
+        entry.chrome_version or "unknown Chrome version",
+    )
+    return entry.driver_path
@@ -1,17 +1,27 @@
 import base64
+import dataclasses
 import io
 import os
+import tempfile
+from pathlib import Path
 
 os.environ.setdefault("MPLCONFIGDIR", "/tmp/matplotlib")
 
 import matplotlib
 import matplotlib.pyplot as plt
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from PIL import Image
 
 from ..config.report_formats import get_mode_format, load_report_format_config
 from ..core.logging import get_logger
 from ..core.paths import PACKAGE_ROOT, resolve_project_path
-from ..domain.models import RenderedAssetSnapshot, ValueFormat, normalize_dataset
+from ..domain.models import (
+    RenderedAssetSnapshot,
+    ValueFormat,
+    index_dataset,
+    normalize_dataset,
+)
+from .render_cache import dataset_fingerprints, diff_datasets
 
 
 matplotlib.use("Agg")
@@ -19,6 +29,13 @@ matplotlib.use("Agg")
 logger = get_logger(__name__)
 
 DEFAULT_TEMPLATE_DIR = PACKAGE_ROOT / "reporting" / "templates"
+DEFAULT_REPORT_TEMPLATE = "report.html"
+
+SPARKLINE_MODES = ("inline", "sprite", "external")
+# Sparklines are drawn at 2x and shown at half size in the report.
+SPARKLINE_DISPLAY_SCALE = 0.5
+
+_TEMPLATE_ENVIRONMENTS: dict[str, Environment] = {}
 
 
 def generate_sparkline(history):
@@ -39,47 +56,204 @@ def generate_sparkline(history):
     return base64.b64encode(image.getvalue()).decode("utf-8")
 
 
-def generate_html_report(data, template_dir=None):
-    normalized_data = normalize_dataset(data)
-    logger.info("Generating HTML report for %s categories", len(normalized_data))
-    rendered_data = {
-        category: [_render_item(item) for item in items]
-        for category, items in normalized_data.items()
+def generate_html_report(
+    data,
+    template_dir=None,
+    *,
+    rendered_data=None,
+    mode=None,
+    format_config=None,
+    sparkline_mode="inline",
+    sprite_path=None,
+):
+    template = get_template_environment(template_dir).get_template(
+        DEFAULT_REPORT_TEMPLATE
+    )
+    return template.render(
+        **_build_report_context(
+            data,
+            rendered_data,
+            mode,
+            format_config,
+            lazy=False,
+            sparkline_mode=sparkline_mode,
+            sprite_path=sprite_path,
+        )
+    )
+
+
+def build_sparkline_sprite(rendered_data):
+    images = {}
+    for items in rendered_data.values():
+        for item in items:
+            if item.sparkline and item.sparkline not in images:
+                images[item.sparkline] = Image.open(
+                    io.BytesIO(base64.b64decode(item.sparkline))
+                )
+
+    if not images:
+        return None, rendered_data
+
+    sprite = Image.new(
+        "RGBA",
+        (
+            max(image.width for image in images.values()),
+            sum(image.height for image in images.values()),
+        ),
+    )
+    offsets = {}
+    offset = 0
+    for sparkline, image in images.items():
+        sprite.paste(image, (0, offset))
+        offsets[sparkline] = offset
+        offset += image.height
+
+    positioned_data = {
+        category: [
+            dataclasses.replace(item, sparkline_offset=offsets[item.sparkline])
+            if item.sparkline
+            else item
+            for item in items
+        ]
+        for category, items in rendered_data.items()
     }
 
-    env = Environment(loader=FileSystemLoader(_resolve_template_dir(template_dir)))
-    template = env.get_template("report.html")
-    return template.render(data=rendered_data)
+    buffer = io.BytesIO()
+    sprite.save(buffer, format="PNG", optimize=True)
+    logger.info(
+        "Packed %s sparklines into a %sx%s sprite (%s bytes)",
+        len(images),
+        sprite.width,
+        sprite.height,
+        buffer.tell(),
+    )
+    return buffer.getvalue(), positioned_data
+
+
+def render_dataset(data, render_cache=None):
+    if render_cache is None:
+        normalized_data = normalize_dataset(data)
+        logger.info("Rendering %s categories for reuse", len(normalized_data))
+        return {
+            category: [_render_item(item) for item in items]
+            for category, items in normalized_data.items()
+        }
+
+    dataset = index_dataset(data)
+    fingerprints = dataset_fingerprints(dataset)
+    diff = diff_datasets(render_cache.fingerprints, fingerprints)
+    logger.info(
+        "Incremental render: %s added, %s changed, %s removed, %s reused",
+        len(diff.added),
+        len(diff.changed),
+        len(diff.removed),
+        len(diff.unchanged),
+    )
+
+    rendered_data = {}
+    for category, items in dataset.categories.items():
+        rendered_items = []
+        for item in items:
+            key = (category, item.name)
+            fingerprint = fingerprints[key]
+            rendered = render_cache.get(key, fingerprint)
+            if rendered is None:
+                rendered = _render_item(item)
+                render_cache.store(key, fingerprint, rendered)
+            rendered_items.append(rendered)
+        rendered_data[category] = rendered_items
+
+    render_cache.retain(set(dataset.by_name))
+    return rendered_data
+
+
+def get_template_environment(template_dir=None):
+    resolved_dir = _resolve_template_dir(template_dir)
+    env = _TEMPLATE_ENVIRONMENTS.get(resolved_dir)
+    if env is None:
+        env = Environment(
+            loader=FileSystemLoader(resolved_dir),
+            bytecode_cache=_build_bytecode_cache(),
+            auto_reload=False,
+        )
+        _TEMPLATE_ENVIRONMENTS[resolved_dir] = env
+    return env
+
+
+def precompile_templates(template_dir=None):
+    env = get_template_environment(template_dir)
+    template_names = env.list_templates(filter_func=_is_template_file)
+    for template_name in template_names:
+        env.get_template(template_name)
+    logger.info("Precompiled %s report templates", len(template_names))
+    return template_names
+
+
+def clear_template_cache():
+    _TEMPLATE_ENVIRONMENTS.clear()
+
+
+def stream_html_report(
+    data,
+    output,
+    template_dir=None,
+    *,
+    rendered_data=None,
+    mode=None,
+    format_config=None,
+    sparkline_mode="inline",
+    sprite_path=None,
+):
+    if (
+        sparkline_mode == "external"
+        and sprite_path is None
+        and isinstance(output, (str, os.PathLike))
+    ):
+        sprite_path = resolve_sprite_path(output)
+
+    template = get_template_environment(template_dir).get_template(
+        DEFAULT_REPORT_TEMPLATE
+    )
+    chunks = template.generate(
+        **_build_report_context(
+            data,
+            rendered_data,
+            mode,
+            format_config,
+            lazy=True,
+            sparkline_mode=sparkline_mode,
+            sprite_path=sprite_path,
+        )
+    )
+
+    if isinstance(output, (str, os.PathLike)):
+        return _write_chunks_atomically(chunks, output)
+    return _write_chunks(chunks, output)
+
+
+def resolve_sprite_path(report_path):
+    report_path = Path(report_path)
+    return report_path.with_name(f"{report_path.stem}_sparklines.png")
 
 
 def generate_telegram_summary(data, mode="Global", format_config=None):
-    normalized_data = normalize_dataset(data)
+    dataset = index_dataset(data)
     logger.info("Generating Telegram summary for mode=%s", mode)
 
     def format_line(item):
         if item.price is None:
             return f"{item.name}: N/A"
 
-        price_str = _format_numeric(item.price, item.value_format)
+        price_str = format_numeric(item.price, item.value_format)
         if item.change_pct not in (None, 0):
             return f"{item.name}: {price_str} ({item.change_pct:+,.2f}%)"
         return f"{item.name}: {price_str}"
 
-    def get_items(category, names):
-        source_items = normalized_data.get(category, [])
-        found_items = []
-        for name in names:
-            for item in source_items:
-                if item.name == name:
-                    found_items.append(item)
-                    break
-        return found_items
-
     mode_format = get_mode_format(mode, format_config or load_report_format_config())
     lines = []
     for index, section in enumerate(mode_format.summary_sections):
         lines.append(f"[{section.title}]")
-        for item in get_items(section.category, section.items):
+        for item in dataset.select(section.category, section.items):
             lines.append(format_line(item))
         if index < len(mode_format.summary_sections) - 1:
             lines.append("")
@@ -87,12 +261,142 @@ def generate_telegram_summary(data, mode="Global", format_config=None):
     return "\n".join(lines)
 
 
+def format_numeric(value, value_format):
+    if value is None:
+        return ""
+    decimals = 3 if value_format == ValueFormat.YIELD_3 else 2
+    return f"{value:,.{decimals}f}"
+
+
+def format_signed_numeric(value, value_format):
+    if value is None:
+        return ""
+    decimals = 3 if value_format == ValueFormat.YIELD_3 else 2
+    return f"{value:+,.{decimals}f}"
+
+
 def _resolve_template_dir(template_dir):
     if template_dir is None:
         return str(DEFAULT_TEMPLATE_DIR)
     return str(resolve_project_path(template_dir))
 
 
+def _build_report_context(
+    data,
+    rendered_data,
+    mode,
+    format_config,
+    lazy,
+    sparkline_mode="inline",
+    sprite_path=None,
+):
+    if sparkline_mode not in SPARKLINE_MODES:
+        raise ValueError(f"Unsupported sparkline mode: {sparkline_mode}")
+    if sparkline_mode == "external" and sprite_path is None:
+        raise ValueError("External sparkline sprites need a sprite_path.")
+    # A sprite needs every row up front, so only inline mode renders lazily.
+    lazy = lazy and sparkline_mode == "inline"
+
+    if rendered_data is None:
+        normalized_data = normalize_dataset(data)
+        logger.info("Generating HTML report for %s categories", len(normalized_data))
+        if lazy:
+            rendered_data = {
+                category: (_render_item(item) for item in items)
+                for category, items in normalized_data.items()
+            }
+        else:
+            rendered_data = {
+                category: [_render_item(item) for item in items]
+                for category, items in normalized_data.items()
+            }
+
+    if mode is not None:
+        mode_format = get_mode_format(
+            mode, format_config or load_report_format_config()
+        )
+        rendered_data = _order_categories_for_mode(rendered_data, mode_format)
+
+    sprite = None
+    if sparkline_mode != "inline":
+        sprite_png, rendered_data = build_sparkline_sprite(rendered_data)
+        if sprite_png is not None:
+            sprite = _build_sprite_context(sprite_png, sparkline_mode, sprite_path)
+
+    return {"data": rendered_data, "mode": mode, "sprite": sprite}
+
+
+def _build_sprite_context(sprite_png, sparkline_mode, sprite_path):
+    if sparkline_mode == "external":
+        Path(sprite_path).write_bytes(sprite_png)
+        logger.info("Sparkline sprite saved to %s", sprite_path)
+        url = Path(sprite_path).name
+    else:
+        url = f"data:image/png;base64,{base64.b64encode(sprite_png).decode('utf-8')}"
+
+    sprite = Image.open(io.BytesIO(sprite_png))
+    return {
+        "url": url,
+        "width": sprite.width,
+        "height": sprite.height,
+        "scale": SPARKLINE_DISPLAY_SCALE,
+    }
+
+
+def _order_categories_for_mode(rendered_data, mode_format):
+    ordered = {}
+    for section in mode_format.summary_sections:
+        if section.category in rendered_data:
+            ordered[section.category] = rendered_data[section.category]
+    for category, items in rendered_data.items():
+        ordered.setdefault(category, items)
+    return ordered
+
+
+def _build_bytecode_cache():
+    cache_dir = os.environ.get("JINJA_CACHE_DIR")
+    try:
+        if cache_dir is None:
+            # Jinja's default is a per-user 0700 directory it verifies itself;
+            # a fixed shared path would let others plant marshalled bytecode.
+            return FileSystemBytecodeCache()
+        os.makedirs(cache_dir, exist_ok=True)
+    except (OSError, RuntimeError) as exc:
+        logger.warning("Jinja bytecode cache disabled (%s): %s", cache_dir, exc)
+        return None
+    return FileSystemBytecodeCache(cache_dir)
+
+
+def _write_chunks(chunks, handle):
+    """Write ``chunks`` to ``handle`` and return the UTF-8 size in bytes."""
+    written = 0
+    for chunk in chunks:
+        handle.write(chunk)
+        written += len(chunk.encode("utf-8"))
+    return written
+
+
+def _write_chunks_atomically(chunks, output):
+    # Stream into a sibling so a failed render keeps the previous report.
+    output = Path(output)
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{output.name}.", suffix=".tmp", dir=output.parent
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            written = _write_chunks(chunks, handle)
+        os.chmod(temp_name, 0o644)
+        os.replace(temp_name, output)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    return written
+
+
+def _is_template_file(template_name):
+    return template_name.endswith(".html")
+
+
 def _render_item(item) -> RenderedAssetSnapshot:
     sparkline = generate_sparkline(item.history) if len(item.history) > 1 else ""
     change_str = ""
@@ -100,7 +404,7 @@ def _render_item(item) -> RenderedAssetSnapshot:
     color_class = "neutral"
 
     if item.change is not None:
-        change_str = _format_signed_numeric(item.change, item.value_format)
+        change_str = format_signed_numeric(item.change, item.value_format)
         change_pct_str = (
             f"{item.change_pct:+,.2f}%" if item.change_pct is not None else ""
         )
@@ -114,23 +418,9 @@ def _render_item(item) -> RenderedAssetSnapshot:
 
     return RenderedAssetSnapshot(
         name=item.name,
-        price_str=_format_numeric(item.price, item.value_format),
+        price_str=format_numeric(item.price, item.value_format),
         change_str=change_str,
         change_pct_str=change_pct_str,
         color_class=color_class,
         sparkline=sparkline,
     )
-
-
-def _format_numeric(value, value_format):
-    if value is None:
-        return ""
-    decimals = 3 if value_format == ValueFormat.YIELD_3 else 2
-    return f"{value:,.{decimals}f}"
-
-
-def _format_signed_numeric(value, value_format):
-    if value is None:
-        return ""
-    decimals = 3 if value_format == ValueFormat.YIELD_3 else 2
-    return f"{value:+,.{decimals}f}"
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+from PIL import Image
+
+from ..core.logging import get_logger
+from ..core.paths import resolve_user_cache_path
+
+
+logger = get_logger(__name__)
+
+IMAGE_HASH_STORE_VERSION = 1
+DHASH_SIZE = 16
+DEFAULT_UNCHANGED_DISTANCE = 6
+UNCHANGED_SCREENSHOT_ACTIONS = ("note", "skip", "send")
+DEFAULT_UNCHANGED_SCREENSHOT_ACTION = "note"
+
+
+def dhash(image_source, hash_size=DHASH_SIZE) -> str:
+    """Difference hash of an image path or file object, as a hex string.
+
+    Each bit records whether a pixel is brighter than its right neighbour in
+    a ``hash_size + 1`` by ``hash_size`` grayscale thumbnail, so re-encoding
+    and small rendering noise barely move the hash.
+    """
+    with Image.open(image_source) as image:
+        pixels = list(
+            image.convert("L")
+            .resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
+            .getdata()
+        )
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for column in range(hash_size):
+            value = (value << 1) | (
+                pixels[offset + column] > pixels[offset + column + 1]
+            )
+    return f"{value:0{hash_size * hash_size // 4}x}"
+
+
+def hamming_distance(left: str, right: str) -> int:
+    return (int(left, 16) ^ int(right, 16)).bit_count()
+
+
+def resolve_image_hash_store_path(store_path=None) -> Path:
+    return Path(
+        store_path
+        or os.environ.get("SCREENSHOT_HASH_STORE_PATH")
+        or resolve_user_cache_path("screenshot-hashes.json")
+    )
+
+
+def resolve_unchanged_distance(distance=None) -> int:
+    if distance is None:
+        distance = int(
+            os.environ.get("SCREENSHOT_UNCHANGED_DISTANCE", DEFAULT_UNCHANGED_DISTANCE)
+        )
+    return distance
+
+
+def resolve_unchanged_screenshot_action(action=None) -> str:
+    action = (
+        action
+        or os.environ.get("SCREENSHOT_UNCHANGED_ACTION")
+        or DEFAULT_UNCHANGED_SCREENSHOT_ACTION
+    ).lower()
+    if action not in UNCHANGED_SCREENSHOT_ACTIONS:
+        raise ValueError(f"Unsupported unchanged screenshot action: {action}")
+    return action
+
+
+def load_image_hashes(store_path=None) -> dict[str, str]:
+    """Return the last delivered hash for each screenshot target."""
+    path = resolve_image_hash_store_path(store_path)
+    if not path.exists():
+        return {}
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable screenshot hash store %s: %s", path, exc)
+        return {}
+
+    if payload.get("version") != IMAGE_HASH_STORE_VERSION:
+        return {}
+    return {
+        target: entry["hash"] for target, entry in payload.get("targets", {}).items()
+    }
+
+
+def save_image_hashes(hashes: dict[str, str], store_path=None) -> Path:
+    path = resolve_image_hash_store_path(store_path)
+    delivered_at = datetime.now(timezone.utc).isoformat()
+    payload = {
+        "version": IMAGE_HASH_STORE_VERSION,
+        "targets": {
+            target: {"hash": image_hash, "delivered_at": delivered_at}
+            for target, image_hash in hashes.items()
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    temp_path.write_text(json.dumps(payload), encoding="utf-8")
+    temp_path.replace(path)
+    return path
+
+
+def mark_unchanged_screenshots(results, delivered_hashes, max_distance=None):
+    """Hash each captured screenshot and flag near-duplicates of the last send."""
+    max_distance = resolve_unchanged_distance(max_distance)
+    marked = []
+    for result in results:
+        if not result.png and not result.path:
+            marked.append(result)
+            continue
+
+        try:
+            image_hash = dhash(io.BytesIO(result.png) if result.png else result.path)
+        except OSError as exc:
+            logger.warning("Could not hash screenshot %s: %s", result.target, exc)
+            marked.append(result)
+            continue
+
+        previous = delivered_hashes.get(result.target)
+        unchanged = (
+            previous is not None
+            and len(previous) == len(image_hash)
+            and hamming_distance(previous, image_hash) <= max_distance
+        )
+        if unchanged:
+            logger.info(
+                "Screenshot %s is unchanged since the last delivery", result.target
+            )
+        marked.append(replace(result, image_hash=image_hash, unchanged=unchanged))
+    return marked
+
+
+def record_delivered_hashes(results, delivered_hashes) -> dict[str, str]:
+    """Return ``delivered_hashes`` updated with the screenshots just sent.
+
+    Unchanged screenshots keep their previous hash so slow drift still adds
+    up to a visible change eventually.
+    """
+    updated = dict(delivered_hashes)
+    for result in results:
+        if result.image_hash and not result.unchanged:
+            updated[result.target] = result.image_hash
+    return updated
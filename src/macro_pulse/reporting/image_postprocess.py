@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import io
+from dataclasses import replace
+from pathlib import Path
+
+from PIL import Image, ImageChops
+
+from ..core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+_IMAGE_SUFFIXES = {"png": ".png", "webp": ".webp", "jpeg": ".jpg"}
+
+
+def trim_uniform_border(image, tolerance=8):
+    """Crop away edges that match the top-left pixel within ``tolerance``."""
+    rgb = image.convert("RGB")
+    background = Image.new("RGB", rgb.size, rgb.getpixel((0, 0)))
+    difference = ImageChops.difference(rgb, background).convert("L")
+    bbox = difference.point(lambda value: 255 if value > tolerance else 0).getbbox()
+    if not bbox or bbox == (0, 0, *image.size):
+        return image
+    return image.crop(bbox)
+
+
+def postprocess_image(source_path, config, output_path=None):
+    """Trim, downsize and re-encode ``source_path``; return the new path.
+
+    The original file is removed when the output is written elsewhere.
+    """
+    source_path = Path(source_path)
+    output_path = Path(
+        output_path or source_path.with_suffix(_IMAGE_SUFFIXES[config.image_format])
+    )
+
+    with Image.open(source_path) as source:
+        image = _reshape(source, config)
+    _encode(image, output_path, config)
+
+    if output_path != source_path:
+        source_path.unlink(missing_ok=True)
+    return str(output_path)
+
+
+def postprocess_png(png, config) -> bytes:
+    """Trim, downsize and re-encode in-memory PNG bytes."""
+    with Image.open(io.BytesIO(png)) as source:
+        image = _reshape(source, config)
+    buffer = io.BytesIO()
+    _encode(image, buffer, config)
+    return buffer.getvalue()
+
+
+def postprocess_screenshots(results, target_configs):
+    """Post-process each captured screenshot that has post-processing enabled."""
+    processed = []
+    for result in results:
+        target_config = target_configs.get(result.target)
+        if (not result.png and not result.path) or target_config is None:
+            processed.append(result)
+            continue
+
+        config = target_config.postprocess
+        if not config.enabled:
+            processed.append(result)
+            continue
+
+        try:
+            if result.png:
+                bytes_before = len(result.png)
+                png = postprocess_png(result.png, config)
+                bytes_after = len(png)
+                updated = replace(result, png=png)
+            else:
+                bytes_before = Path(result.path).stat().st_size
+                path = postprocess_image(result.path, config)
+                bytes_after = Path(path).stat().st_size
+                updated = replace(result, path=path)
+        except OSError as exc:
+            logger.warning("Could not post-process %s: %s", result.target, exc)
+            processed.append(result)
+            continue
+
+        logger.info(
+            "Post-processed %s screenshot: %s -> %s bytes (%.0f%% smaller)",
+            result.target,
+            bytes_before,
+            bytes_after,
+            (1 - bytes_after / bytes_before) * 100 if bytes_before else 0,
+        )
+        processed.append(
+            replace(updated, image_bytes={"before": bytes_before, "after": bytes_after})
+        )
+    return processed
+
+
+def _reshape(source, config):
+    image = source.convert("RGB")
+    if config.trim_borders:
+        image = trim_uniform_border(image, config.border_tolerance)
+    if config.max_width and image.width > config.max_width:
+        height = round(image.height * config.max_width / image.width)
+        image = image.resize((config.max_width, height), Image.Resampling.LANCZOS)
+    return image
+
+
+def _encode(image, target, config):
+    if config.image_format == "png":
+        if config.palette_colors:
+            image = image.quantize(
+                colors=config.palette_colors, dither=Image.Dither.NONE
+            )
+        image.save(target, "PNG", optimize=True)
+    elif config.image_format == "webp":
+        image.save(target, "WEBP", quality=config.quality, method=6)
+    else:
+        image.save(target, "JPEG", quality=config.quality, optimize=True)
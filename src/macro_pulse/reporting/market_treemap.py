@@ -0,0 +1,295 @@
+import importlib
+import io
+import os
+import time
+from collections import defaultdict
+
+os.environ.setdefault("MPLCONFIGDIR", "/tmp/matplotlib")
+
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection
+from matplotlib.colors import LinearSegmentedColormap, Normalize
+from matplotlib.patches import Rectangle
+
+from ..core.artifacts import resolve_output_path
+from ..core.logging import get_logger
+from ..domain.models import MarketMapConstituent, ScreenshotResult
+
+
+matplotlib.use("Agg")
+
+logger = get_logger(__name__)
+
+MARKET_MAP_MARKETS = ("kospi", "kosdaq")
+TREEMAP_SIZE = (1800, 1000)
+TREEMAP_DPI = 100
+TREEMAP_FONT_FAMILY = ["DejaVu Sans", "NanumGothic"]
+SECTOR_HEADER_HEIGHT = 24
+SECTOR_GAP = 3
+TILE_GAP = 1
+# Changes beyond this many percent get the fullest colour.
+CHANGE_COLOR_LIMIT = 3.0
+
+TREEMAP_COLORS = {
+    "background": "#1f2128",
+    "header": "#d0d3da",
+    "label": "#ffffff",
+    "missing": "#55585f",
+}
+# Korean market convention: rising red, falling blue.
+_CHANGE_COLORMAP = LinearSegmentedColormap.from_list(
+    "market_change", ["#1f5fbf", "#3a3e4a", "#d23a3a"]
+)
+
+
+def squarify(values, x, y, width, height):
+    """Lay ``values`` out as near-square rectangles filling the given box.
+
+    ``values`` should be sorted in descending order; the returned
+    ``(x, y, width, height)`` tuples follow the same order.
+    """
+    total = sum(values)
+    if total <= 0 or width <= 0 or height <= 0:
+        return [(x, y, 0.0, 0.0) for _ in values]
+
+    scale = width * height / total
+    areas = [value * scale for value in values]
+    rects = []
+    start = 0
+    while start < len(areas):
+        side = min(width, height)
+        row = [areas[start]]
+        end = start + 1
+        while end < len(areas) and _worst_ratio(
+            row + [areas[end]], side
+        ) <= _worst_ratio(row, side):
+            row.append(areas[end])
+            end += 1
+
+        row_area = sum(row)
+        if width >= height:
+            column_width = row_area / height
+            offset = y
+            for area in row:
+                rects.append((x, offset, column_width, area / column_width))
+                offset += area / column_width
+            x += column_width
+            width -= column_width
+        else:
+            row_height = row_area / width
+            offset = x
+            for area in row:
+                rects.append((offset, y, area / row_height, row_height))
+                offset += area / row_height
+            y += row_height
+            height -= row_height
+        start = end
+    return rects
+
+
+def resolve_market_map_source(source=None):
+    """Return the constituent loader named by ``source`` or ``MARKET_MAP_SOURCE``.
+
+    Accepts a callable or a ``package.module:function`` path. Returns ``None``
+    when no source is configured, which keeps the browser capture.
+    """
+    source = source or os.environ.get("MARKET_MAP_SOURCE")
+    if not source:
+        return None
+    if callable(source):
+        return source
+    if ":" in source:
+        module_name, function_name = source.split(":", 1)
+        return getattr(importlib.import_module(module_name), function_name)
+    raise ValueError(f"Unknown market map source: {source}")
+
+
+def render_market_treemap(
+    constituents, title=None, output_path=None, as_bytes=False, size=TREEMAP_SIZE
+):
+    """Draw a sector-grouped treemap sized by market cap, coloured by change."""
+    width, height = size
+    sectors = defaultdict(list)
+    for item in constituents:
+        if item.market_cap > 0:
+            sectors[item.sector].append(item)
+    ordered_sectors = sorted(
+        sectors.items(),
+        key=lambda entry: sum(item.market_cap for item in entry[1]),
+        reverse=True,
+    )
+
+    top = SECTOR_HEADER_HEIGHT * 1.5 if title else 0
+    sector_rects = squarify(
+        [sum(item.market_cap for item in items) for _, items in ordered_sectors],
+        0,
+        top,
+        width,
+        height - top,
+    )
+
+    tiles, colors, labels, headers = [], [], [], []
+    norm = Normalize(-CHANGE_COLOR_LIMIT, CHANGE_COLOR_LIMIT, clip=True)
+    for (sector, items), (sx, sy, sw, sh) in zip(
+        ordered_sectors, sector_rects, strict=True
+    ):
+        sx, sy = sx + SECTOR_GAP, sy + SECTOR_GAP
+        sw, sh = sw - SECTOR_GAP * 2, sh - SECTOR_GAP * 2
+        header = min(SECTOR_HEADER_HEIGHT, sh / 4)
+        if sw > 0 and header > 10:
+            headers.append((sx + 4, sy + header / 2, sector))
+
+        items = sorted(items, key=lambda item: item.market_cap, reverse=True)
+        item_rects = squarify(
+            [item.market_cap for item in items], sx, sy + header, sw, sh - header
+        )
+        for item, (x, y, w, h) in zip(items, item_rects, strict=True):
+            if w <= TILE_GAP * 2 or h <= TILE_GAP * 2:
+                continue
+            tiles.append(
+                Rectangle(
+                    (x + TILE_GAP, y + TILE_GAP), w - TILE_GAP * 2, h - TILE_GAP * 2
+                )
+            )
+            colors.append(
+                TREEMAP_COLORS["missing"]
+                if item.change_pct is None
+                else _CHANGE_COLORMAP(norm(item.change_pct))
+            )
+            fontsize = _label_fontsize(item.name, w, h)
+            if fontsize:
+                labels.append((x + w / 2, y + h / 2, item, fontsize))
+
+    with plt.rc_context({"font.family": TREEMAP_FONT_FAMILY}):
+        figure = plt.figure(
+            figsize=(width / TREEMAP_DPI, height / TREEMAP_DPI),
+            dpi=TREEMAP_DPI,
+            facecolor=TREEMAP_COLORS["background"],
+        )
+        try:
+            axis = figure.add_axes((0, 0, 1, 1))
+            axis.set_xlim(0, width)
+            axis.set_ylim(height, 0)
+            axis.axis("off")
+            axis.add_collection(
+                PatchCollection(tiles, facecolors=colors, edgecolors="none")
+            )
+            if title:
+                axis.text(
+                    SECTOR_GAP + 4,
+                    top / 2,
+                    title,
+                    fontsize=18,
+                    color=TREEMAP_COLORS["header"],
+                    va="center",
+                )
+            for x, y, sector in headers:
+                axis.text(
+                    x,
+                    y,
+                    sector,
+                    fontsize=11,
+                    color=TREEMAP_COLORS["header"],
+                    va="center",
+                    clip_on=True,
+                )
+            for x, y, item, fontsize in labels:
+                change = "" if item.change_pct is None else f"\n{item.change_pct:+.2f}%"
+                axis.text(
+                    x,
+                    y,
+                    f"{item.name}{change}",
+                    fontsize=fontsize,
+                    color=TREEMAP_COLORS["label"],
+                    ha="center",
+                    va="center",
+                    linespacing=1.3,
+                )
+
+            if as_bytes:
+                buffer = io.BytesIO()
+                figure.savefig(buffer, format="png")
+                return buffer.getvalue()
+            output_path = resolve_output_path(output_path, "treemap")
+            figure.savefig(output_path, format="png")
+            return output_path
+        finally:
+            plt.close(figure)
+
+
+def take_market_treemap(market, source=None, output_path=None, as_bytes=False):
+    loader = resolve_market_map_source(source)
+    if loader is None:
+        raise ValueError(
+            "No market map source configured; set MARKET_MAP_SOURCE to a loader."
+        )
+    constituents = [
+        item
+        if isinstance(item, MarketMapConstituent)
+        else MarketMapConstituent.from_mapping(item)
+        for item in loader(market)
+    ]
+    return render_market_treemap(
+        constituents,
+        title=f"{market.upper()} 시가총액 맵",
+        output_path=output_path,
+        as_bytes=as_bytes,
+    )
+
+
+def render_native_screenshots(targets, source=None):
+    """Render the market map targets locally when a data source is configured.
+
+    Returns a ``{target: ScreenshotResult}`` mapping for the targets drawn here;
+    the rest still need a browser.
+    """
+    loader = resolve_market_map_source(source)
+    if loader is None:
+        return {}
+
+    results = {}
+    for target in targets:
+        if target not in MARKET_MAP_MARKETS:
+            continue
+        started_at = time.monotonic()
+        try:
+            png = take_market_treemap(target, loader, as_bytes=True)
+        except Exception as exc:
+            logger.exception("Failed to render %s treemap: %s", target, exc)
+            continue
+        logger.info(
+            "Rendered %s treemap locally in %.2fs (%s bytes)",
+            target,
+            time.monotonic() - started_at,
+            len(png),
+        )
+        results[target] = ScreenshotResult(target=target, png=png)
+    return results
+
+
+def _label_fontsize(name, width, height):
+    """Largest font size (max 24pt) that fits the label in the tile, or 0."""
+    # Hangul and other wide glyphs take about one em, Latin about 0.6 em.
+    ems = max(
+        sum(1.0 if ord(char) >= 0x1100 else 0.6 for char in name),
+        len("+0.00%") * 0.6,
+    )
+    points_per_pixel = 72 / TREEMAP_DPI
+    fontsize = min(
+        24.0,
+        width * 0.85 / ems * points_per_pixel,
+        height * 0.8 / 2.6 * points_per_pixel,
+    )
+    return fontsize if fontsize >= 7 else 0
+
+
+def _worst_ratio(row, side):
+    row_area = sum(row)
+    return max(
+        max(
+            side * side * area / (row_area * row_area),
+            row_area * row_area / (side * side * area),
+        )
+        for area in row
+    )
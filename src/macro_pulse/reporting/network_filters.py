@@ -0,0 +1,66 @@
+import json
+
+from ..core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Chrome reports requests refused by ``Network.setBlockedURLs`` with a
+# ``blockedReason`` and hosts dropped by ``--host-resolver-rules`` as
+# unresolvable names.
+_UNRESOLVED_HOST_ERROR = "net::ERR_NAME_NOT_RESOLVED"
+
+
+def apply_resource_blocklist(driver, target_config):
+    """Block the target's URL patterns in the current tab.
+
+    Returns the number of patterns installed.
+    """
+    patterns = list(target_config.blocked_url_patterns)
+    if not patterns:
+        return 0
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    return len(patterns)
+
+
+def build_host_resolver_rules(allowed_hosts):
+    """Chrome ``--host-resolver-rules`` that only resolve ``allowed_hosts``."""
+    hosts = sorted(set(allowed_hosts))
+    if not hosts:
+        return None
+    return ", ".join(["MAP * ~NOTFOUND", *(f"EXCLUDE {host}" for host in hosts)])
+
+
+def read_network_log(driver):
+    try:
+        return driver.get_log("performance")
+    except Exception as exc:
+        logger.debug("Performance log is unavailable: %s", exc)
+        return []
+
+
+def summarize_network_log(entries):
+    """Count requests and loaded bytes in a Chrome performance log."""
+    summary = {"requests": 0, "blocked": 0, "failed": 0, "loaded_bytes": 0}
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            summary["requests"] += 1
+        elif method == "Network.loadingFinished":
+            summary["loaded_bytes"] += int(params.get("encodedDataLength") or 0)
+        elif method == "Network.loadingFailed":
+            if (
+                params.get("blockedReason")
+                or params.get("errorText") == _UNRESOLVED_HOST_ERROR
+            ):
+                summary["blocked"] += 1
+            else:
+                summary["failed"] += 1
+    return summary
@@ -0,0 +1,168 @@
+import time
+
+from ..core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_POLL_INTERVAL = 0.1
+
+_MUTATION_COUNTER_SCRIPT = """
+const el = arguments[0];
+if (!el.__macroPulseObserver) {
+    el.__macroPulseMutations = 0;
+    el.__macroPulseObserver = new MutationObserver((records) => {
+        el.__macroPulseMutations += records.length;
+    });
+    el.__macroPulseObserver.observe(el, {
+        subtree: true,
+        childList: true,
+        attributes: true,
+        characterData: true,
+    });
+}
+return el.__macroPulseMutations;
+"""
+
+_MUTATION_OBSERVER_DISCONNECT_SCRIPT = """
+const el = arguments[0];
+if (el.__macroPulseObserver) {
+    el.__macroPulseObserver.disconnect();
+    delete el.__macroPulseObserver;
+}
+"""
+
+_CANVAS_CHECKSUM_SCRIPT = """
+const root = arguments[0];
+const canvases = root.tagName === 'CANVAS'
+    ? [root]
+    : Array.from(root.querySelectorAll('canvas'));
+if (!canvases.length) {
+    return null;
+}
+const probe = document.createElement('canvas');
+probe.width = 32;
+probe.height = 32;
+const context = probe.getContext('2d', {willReadFrequently: true});
+let checksum = 0;
+try {
+    for (const canvas of canvases) {
+        if (!canvas.width || !canvas.height) {
+            continue;
+        }
+        context.clearRect(0, 0, 32, 32);
+        context.drawImage(canvas, 0, 0, 32, 32);
+        const pixels = context.getImageData(0, 0, 32, 32).data;
+        for (let i = 0; i < pixels.length; i += 4) {
+            checksum = (checksum * 31 + pixels[i] + pixels[i + 1] * 3
+                + pixels[i + 2] * 7 + pixels[i + 3] * 11) % 2147483647;
+        }
+    }
+} catch (error) {
+    return null;
+}
+return checksum;
+"""
+
+_LAYOUT_SCRIPT = """
+const rect = arguments[0].getBoundingClientRect();
+return [
+    Math.round(rect.left),
+    Math.round(rect.top),
+    Math.round(rect.width),
+    Math.round(rect.height),
+    window.innerWidth,
+    window.innerHeight,
+];
+"""
+
+# The resource timeline buffer stops at 250 entries by default, so count with
+# an observer, which keeps seeing entries after the buffer is full.
+_RESOURCE_COUNT_SCRIPT = """
+if (window.__macroPulseResources === undefined) {
+    window.__macroPulseResources = performance.getEntriesByType('resource').length;
+    new PerformanceObserver((list) => {
+        window.__macroPulseResources += list.getEntries().length;
+    }).observe({type: 'resource'});
+}
+return window.__macroPulseResources;
+"""
+
+
+def wait_for_dom_quiet(driver, element, quiet_period=0.5, timeout=5.0):
+    """Wait until ``element``'s subtree has not mutated for ``quiet_period``."""
+    try:
+        return _wait_until_stable(
+            "dom quiet",
+            lambda: driver.execute_script(_MUTATION_COUNTER_SCRIPT, element),
+            quiet_period,
+            timeout,
+        )
+    finally:
+        driver.execute_script(_MUTATION_OBSERVER_DISCONNECT_SCRIPT, element)
+
+
+def wait_for_canvas_stable(driver, element, stable_period=0.5, timeout=10.0):
+    """Wait until the canvas pixels under ``element`` stop changing.
+
+    Falls back to a DOM quiet period when the canvas cannot be read back,
+    for example when it is tainted by cross-origin images.
+    """
+    if driver.execute_script(_CANVAS_CHECKSUM_SCRIPT, element) is None:
+        logger.info("Canvas is not readable; waiting for DOM quiet instead")
+        return wait_for_dom_quiet(driver, element, stable_period, timeout)
+
+    return _wait_until_stable(
+        "canvas",
+        lambda: driver.execute_script(_CANVAS_CHECKSUM_SCRIPT, element),
+        stable_period,
+        timeout,
+        is_ready=lambda checksum: bool(checksum),
+    )
+
+
+def wait_for_layout_stable(driver, element, stable_period=0.3, timeout=4.0):
+    """Wait until ``element``'s box and the viewport stop moving."""
+    return _wait_until_stable(
+        "layout",
+        lambda: driver.execute_script(_LAYOUT_SCRIPT, element),
+        stable_period,
+        timeout,
+    )
+
+
+def wait_for_network_idle(driver, idle_period=0.5, timeout=10.0):
+    """Wait until no new resource has been fetched for ``idle_period``."""
+    return _wait_until_stable(
+        "network idle",
+        lambda: driver.execute_script(_RESOURCE_COUNT_SCRIPT),
+        idle_period,
+        timeout,
+    )
+
+
+def _wait_until_stable(
+    probe,
+    read_state,
+    stable_period,
+    timeout,
+    is_ready=lambda _state: True,
+    poll_interval=DEFAULT_POLL_INTERVAL,
+):
+    started_at = time.monotonic()
+    state = read_state()
+    stable_since = started_at if is_ready(state) else None
+
+    while True:
+        now = time.monotonic()
+        if stable_since is not None and now - stable_since >= stable_period:
+            return now - started_at
+        if now - started_at >= timeout:
+            logger.warning("Readiness probe '%s' hit its %.1fs limit", probe, timeout)
+            return now - started_at
+
+        time.sleep(poll_interval)
+        next_state = read_state()
+        if next_state != state or not is_ready(next_state):
+            stable_since = time.monotonic() if is_ready(next_state) else None
+        state = next_state
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from ..core.logging import get_logger
+from ..core.paths import resolve_user_cache_path
+from ..domain.models import AssetSnapshot, IndexedDataset, RenderedAssetSnapshot
+
+
+logger = get_logger(__name__)
+
+# Bump whenever row rendering changes so stale fragments are not reused.
+RENDER_CACHE_VERSION = 1
+
+RowKey = tuple[str, str]
+
+
+@dataclass(slots=True, frozen=True)
+class DatasetDiff:
+    added: list[RowKey] = field(default_factory=list)
+    changed: list[RowKey] = field(default_factory=list)
+    removed: list[RowKey] = field(default_factory=list)
+    unchanged: list[RowKey] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class RenderCache:
+    fingerprints: dict[RowKey, str] = field(default_factory=dict)
+    rows: dict[RowKey, RenderedAssetSnapshot] = field(default_factory=dict)
+
+    def get(self, key: RowKey, fingerprint: str) -> RenderedAssetSnapshot | None:
+        if self.fingerprints.get(key) != fingerprint:
+            return None
+        return self.rows.get(key)
+
+    def store(
+        self, key: RowKey, fingerprint: str, rendered: RenderedAssetSnapshot
+    ) -> None:
+        self.fingerprints[key] = fingerprint
+        self.rows[key] = rendered
+
+    def retain(self, keys: set[RowKey]) -> None:
+        for key in set(self.rows) - keys:
+            self.fingerprints.pop(key, None)
+            self.rows.pop(key, None)
+
+
+def snapshot_fingerprint(item: AssetSnapshot) -> str:
+    payload = json.dumps(
+        [
+            item.name,
+            item.price,
+            item.change,
+            item.change_pct,
+            item.history,
+            str(item.value_format),
+        ],
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def dataset_fingerprints(dataset: IndexedDataset) -> dict[RowKey, str]:
+    return {
+        (category, item.name): snapshot_fingerprint(item)
+        for category, items in dataset.categories.items()
+        for item in items
+    }
+
+
+def diff_datasets(
+    previous_fingerprints: dict[RowKey, str], current_fingerprints: dict[RowKey, str]
+) -> DatasetDiff:
+    diff = DatasetDiff()
+
+    for key, fingerprint in current_fingerprints.items():
+        previous = previous_fingerprints.get(key)
+        if previous is None:
+            diff.added.append(key)
+        elif previous != fingerprint:
+            diff.changed.append(key)
+        else:
+            diff.unchanged.append(key)
+
+    diff.removed.extend(
+        key for key in previous_fingerprints if key not in current_fingerprints
+    )
+    return diff
+
+
+def resolve_render_cache_path(cache_path=None) -> Path:
+    return Path(
+        cache_path
+        or os.environ.get("RENDER_CACHE_PATH")
+        or resolve_user_cache_path("render-cache.json")
+    )
+
+
+def load_render_cache(cache_path=None) -> RenderCache:
+    path = resolve_render_cache_path(cache_path)
+    if not path.exists():
+        return RenderCache()
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != RENDER_CACHE_VERSION:
+            logger.info("Render cache %s is from another version; rebuilding", path)
+            return RenderCache()
+
+        cache = RenderCache()
+        for row in payload.get("rows", []):
+            cache.store(
+                (row["category"], row["name"]),
+                row["fingerprint"],
+                RenderedAssetSnapshot(**row["rendered"]),
+            )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+        logger.warning("Ignoring unreadable render cache %s: %s", path, exc)
+        return RenderCache()
+    return cache
+
+
+def save_render_cache(cache: RenderCache, cache_path=None) -> Path:
+    path = resolve_render_cache_path(cache_path)
+    payload = {
+        "version": RENDER_CACHE_VERSION,
+        "rows": [
+            {
+                "category": category,
+                "name": name,
+                "fingerprint": cache.fingerprints[(category, name)],
+                "rendered": asdict(rendered),
+            }
+            for (category, name), rendered in cache.rows.items()
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    temp_path.write_text(json.dumps(payload), encoding="utf-8")
+    temp_path.replace(path)
+    return path
@@ -0,0 +1,286 @@
+"""Long-lived local screenshot service.
+
+A single warmed browser with a persistent profile serves capture requests
+over a Unix socket. Each request is one JSON line; the reply is a JSON header
+line followed by the PNG bytes of every captured target, back to back.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import time
+from pathlib import Path
+
+from ..config.report_formats import get_screenshot_target_config
+from ..core.logging import get_logger
+from ..domain.models import ScreenshotResult
+from . import screenshots
+
+
+logger = get_logger(__name__)
+
+DEFAULT_SERVICE_PROFILE_DIR = os.path.join(
+    tempfile.gettempdir(), "macro-pulse-chrome-profile"
+)
+DEFAULT_SERVICE_MAX_RSS_MB = 1500
+DEFAULT_SERVICE_MAX_CAPTURES = 500
+_PROFILE_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie")
+
+
+def resolve_service_socket(socket_path=None):
+    return socket_path or os.environ.get("SCREENSHOT_SERVICE_SOCKET") or None
+
+
+class WarmBrowser:
+    """One browser kept alive between requests and recycled when it degrades."""
+
+    def __init__(
+        self,
+        profile_dir=DEFAULT_SERVICE_PROFILE_DIR,
+        max_rss_bytes=DEFAULT_SERVICE_MAX_RSS_MB * 1024 * 1024,
+        max_captures=DEFAULT_SERVICE_MAX_CAPTURES,
+    ):
+        self.profile_dir = Path(profile_dir)
+        self.max_rss_bytes = max_rss_bytes
+        self.max_captures = max_captures
+        self.started_at = time.monotonic()
+        self.recycles = 0
+        self._driver = None
+        self._captures = 0
+
+    def capture(self, targets):
+        """Capture ``targets`` and return ``(ScreenshotResult, png_bytes)`` pairs."""
+        captured = []
+        for target in targets:
+            capture = screenshots.SCREENSHOT_HANDLERS.get(target)
+            if capture is None:
+                logger.warning("Unknown screenshot target requested: %s", target)
+                continue
+
+            driver = self._ensure_driver()
+            waits, network = {}, {}
+            png = None
+            try:
+                if driver:
+                    png = screenshots.capture_in_isolated_tab(
+                        driver,
+                        target,
+                        capture,
+                        get_screenshot_target_config(target),
+                        waits,
+                        network,
+                    )
+            except Exception as exc:
+                logger.exception("Screenshot target %s failed: %s", target, exc)
+                self._restart("capture failed")
+            self._captures += 1
+
+            captured.append(
+                (
+                    ScreenshotResult(target=target, waits=waits, network=network),
+                    png or b"",
+                )
+            )
+        return captured
+
+    def health(self):
+        return {
+            "status": "ok" if self._is_alive() else "down",
+            "captures": self._captures,
+            "recycles": self.recycles,
+            "browser_rss_bytes": self.browser_rss_bytes(),
+            "uptime_seconds": round(time.monotonic() - self.started_at, 1),
+        }
+
+    def browser_rss_bytes(self):
+        service = getattr(self._driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None:
+            return 0
+        return process_tree_rss_bytes(process.pid)
+
+    def close(self):
+        if self._driver is not None:
+            screenshots._quit_driver(self._driver)
+            self._driver = None
+
+    def _ensure_driver(self):
+        if self._driver is not None:
+            if not self._is_alive():
+                self._restart("health check failed")
+            elif self._captures >= self.max_captures:
+                self._restart(f"served {self._captures} captures")
+            else:
+                rss_bytes = self.browser_rss_bytes()
+                if rss_bytes > self.max_rss_bytes:
+                    self._restart(f"browser RSS {rss_bytes // (1024 * 1024)} MiB")
+
+        if self._driver is None:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            # A crashed browser leaves its profile locked for the next one.
+            for name in _PROFILE_LOCK_FILES:
+                (self.profile_dir / name).unlink(missing_ok=True)
+            self._driver = screenshots.get_chrome_driver(
+                user_data_dir=str(self.profile_dir)
+            )
+            self._captures = 0
+        return self._driver
+
+    def _is_alive(self):
+        if self._driver is None:
+            return False
+        try:
+            return self._driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _restart(self, reason):
+        logger.info("Recycling warm browser: %s", reason)
+        self.close()
+        self.recycles += 1
+
+
+def process_tree_rss_bytes(root_pid):
+    """Resident memory of ``root_pid`` and all its descendants, via ``/proc``."""
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    for pid in screenshots._process_tree_pids(root_pid):
+        try:
+            resident_pages = int(
+                Path("/proc", str(pid), "statm").read_text().split()[1]
+            )
+        except (OSError, IndexError, ValueError):
+            continue
+        total += resident_pages * page_size
+    return total
+
+
+class _ServiceHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            self._reply({"error": "invalid request"})
+            return
+
+        browser = self.server.browser
+        command = request.get("command")
+        if command == "health":
+            self._reply(browser.health())
+        elif command == "capture":
+            captured = browser.capture(request.get("targets", []))
+            self._reply(
+                {
+                    "results": [
+                        {
+                            "target": result.target,
+                            "waits": result.waits,
+                            "network": result.network,
+                            "size": len(png),
+                        }
+                        for result, png in captured
+                    ]
+                },
+                [png for _, png in captured],
+            )
+        else:
+            self._reply({"error": f"unknown command: {command}"})
+
+    def _reply(self, header, payloads=()):
+        self.wfile.write(json.dumps(header).encode("utf-8") + b"\n")
+        for payload in payloads:
+            self.wfile.write(payload)
+
+
+def create_service_server(socket_path, browser):
+    socket_path = Path(socket_path)
+    socket_path.unlink(missing_ok=True)
+    server = socketserver.UnixStreamServer(str(socket_path), _ServiceHandler)
+    server.browser = browser
+    return server
+
+
+def serve(socket_path, browser=None):
+    """Serve capture requests on ``socket_path`` until interrupted."""
+    browser = browser or WarmBrowser()
+    with create_service_server(socket_path, browser) as server:
+        logger.info("Screenshot service listening on %s", socket_path)
+        try:
+            server.serve_forever()
+        finally:
+            browser.close()
+            Path(socket_path).unlink(missing_ok=True)
+
+
+def request_service_health(socket_path=None, timeout=5.0):
+    header, reader = _request(
+        resolve_service_socket(socket_path), {"command": "health"}, timeout
+    )
+    reader.close()
+    return header
+
+
+def request_service_screenshots(targets, socket_path=None, timeout=None):
+    results = request_service_screenshot_results(targets, socket_path, timeout)
+    if results is None:
+        return None
+    return [
+        screenshots.save_screenshot_png(result.target, result.png)
+        for result in results
+        if result.png
+    ]
+
+
+def request_service_screenshot_results(targets, socket_path=None, timeout=None):
+    """Ask the running service for ``targets`` and return the PNGs in memory.
+
+    Returns one result per captured target, or ``None`` when the service
+    cannot be reached so the caller can fall back to capturing in-process.
+    """
+    socket_path = resolve_service_socket(socket_path)
+    if not socket_path or not targets:
+        return None
+
+    if timeout is None:
+        timeout = screenshots.resolve_screenshot_target_timeout() * len(targets)
+    results = []
+    try:
+        header, reader = _request(
+            socket_path, {"command": "capture", "targets": list(targets)}, timeout
+        )
+        with reader:
+            for entry in header["results"]:
+                png = reader.read(entry["size"]) if entry["size"] else b""
+                if len(png) != entry["size"]:
+                    raise ValueError(f"truncated image for {entry['target']}")
+                result = ScreenshotResult(
+                    target=entry["target"],
+                    png=png or None,
+                    waits=entry.get("waits", {}),
+                    network=entry.get("network", {}),
+                )
+                results.append(result)
+                logger.info(
+                    "Service captured %s (%s bytes, waited %.2fs)",
+                    result.target,
+                    len(png),
+                    result.waited,
+                )
+        return results
+    except (OSError, KeyError, ValueError) as exc:
+        logger.warning("Screenshot service at %s unavailable: %s", socket_path, exc)
+        return None
+
+
+def _request(socket_path, payload, timeout):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        client.connect(socket_path)
+        client.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        reader = client.makefile("rb")
+    finally:
+        client.close()
+    return json.loads(reader.readline()), reader
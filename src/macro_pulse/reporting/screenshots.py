@@ -1,9 +1,30 @@
+import base64
 import os
 import shutil
+import signal
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
 
+from ..config.report_formats import get_screenshot_target_config
 from ..core.artifacts import resolve_output_path
 from ..core.logging import get_logger
+from ..domain.models import ScreenshotResult
+from .chromedriver_cache import resolve_cached_chromedriver
+from .network_filters import (
+    apply_resource_blocklist,
+    build_host_resolver_rules,
+    read_network_log,
+    summarize_network_log,
+)
+from .page_readiness import (
+    wait_for_canvas_stable,
+    wait_for_dom_quiet,
+    wait_for_layout_stable,
+    wait_for_network_idle,
+)
 
 try:
     from selenium import webdriver
@@ -41,9 +62,15 @@ MARKETMAP_WRAPPER_SELECTORS = (
     "div.fiq-marketmap",
 )
 MARKETMAP_SVG_SELECTOR = "svg.anychart-ui-support"
+DEFAULT_WINDOW_SIZE = (1920, 1600)
+DEFAULT_SCREENSHOT_POOL_SIZE = 1
+DEFAULT_SCREENSHOT_TARGET_TIMEOUT = 240.0
+CAPTURE_MODES = ("window", "cdp")
+DEFAULT_CAPTURE_MODE = "window"
+_TIMEOUT_POLL_INTERVAL = 0.5
 
 
-def get_chrome_driver():
+def get_chrome_driver(allowed_hosts=None, user_data_dir=None):
     if webdriver is None or Options is None or ChromeService is None:
         logger.warning(
             "Selenium runtime is unavailable. Install selenium and webdriver-manager to enable screenshots."
@@ -55,13 +82,25 @@ def get_chrome_driver():
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1600")
+    chrome_options.add_argument(
+        f"--window-size={DEFAULT_WINDOW_SIZE[0]},{DEFAULT_WINDOW_SIZE[1]}"
+    )
     chrome_options.add_argument("--hide-scrollbars")
     chrome_options.add_argument("--force-device-scale-factor=1")
     chrome_options.add_argument(
         "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
     chrome_options.set_capability("pageLoadStrategy", "eager")
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    if user_data_dir:
+        # A persistent profile keeps the HTTP cache and DNS/TLS state warm
+        # across captures served by the screenshot service.
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+
+    host_resolver_rules = build_host_resolver_rules(allowed_hosts or ())
+    if host_resolver_rules:
+        chrome_options.add_argument(f"--host-resolver-rules={host_resolver_rules}")
 
     chrome_binary = _resolve_chrome_binary()
     if chrome_binary:
@@ -75,21 +114,239 @@ def get_chrome_driver():
         return None
 
 
-def capture_screenshots(targets):
-    screenshot_paths = []
+def capture_screenshots(targets, pool_size=None, target_timeout=None):
+    """Capture ``targets`` and save each PNG to a temporary file."""
+    return [
+        save_screenshot_png(result.target, result.png)
+        for result in capture_screenshot_results(targets, pool_size, target_timeout)
+        if result.png
+    ]
+
+
+def save_screenshot_png(target, png, output_path=None):
+    output_path = resolve_output_path(output_path, f"{target}_map")
+    with open(output_path, "wb") as handle:
+        handle.write(png)
+    return output_path
+
+
+def capture_screenshot_results(targets, pool_size=None, target_timeout=None):
     if targets:
         logger.info("Taking screenshots for targets: %s", ", ".join(targets))
 
+    captures = []
     for target in targets:
         capture = SCREENSHOT_HANDLERS.get(target)
         if capture is None:
             logger.warning("Unknown screenshot target in config: %s", target)
             continue
-        screenshot_path = capture()
-        if screenshot_path:
-            screenshot_paths.append(screenshot_path)
+        captures.append((target, capture))
+
+    if not captures:
+        return []
+
+    pool_size = min(resolve_screenshot_pool_size(pool_size), len(captures))
+    target_timeout = resolve_screenshot_target_timeout(target_timeout)
+    target_configs = {
+        target: get_screenshot_target_config(target) for target, _ in captures
+    }
+    pool = _BrowserPool(allowed_hosts=resolve_allowed_hosts(target_configs))
+    # index -> (start time, driver); the clock starts before the browser does
+    # so a hung Chrome or chromedriver launch is timed out too.
+    started = {}
+    timed_out = set()
+    started_lock = threading.Lock()
+
+    waits = [{} for _ in captures]
+    network = [{} for _ in captures]
+
+    def run(index, target, capture):
+        with started_lock:
+            started[index] = (time.monotonic(), None)
+        driver = pool.driver()
+        with started_lock:
+            late = index in timed_out
+            if not late:
+                started[index] = (started[index][0], driver)
+        if late:
+            # The target gave up while this browser was starting.
+            if driver:
+                pool.discard(driver, terminate=True)
+            return None
+        if not driver:
+            return None
+        return capture_in_isolated_tab(
+            driver,
+            target,
+            capture,
+            target_configs[target],
+            waits[index],
+            network[index],
+        )
+
+    results = {}
+    executor = ThreadPoolExecutor(
+        max_workers=pool_size, thread_name_prefix="screenshot"
+    )
+    try:
+        futures = {
+            executor.submit(run, index, target, capture): index
+            for index, (target, capture) in enumerate(captures)
+        }
+        pending = set(futures)
+        while pending:
+            done, pending = wait(
+                pending, timeout=_TIMEOUT_POLL_INTERVAL, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as exc:
+                    logger.exception(
+                        "Screenshot target %s failed: %s", captures[index][0], exc
+                    )
+
+            now = time.monotonic()
+            for future in list(pending):
+                index = futures[future]
+                with started_lock:
+                    if index not in started or now - started[index][0] < target_timeout:
+                        continue
+                    timed_out.add(index)
+                    driver = started[index][1]
+                logger.warning(
+                    "Screenshot target %s timed out after %.0fs",
+                    captures[index][0],
+                    target_timeout,
+                )
+                pending.discard(future)
+                # Killing the browser fails the stuck WebDriver call at once,
+                # so the worker stops instead of driving Chrome in the
+                # background; it starts a new browser for its next target.
+                # A browser still starting is killed by ``run`` once it exists.
+                if driver is not None:
+                    pool.discard(driver, terminate=True)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        pool.close()
+
+    screenshot_results = []
+    for index, (target, _capture) in enumerate(captures):
+        result = ScreenshotResult(
+            target=target,
+            png=results.get(index),
+            waits=dict(waits[index]),
+            network=dict(network[index]),
+        )
+        logger.info(
+            "Screenshot target %s waited %.2fs for readiness (%s)",
+            target,
+            result.waited,
+            ", ".join(
+                f"{probe}={seconds:.2f}s" for probe, seconds in result.waits.items()
+            )
+            or "no probes",
+        )
+        if result.network:
+            logger.info(
+                "Screenshot target %s network: %s requests, %s blocked, "
+                "%s failed, %s bytes loaded",
+                target,
+                result.network["requests"],
+                result.network["blocked"],
+                result.network["failed"],
+                result.network["loaded_bytes"],
+            )
+        screenshot_results.append(result)
+    return screenshot_results
+
+
+def capture_in_isolated_tab(driver, target, capture, target_config, waits, network):
+    """Run one target's capture in a fresh, filtered tab of ``driver``.
+
+    Returns the PNG bytes. Readiness waits and the tab's network summary are
+    recorded into ``waits`` and ``network``.
+    """
+    with _isolated_tab(driver, target):
+        read_network_log(driver)
+        apply_resource_blocklist(driver, target_config)
+        try:
+            return capture(driver=driver, waits=waits, as_bytes=True)
+        finally:
+            network.update(summarize_network_log(read_network_log(driver)))
 
-    return screenshot_paths
+
+def resolve_allowed_hosts(target_configs):
+    """Union of the targets' allowlists, or ``None`` if any target has none.
+
+    Host resolution rules apply to the whole browser, so an allowlist is only
+    enforced when every target in the run declares one.
+    """
+    allowed_hosts = set()
+    for target_config in target_configs.values():
+        if not target_config.allowed_hosts:
+            return None
+        allowed_hosts.update(target_config.allowed_hosts)
+    return sorted(allowed_hosts) or None
+
+
+def resolve_screenshot_pool_size(pool_size=None):
+    if pool_size is None:
+        pool_size = int(
+            os.environ.get("SCREENSHOT_POOL_SIZE", DEFAULT_SCREENSHOT_POOL_SIZE)
+        )
+    return max(1, pool_size)
+
+
+def resolve_screenshot_target_timeout(target_timeout=None):
+    if target_timeout is None:
+        target_timeout = float(
+            os.environ.get(
+                "SCREENSHOT_TARGET_TIMEOUT", DEFAULT_SCREENSHOT_TARGET_TIMEOUT
+            )
+        )
+    return target_timeout
+
+
+def resolve_capture_mode(capture_mode=None):
+    capture_mode = (
+        capture_mode
+        or os.environ.get("SCREENSHOT_CAPTURE_MODE")
+        or DEFAULT_CAPTURE_MODE
+    ).lower()
+    if capture_mode not in CAPTURE_MODES:
+        raise ValueError(f"Unsupported screenshot capture mode: {capture_mode}")
+    return capture_mode
+
+
+def capture_element_png(driver, element):
+    """Capture ``element`` through the DevTools protocol and return PNG bytes.
+
+    The clip is taken from the full page, so the element does not have to
+    fit the viewport and the window never needs resizing.
+    """
+    clip = driver.execute_script(
+        """
+        const rect = arguments[0].getBoundingClientRect();
+        return {
+            x: rect.left + window.scrollX,
+            y: rect.top + window.scrollY,
+            width: Math.ceil(rect.width),
+            height: Math.ceil(rect.height),
+        };
+        """,
+        element,
+    )
+    result = driver.execute_cdp_cmd(
+        "Page.captureScreenshot",
+        {
+            "format": "png",
+            "captureBeyondViewport": True,
+            "clip": {**clip, "scale": 1},
+        },
+    )
+    return base64.b64decode(result["data"])
 
 
 def resize_window_for_element(driver, element, min_width=1600, padding=120):
@@ -113,7 +370,7 @@ def resize_window_for_element(driver, element, min_width=1600, padding=120):
     driver.execute_script(
         "arguments[0].scrollIntoView({block: 'start', inline: 'nearest'});", element
     )
-    time.sleep(2)
+    return wait_for_layout_stable(driver, element, timeout=4.0)
 
 
 def wait_for_marketmap_svg(driver, timeout=40):
@@ -176,56 +433,130 @@ def position_element_for_capture(driver, element, top_offset=160):
         element,
         top_offset,
     )
-    time.sleep(1)
-
+    return wait_for_layout_stable(driver, element, timeout=2.0)
+
+
+def resolve_screenshot_url(target, url=None):
+    """Return the page to capture for ``target``.
+
+    ``SCREENSHOT_URL_<TARGET>`` points a target at another page, such as a
+    local fixture, without changing callers.
+    """
+    if url:
+        return url
+    default_url = FINVIZ_URL if target == "finviz" else MARKETMAP_URLS[target]
+    return os.environ.get(f"SCREENSHOT_URL_{target.upper()}", default_url)
+
+
+def take_finviz_screenshot(
+    output_path=None,
+    driver=None,
+    waits=None,
+    capture_mode=None,
+    url=None,
+    timings=None,
+    as_bytes=False,
+):
+    with _browser_session(driver) as session_driver:
+        if not session_driver:
+            return None
+        return _capture_finviz_map(
+            session_driver,
+            output_path,
+            _wait_log(waits),
+            resolve_capture_mode(capture_mode),
+            resolve_screenshot_url("finviz", url),
+            _wait_log(timings),
+            as_bytes,
+        )
 
-def take_finviz_screenshot(output_path=None):
-    driver = get_chrome_driver()
-    if not driver:
-        return None
 
+def _capture_finviz_map(
+    driver, output_path, waits, capture_mode, url, timings, as_bytes
+):
     try:
-        output_path = resolve_output_path(output_path, "finviz_map")
-        logger.info("Navigating to %s...", FINVIZ_URL)
-        driver.get(FINVIZ_URL)
+        logger.info("Navigating to %s...", url)
+        started_at = time.monotonic()
+        driver.get(url)
 
         logger.info("Waiting for map element...")
         element = WebDriverWait(driver, 20).until(
             EC.visibility_of_element_located((By.ID, "canvas-wrapper"))
         )
+        timings["navigation"] = time.monotonic() - started_at
 
         logger.info("Waiting for canvas to render...")
-        time.sleep(5)
+        waits["canvas"] = wait_for_canvas_stable(driver, element, timeout=10.0)
 
-        element.screenshot(output_path)
-        logger.info("Screenshot saved to %s", output_path)
-        return output_path
+        started_at = time.monotonic()
+        png = _element_png(driver, element, capture_mode)
+        timings["capture"] = time.monotonic() - started_at
+        return _emit_png("finviz", png, output_path, as_bytes)
     except Exception as exc:
         logger.exception("Failed to take screenshot: %s", exc)
         return None
-    finally:
-        driver.quit()
 
 
-def take_kospi_screenshot(output_path=None):
-    return _take_hankyung_marketmap_screenshot("kospi", output_path)
+def take_kospi_screenshot(
+    output_path=None,
+    driver=None,
+    waits=None,
+    capture_mode=None,
+    url=None,
+    timings=None,
+    as_bytes=False,
+):
+    return _take_hankyung_marketmap_screenshot(
+        "kospi", output_path, driver, waits, capture_mode, url, timings, as_bytes
+    )
 
 
-def take_kosdaq_screenshot(output_path=None):
-    return _take_hankyung_marketmap_screenshot("kosdaq", output_path)
+def take_kosdaq_screenshot(
+    output_path=None,
+    driver=None,
+    waits=None,
+    capture_mode=None,
+    url=None,
+    timings=None,
+    as_bytes=False,
+):
+    return _take_hankyung_marketmap_screenshot(
+        "kosdaq", output_path, driver, waits, capture_mode, url, timings, as_bytes
+    )
 
 
-def _take_hankyung_marketmap_screenshot(market, output_path):
-    driver = get_chrome_driver()
-    if not driver:
-        return None
+def _take_hankyung_marketmap_screenshot(
+    market,
+    output_path,
+    driver=None,
+    waits=None,
+    capture_mode=None,
+    url=None,
+    timings=None,
+    as_bytes=False,
+):
+    with _browser_session(driver) as session_driver:
+        if not session_driver:
+            return None
+        return _capture_hankyung_marketmap(
+            session_driver,
+            market,
+            output_path,
+            _wait_log(waits),
+            resolve_capture_mode(capture_mode),
+            resolve_screenshot_url(market, url),
+            _wait_log(timings),
+            as_bytes,
+        )
 
-    try:
-        output_path = resolve_output_path(output_path, f"{market}_map")
-        url = MARKETMAP_URLS[market]
 
+def _capture_hankyung_marketmap(
+    driver, market, output_path, waits, capture_mode, url, timings, as_bytes
+):
+    try:
         for attempt in range(2):
             logger.info("Navigating to %s... (attempt %s)", url, attempt + 1)
+            started_at = time.monotonic()
             driver.get(url)
             WebDriverWait(driver, 30).until(
                 lambda current_driver: (
@@ -234,16 +565,29 @@ def _take_hankyung_marketmap_screenshot(market, output_path):
                 )
             )
 
+            timings["navigation"] = time.monotonic() - started_at
+
             try:
                 logger.info("Waiting for chart SVG to render...")
+                started_at = time.monotonic()
                 svg = wait_for_marketmap_svg(driver, timeout=40)
-                resize_window_for_element(driver, svg, min_width=1800, padding=240)
-                svg = wait_for_marketmap_svg(driver, timeout=20)
-                position_element_for_capture(driver, svg, top_offset=180)
-                time.sleep(3)
-                svg.screenshot(output_path)
-                logger.info("Screenshot saved to %s", output_path)
-                return output_path
+                waits["svg"] = time.monotonic() - started_at
+                if capture_mode == "window":
+                    # Window captures only see the viewport, so grow the window
+                    # to fit the map and wait out the reflow it causes.
+                    waits["resize"] = resize_window_for_element(
+                        driver, svg, min_width=1800, padding=240
+                    )
+                    svg = wait_for_marketmap_svg(driver, timeout=20)
+                    waits["position"] = position_element_for_capture(
+                        driver, svg, top_offset=180
+                    )
+                waits["dom_quiet"] = wait_for_dom_quiet(driver, svg, timeout=5.0)
+                waits["network_idle"] = wait_for_network_idle(driver, timeout=5.0)
+                started_at = time.monotonic()
+                png = _element_png(driver, svg, capture_mode)
+                timings["capture"] = time.monotonic() - started_at
+                return _emit_png(market, png, output_path, as_bytes)
             except Exception as exc:
                 logger.warning("Capture attempt %s failed: %s", attempt + 1, exc)
                 if attempt == 1:
@@ -251,8 +595,158 @@ def _take_hankyung_marketmap_screenshot(market, output_path):
     except Exception as exc:
         logger.exception("Failed to take %s screenshot: %s", market.upper(), exc)
         return None
-    finally:
+
+
+def _element_png(driver, element, capture_mode):
+    if capture_mode == "cdp":
+        return capture_element_png(driver, element)
+    return element.screenshot_as_png
+
+
+def _emit_png(target, png, output_path, as_bytes):
+    if as_bytes:
+        logger.info("Captured %s screenshot in memory (%s bytes)", target, len(png))
+        return png
+    output_path = save_screenshot_png(target, png, output_path)
+    logger.info("Screenshot saved to %s", output_path)
+    return output_path
+
+
+def _wait_log(waits):
+    return waits if waits is not None else {}
+
+
+class _BrowserPool:
+    """Gives each capture thread its own browser and quits them all at the end."""
+
+    def __init__(self, allowed_hosts=None):
+        self._allowed_hosts = allowed_hosts
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._drivers = []
+        self._unavailable = False
+
+    def driver(self):
+        driver = getattr(self._local, "driver", None)
+        with self._lock:
+            if driver is not None and driver in self._drivers:
+                return driver
+            if self._unavailable:
+                return None
+
+        driver = get_chrome_driver(allowed_hosts=self._allowed_hosts)
+        with self._lock:
+            if driver is None:
+                self._unavailable = True
+            else:
+                self._drivers.append(driver)
+        self._local.driver = driver
+        return driver
+
+    def discard(self, driver, terminate=False):
+        with self._lock:
+            if driver not in self._drivers:
+                return
+            self._drivers.remove(driver)
+        if terminate:
+            _terminate_driver(driver)
+        else:
+            _quit_driver(driver)
+
+    def close(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            _quit_driver(driver)
+
+
+def _quit_driver(driver):
+    try:
         driver.quit()
+    except Exception as exc:
+        logger.warning("Failed to quit Chrome Driver: %s", exc)
+
+
+def _terminate_driver(driver):
+    """Kill chromedriver and its browsers, then quit the session.
+
+    ``quit()`` alone queues behind the command a stuck capture is blocked on,
+    so the processes are killed first to make that command fail.
+    """
+    process = getattr(getattr(driver, "service", None), "process", None)
+    root_pid = getattr(process, "pid", None)
+    if isinstance(root_pid, int):
+        # Children first so the browser cannot outlive its driver.
+        for pid in reversed(_process_tree_pids(root_pid)):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+    _quit_driver(driver)
+
+
+def _process_tree_pids(root_pid):
+    """``root_pid`` followed by all its descendants, read from ``/proc``."""
+    children = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return [root_pid]
+
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            stat = Path("/proc", entry, "stat").read_text()
+        except OSError:
+            continue
+        parent_pid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(parent_pid, []).append(int(entry))
+
+    pids = []
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        pids.append(pid)
+        pending.extend(children.get(pid, []))
+    return pids
+
+
+@contextmanager
+def _browser_session(driver=None):
+    if driver is not None:
+        yield driver
+        return
+
+    driver = get_chrome_driver()
+    try:
+        yield driver
+    finally:
+        if driver:
+            driver.quit()
+
+
+@contextmanager
+def _isolated_tab(driver, target):
+    """Run one capture in a fresh tab and drop its state afterwards."""
+    original_handle = driver.current_window_handle
+    driver.switch_to.new_window("tab")
+    driver.set_window_size(*DEFAULT_WINDOW_SIZE)
+    try:
+        yield
+    finally:
+        try:
+            driver.execute_script(
+                "window.localStorage.clear(); window.sessionStorage.clear();"
+            )
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception as exc:
+            logger.debug("Could not clear browser state after %s: %s", target, exc)
+        try:
+            driver.close()
+            driver.switch_to.window(original_handle)
+        except Exception as exc:
+            logger.warning("Could not close the %s tab: %s", target, exc)
 
 
 def _resolve_chrome_binary():
@@ -269,6 +763,19 @@ def _resolve_chromedriver_binary():
     if os.environ.get("CHROMEDRIVER_BIN"):
         return os.environ["CHROMEDRIVER_BIN"]
 
+    return resolve_cached_chromedriver(
+        _resolve_chrome_binary(), _locate_chromedriver_binary
+    )
+
+
+def warm_chromedriver_cache(cache_path=None):
+    """Resolve chromedriver now so later runs start from the cache."""
+    return resolve_cached_chromedriver(
+        _resolve_chrome_binary(), _locate_chromedriver_binary, cache_path
+    )
+
+
+def _locate_chromedriver_binary():
     local_binary = shutil.which("chromedriver")
     if local_binary:
         return local_binary
@@ -0,0 +1,189 @@
+import io
+import os
+
+os.environ.setdefault("MPLCONFIGDIR", "/tmp/matplotlib")
+
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
+
+from ..config.report_formats import get_mode_format, load_report_format_config
+from ..core.artifacts import resolve_output_path
+from ..core.logging import get_logger
+from ..domain.models import SummaryCardConfig, index_dataset
+from .generator import format_numeric
+
+
+matplotlib.use("Agg")
+
+logger = get_logger(__name__)
+
+CARD_DPI = 100
+CARD_PADDING = 40
+HEADER_HEIGHT = 90
+SECTION_HEIGHT = 56
+ROW_HEIGHT = 48
+SECTION_GAP = 16
+
+CARD_COLORS = {
+    "background": "#ffffff",
+    "title": "#2c3e50",
+    "section": "#7f8c8d",
+    "text": "#333333",
+    "divider": "#ecf0f1",
+    "positive": "#2ecc71",
+    "negative": "#e74c3c",
+    "neutral": "#95a5a6",
+}
+
+
+def render_summary_card(
+    data, mode, format_config=None, output_path=None, as_bytes=False
+):
+    """Draw the mode's summary card and save it as a PNG.
+
+    Returns the PNG path, or the PNG bytes when ``as_bytes`` is set.
+    """
+    config = format_config or load_report_format_config()
+    mode_format = get_mode_format(mode, config)
+    card_config = mode_format.summary_card or SummaryCardConfig()
+    dataset = index_dataset(data)
+
+    sections = [
+        (section.title, dataset.select(section.category, section.items))
+        for section in mode_format.summary_sections
+    ]
+    width = card_config.width
+    height = (
+        HEADER_HEIGHT
+        + CARD_PADDING * 2
+        + sum(SECTION_HEIGHT + ROW_HEIGHT * len(items) for _, items in sections)
+        + SECTION_GAP * max(len(sections) - 1, 0)
+    )
+
+    with plt.rc_context({"font.family": card_config.font_family}):
+        figure = plt.figure(
+            figsize=(width / CARD_DPI, height / CARD_DPI),
+            dpi=CARD_DPI,
+            facecolor=CARD_COLORS["background"],
+        )
+        try:
+            _draw_card(figure, width, height, mode, sections, card_config)
+            if as_bytes:
+                buffer = io.BytesIO()
+                figure.savefig(
+                    buffer, format="png", facecolor=CARD_COLORS["background"]
+                )
+            else:
+                output_path = resolve_output_path(
+                    output_path, f"{mode.lower()}_summary"
+                )
+                figure.savefig(
+                    output_path, format="png", facecolor=CARD_COLORS["background"]
+                )
+        finally:
+            plt.close(figure)
+
+    if as_bytes:
+        logger.info("Summary card for mode=%s rendered in memory", mode)
+        return buffer.getvalue()
+    logger.info("Summary card for mode=%s saved to %s", mode, output_path)
+    return output_path
+
+
+def _draw_card(figure, width, height, mode, sections, card_config):
+    def at(x, y):
+        return x / width, 1 - y / height
+
+    figure.text(
+        *at(CARD_PADDING, CARD_PADDING + HEADER_HEIGHT / 2),
+        f"Macro Pulse ({mode.upper()})",
+        fontsize=26,
+        color=CARD_COLORS["title"],
+        va="center",
+    )
+
+    price_x = width * 0.45
+    change_x = width * 0.68
+    sparkline_x = width * 0.74
+    sparkline_width = width - CARD_PADDING - sparkline_x
+
+    y = CARD_PADDING + HEADER_HEIGHT
+    for index, (title, items) in enumerate(sections):
+        figure.text(
+            *at(CARD_PADDING, y + SECTION_HEIGHT / 2),
+            title,
+            fontsize=18,
+            color=CARD_COLORS["section"],
+            va="center",
+        )
+        figure.add_artist(
+            Line2D(
+                [CARD_PADDING / width, 1 - CARD_PADDING / width],
+                [1 - (y + SECTION_HEIGHT - 6) / height] * 2,
+                color=CARD_COLORS["divider"],
+                linewidth=2,
+            )
+        )
+        y += SECTION_HEIGHT
+
+        for item in items:
+            center_y = y + ROW_HEIGHT / 2
+            figure.text(
+                *at(CARD_PADDING, center_y),
+                item.name,
+                fontsize=16,
+                color=CARD_COLORS["text"],
+                va="center",
+            )
+            figure.text(
+                *at(price_x, center_y),
+                format_numeric(item.price, item.value_format) or "N/A",
+                fontsize=16,
+                color=CARD_COLORS["text"],
+                fontweight="bold",
+                family="monospace",
+                va="center",
+            )
+            if item.change_pct is not None:
+                figure.text(
+                    *at(change_x, center_y),
+                    f"{item.change_pct:+,.2f}%",
+                    fontsize=16,
+                    color=CARD_COLORS[_color_key(item.change_pct)],
+                    ha="right",
+                    va="center",
+                )
+            if card_config.show_sparklines and len(item.history) > 1:
+                _draw_sparkline(
+                    figure,
+                    item.history,
+                    (
+                        sparkline_x / width,
+                        1 - (y + ROW_HEIGHT - 8) / height,
+                        sparkline_width / width,
+                        (ROW_HEIGHT - 16) / height,
+                    ),
+                )
+            y += ROW_HEIGHT
+
+        if index < len(sections) - 1:
+            y += SECTION_GAP
+
+
+def _draw_sparkline(figure, history, bounds):
+    axis = figure.add_axes(bounds)
+    axis.plot(
+        history,
+        color=CARD_COLORS["positive" if history[-1] >= history[0] else "negative"],
+        linewidth=2,
+    )
+    axis.axis("off")
+
+
+def _color_key(change_pct):
+    if change_pct > 0:
+        return "positive"
+    if change_pct < 0:
+        return "negative"
+    return "neutral"
@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.reporting import chromedriver_cache
+
+
+class ChromedriverCacheTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.cache_path = self.root / "chromedriver.json"
+        self.chrome = self.root / "chromium"
+        self.chrome.write_text("chrome-v1")
+        self.driver = self.root / "chromedriver"
+        self.driver.write_text("driver")
+
+        patcher = patch.object(
+            chromedriver_cache, "read_chrome_version", return_value="Chromium 131"
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def resolve(self, resolve_driver):
+        return chromedriver_cache.resolve_cached_chromedriver(
+            str(self.chrome), resolve_driver, self.cache_path
+        )
+
+    def test_default_cache_path_is_per_user_not_shared_temp(self):
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.root)}, clear=True):
+            path = chromedriver_cache.resolve_chromedriver_cache_path()
+
+        self.assertEqual(path, self.root / "macro-pulse" / "chromedriver.json")
+        self.assertNotEqual(path.parent, Path(tempfile.gettempdir()))
+
+    def test_cached_driver_is_reused_without_resolving_again(self):
+        resolve_driver = MagicMock(return_value=str(self.driver))
+
+        self.assertEqual(self.resolve(resolve_driver), str(self.driver))
+        self.assertEqual(self.resolve(resolve_driver), str(self.driver))
+
+        resolve_driver.assert_called_once_with()
+        entry = chromedriver_cache.load_chromedriver_cache(self.cache_path)
+        self.assertEqual(entry.chrome_version, "Chromium 131")
+        self.assertEqual(entry.chrome_binary, str(self.chrome))
+
+    def test_changed_chrome_binary_revalidates_driver(self):
+        resolve_driver = MagicMock(return_value=str(self.driver))
+        self.resolve(resolve_driver)
+
+        self.chrome.write_text("chrome-v2 with a different size")
+        self.resolve(resolve_driver)
+
+        self.assertEqual(resolve_driver.call_count, 2)
+
+    def test_missing_driver_file_revalidates_driver(self):
+        resolve_driver = MagicMock(return_value=str(self.driver))
+        self.resolve(resolve_driver)
+
+        self.driver.unlink()
+        self.resolve(resolve_driver)
+
+        self.assertEqual(resolve_driver.call_count, 2)
+
+    def test_unreadable_cache_is_ignored(self):
+        self.cache_path.write_text("{not json")
+
+        self.assertIsNone(chromedriver_cache.load_chromedriver_cache(self.cache_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import unittest
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.data.market_data import _reorder_bond_snapshots
+from macro_pulse.domain.models import (
+    AssetSnapshot,
+    IndexedDataset,
+    index_dataset,
+    normalize_dataset,
+)
+
+
+class DatasetIndexTests(unittest.TestCase):
+    def test_index_dataset_supports_name_and_ticker_lookup(self):
+        dataset = index_dataset(
+            {
+                "crypto": [
+                    {"name": "Bitcoin", "price": 71554.51, "ticker": "BTC-USD"},
+                    {"name": "Ethereum", "price": 2082.61, "ticker": "ETH-USD"},
+                ]
+            }
+        )
+
+        self.assertEqual(dataset.lookup("crypto", "Ethereum").price, 2082.61)
+        self.assertIsNone(dataset.lookup("indices_overseas", "Ethereum"))
+        self.assertEqual(dataset.lookup_ticker("BTC-USD").name, "Bitcoin")
+        self.assertEqual(
+            [item.name for item in dataset.select("crypto", ["Ethereum", "XRP"])],
+            ["Ethereum"],
+        )
+
+    def test_index_dataset_is_shared_instead_of_rebuilt(self):
+        dataset = IndexedDataset.from_dataset({"crypto": []})
+
+        self.assertIs(index_dataset(dataset), dataset)
+        self.assertIs(normalize_dataset(dataset), dataset.categories)
+
+    def test_reorder_bond_snapshots_places_us_after_korea(self):
+        commodities_rates = [
+            AssetSnapshot(name="Gold"),
+            AssetSnapshot(name="US 10Y Treasury"),
+            AssetSnapshot(name="Japan 10Y Treasury"),
+            AssetSnapshot(name="Korea 10Y Treasury"),
+        ]
+
+        _reorder_bond_snapshots(commodities_rates)
+
+        self.assertEqual(
+            [item.name for item in commodities_rates],
+            ["Gold", "Japan 10Y Treasury", "Korea 10Y Treasury", "US 10Y Treasury"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+import os
+import sys
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from telegram.error import RetryAfter
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.app import cli as app_main
+from macro_pulse.delivery.fanout import (
+    TelegramRateLimiter,
+    TokenBucket,
+    fan_out_telegram_report,
+    resolve_telegram_chat_ids,
+)
+from macro_pulse.delivery.notifier import close_telegram_bots
+from macro_pulse.domain.models import (
+    ModeFormatConfig,
+    RecipientDelivery,
+    ReportFormatConfig,
+)
+
+
+def _photo_message(file_id):
+    return MagicMock(
+        message_id=1, photo=[MagicMock(file_id="thumb"), MagicMock(file_id=file_id)]
+    )
+
+
+class FanoutTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await close_telegram_bots()
+
+    def test_chat_ids_are_split_and_deduplicated(self):
+        self.assertEqual(
+            resolve_telegram_chat_ids(" 1, @channel,,1 "), ["1", "@channel"]
+        )
+        with patch.dict(os.environ, {"TELEGRAM_CHAT_ID": "42"}):
+            self.assertEqual(resolve_telegram_chat_ids(), ["42"])
+
+    async def test_token_bucket_limits_rate_after_the_burst(self):
+        bucket = TokenBucket(rate=20, capacity=2)
+
+        started_at = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.09)
+
+    async def test_per_chat_buckets_are_independent(self):
+        limiter = TelegramRateLimiter(global_rate=1000, chat_rate=1, chat_burst=1)
+
+        started_at = time.monotonic()
+        for chat_id in ("a", "b", "c"):
+            await limiter(chat_id)
+
+        self.assertLess(time.monotonic() - started_at, 0.5)
+
+    async def test_paused_global_bucket_holds_every_chat(self):
+        limiter = TelegramRateLimiter(global_rate=1000, chat_rate=1000, chat_burst=5)
+        limiter.pause(0.2)
+
+        started_at = time.monotonic()
+        await limiter("other-chat")
+
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.19)
+
+    async def test_retry_after_pauses_the_shared_limiter(self):
+        limiter = AsyncMock()
+        limiter.pause = MagicMock()
+        with (
+            patch("macro_pulse.delivery.notifier.Bot") as bot_cls,
+            patch("macro_pulse.delivery.notifier.sleep", new=AsyncMock()),
+        ):
+            bot = AsyncMock()
+            bot.send_message.side_effect = [RetryAfter(5), MagicMock(message_id=1)]
+            bot_cls.return_value = bot
+
+            reports = await fan_out_telegram_report(
+                "token", ["a"], "hello", rate_limiter=limiter
+            )
+
+        self.assertTrue(reports[0].delivered)
+        limiter.pause.assert_called_once_with(5.0)
+
+    async def test_fan_out_uploads_once_and_reports_each_recipient(self):
+        uploads = iter(["file-1", "file-2"])
+
+        async def send_message(chat_id, text):
+            if chat_id == "bad":
+                raise OSError("chat not found")
+            return MagicMock(message_id=1)
+
+        async def send_photo(chat_id, photo):
+            if isinstance(photo, bytes):
+                return _photo_message(next(uploads))
+            return _photo_message(photo)
+
+        limiter = AsyncMock()
+        with patch("macro_pulse.delivery.notifier.Bot") as bot_cls:
+            bot = AsyncMock()
+            bot.send_message.side_effect = send_message
+            bot.send_photo.side_effect = send_photo
+            bot_cls.return_value = bot
+
+            reports = await fan_out_telegram_report(
+                "token",
+                ["first", "bad", "third"],
+                "hello",
+                images=[b"png-1", b"png-2"],
+                rate_limiter=limiter,
+                attempts=1,
+            )
+
+        self.assertEqual(
+            [(report.chat_id, report.delivered) for report in reports],
+            [("first", True), ("bad", False), ("third", True)],
+        )
+        sent = [
+            (call.kwargs["chat_id"], call.kwargs["photo"])
+            for call in bot.send_photo.await_args_list
+        ]
+        self.assertEqual(
+            sent,
+            [
+                ("first", b"png-1"),
+                ("first", b"png-2"),
+                ("third", "file-1"),
+                ("third", "file-2"),
+            ],
+        )
+        self.assertEqual(reports[0].calls, 3)
+        self.assertEqual(limiter.await_count, 7)
+
+    async def test_cli_fans_out_and_keeps_hashes_when_a_chat_fails(self):
+        with (
+            patch.dict(
+                os.environ,
+                {"TELEGRAM_BOT_TOKEN": "token", "TELEGRAM_CHAT_ID": "a,b"},
+            ),
+            patch("macro_pulse.app.cli._capture_mode_screenshots", return_value=[]),
+            patch("macro_pulse.app.cli.load_image_hashes", return_value={}),
+            patch("macro_pulse.app.cli.save_image_hashes") as save_hashes,
+            patch("macro_pulse.app.cli.load_media_cache", return_value={}),
+            patch("macro_pulse.app.cli.save_media_cache") as save_media_cache,
+            patch(
+                "macro_pulse.app.cli.fan_out_telegram_report",
+                new_callable=AsyncMock,
+                return_value=[
+                    RecipientDelivery(chat_id="a", delivered=True, seconds=0.1),
+                    RecipientDelivery(chat_id="b", delivered=False, seconds=0.1),
+                ],
+            ) as fan_out,
+        ):
+            await app_main._deliver_mode_report(
+                {},
+                "KR",
+                "summary",
+                ReportFormatConfig(modes={"KR": ModeFormatConfig()}),
+            )
+
+        fan_out.assert_awaited_once_with(
+            "token", ["a", "b"], "summary", images=[], media_cache={}
+        )
+        save_hashes.assert_not_called()
+        save_media_cache.assert_called_once_with({})
+
+
+if __name__ == "__main__":
+    unittest.main()
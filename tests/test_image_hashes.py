@@ -0,0 +1,80 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.domain.models import ScreenshotResult
+from macro_pulse.reporting.image_hashes import (
+    dhash,
+    hamming_distance,
+    load_image_hashes,
+    mark_unchanged_screenshots,
+    record_delivered_hashes,
+    save_image_hashes,
+)
+
+
+class ImageHashTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+
+    def save_map(self, name, tiles, image_format="PNG"):
+        image = Image.new("RGB", (360, 240), "white")
+        draw = ImageDraw.Draw(image)
+        for index, color in enumerate(tiles):
+            left = (index % 3) * 120
+            top = (index // 3) * 120
+            draw.rectangle([left, top, left + 119, top + 119], fill=color)
+        path = self.root / name
+        image.save(path, image_format)
+        return str(path)
+
+    def test_dhash_ignores_reencoding_but_not_new_colors(self):
+        tiles = ["#2ecc71", "#e74c3c", "#2ecc71", "#e74c3c", "#95a5a6", "#2ecc71"]
+        original = dhash(self.save_map("a.png", tiles))
+        reencoded = dhash(self.save_map("a.jpg", tiles, "JPEG"))
+        changed = dhash(self.save_map("b.png", list(reversed(tiles))))
+
+        self.assertLessEqual(hamming_distance(original, reencoded), 6)
+        self.assertGreater(hamming_distance(original, changed), 6)
+
+    def test_mark_and_record_keep_last_delivered_hash(self):
+        tiles = ["#2ecc71", "#e74c3c", "#2ecc71", "#e74c3c", "#95a5a6", "#2ecc71"]
+        kospi = self.save_map("kospi.png", tiles)
+        kosdaq = self.save_map("kosdaq.png", list(reversed(tiles)))
+        delivered = {"kospi": dhash(kospi), "kosdaq": dhash(kospi)}
+
+        results = mark_unchanged_screenshots(
+            [
+                ScreenshotResult(target="kospi", path=kospi),
+                ScreenshotResult(target="kosdaq", path=kosdaq),
+                ScreenshotResult(target="finviz"),
+            ],
+            delivered,
+        )
+
+        self.assertEqual([result.unchanged for result in results], [True, False, False])
+        self.assertEqual(
+            record_delivered_hashes(results, delivered),
+            {"kospi": delivered["kospi"], "kosdaq": dhash(kosdaq)},
+        )
+
+    def test_store_round_trips_hashes(self):
+        store_path = self.root / "hashes.json"
+
+        save_image_hashes({"finviz": "ff00"}, store_path)
+
+        self.assertEqual(load_image_hashes(store_path), {"finviz": "ff00"})
+        self.assertEqual(load_image_hashes(self.root / "missing.json"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
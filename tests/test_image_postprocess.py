@@ -0,0 +1,91 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.domain.models import (
+    ScreenshotPostprocessConfig,
+    ScreenshotResult,
+    ScreenshotTargetConfig,
+)
+from macro_pulse.reporting.image_postprocess import (
+    postprocess_image,
+    postprocess_screenshots,
+    trim_uniform_border,
+)
+
+
+class ImagePostprocessTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+
+    def save_map(self, name="map.png"):
+        image = Image.new("RGB", (2000, 1200), "white")
+        draw = ImageDraw.Draw(image)
+        for index in range(24):
+            left = 100 + (index % 6) * 300
+            top = 100 + (index // 6) * 250
+            color = (46, 204, 113) if index % 3 else (231, 76, 60)
+            draw.rectangle([left, top, left + 290, top + 240], fill=color)
+        path = self.root / name
+        image.save(path, "PNG")
+        return path
+
+    def test_trim_uniform_border_crops_to_content(self):
+        with Image.open(self.save_map()) as image:
+            trimmed = trim_uniform_border(image)
+
+        self.assertEqual(trimmed.size, (1791, 991))
+
+    def test_postprocess_image_downsizes_and_reencodes(self):
+        source = self.save_map()
+        config = ScreenshotPostprocessConfig(
+            enabled=True, max_width=800, image_format="webp", quality=80
+        )
+
+        output = Path(postprocess_image(source, config))
+
+        self.assertEqual(output.suffix, ".webp")
+        self.assertFalse(source.exists())
+        with Image.open(output) as image:
+            self.assertEqual(image.format, "WEBP")
+            self.assertEqual(image.width, 800)
+
+    def test_postprocess_screenshots_reports_bytes_before_and_after(self):
+        kospi = self.save_map("kospi.png")
+        kosdaq = self.save_map("kosdaq.png")
+        enabled = ScreenshotTargetConfig(
+            postprocess=ScreenshotPostprocessConfig(
+                enabled=True, max_width=600, palette_colors=16
+            )
+        )
+
+        results = postprocess_screenshots(
+            [
+                ScreenshotResult(target="kospi", path=str(kospi)),
+                ScreenshotResult(target="kosdaq", path=str(kosdaq)),
+            ],
+            {"kospi": enabled, "kosdaq": ScreenshotTargetConfig()},
+        )
+
+        self.assertEqual(results[0].path, str(kospi))
+        self.assertLess(
+            results[0].image_bytes["after"], results[0].image_bytes["before"]
+        )
+        self.assertEqual(results[1].image_bytes, {})
+
+    def test_postprocess_config_rejects_unknown_formats(self):
+        with self.assertRaises(ValueError):
+            ScreenshotPostprocessConfig.from_mapping({"format": "gif"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,7 +14,9 @@ from macro_pulse.domain.models import (
     AssetSnapshot,
     ModeFormatConfig,
     ReportFormatConfig,
+    ScreenshotResult,
     SummarySectionConfig,
+    index_dataset,
 )
 
 
@@ -60,8 +62,10 @@ class MainTests(unittest.IsolatedAsyncioTestCase):
                     return_value=config,
                 ),
                 patch(
-                    "macro_pulse.app.cli.generate_html_report",
-                    return_value="<html>report</html>",
+                    "macro_pulse.app.cli.stream_html_report",
+                    side_effect=lambda _data, path: Path(path).write_text(
+                        "<html>report</html>", encoding="utf-8"
+                    ),
                 ) as html_report,
                 patch(
                     "macro_pulse.app.cli.generate_telegram_summary",
@@ -84,6 +88,111 @@ class MainTests(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(
                 output_path.read_text(encoding="utf-8"), "<html>report</html>"
             )
-            html_report.assert_called_once_with(data)
-            telegram_summary.assert_called_once_with(data, "US", config)
+            html_report.assert_called_once_with(
+                index_dataset(data), Path("macro_pulse_report.html")
+            )
+            telegram_summary.assert_called_once_with(index_dataset(data), "US", config)
             telegram.assert_not_awaited()
+
+    async def test_main_all_modes_fetches_and_renders_once(self):
+        data = {
+            "indices_domestic": [AssetSnapshot(name="KOSPI", price=2650.1)],
+            "indices_overseas": [AssetSnapshot(name="S&P 500", price=5100.25)],
+        }
+        config = ReportFormatConfig(
+            modes={
+                "KR": ModeFormatConfig(
+                    summary_sections=[
+                        SummarySectionConfig(
+                            title="국내 증시",
+                            category="indices_domestic",
+                            items=["KOSPI"],
+                        )
+                    ]
+                ),
+                "US": ModeFormatConfig(
+                    summary_sections=[
+                        SummarySectionConfig(
+                            title="해외 증시",
+                            category="indices_overseas",
+                            items=["S&P 500"],
+                        )
+                    ]
+                ),
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with (
+                patch("macro_pulse.app.cli.fetch_all_data", return_value=data) as fetch,
+                patch(
+                    "macro_pulse.app.cli.load_report_format_config",
+                    return_value=config,
+                ),
+                patch(
+                    "macro_pulse.app.cli.render_dataset",
+                    wraps=app_main.render_dataset,
+                ) as render,
+            ):
+                previous_cwd = os.getcwd()
+                os.chdir(temp_dir)
+                try:
+                    exit_code = await app_main.main(["--dry-run", "--market", "all"])
+                finally:
+                    os.chdir(previous_cwd)
+
+            kr_report = Path(temp_dir) / "macro_pulse_report_kr.html"
+            us_report = Path(temp_dir) / "macro_pulse_report_us.html"
+            self.assertEqual(exit_code, 0)
+            self.assertIn("Macro Pulse Daily Report (KR)", kr_report.read_text())
+            self.assertIn("Macro Pulse Daily Report (US)", us_report.read_text())
+            fetch.assert_called_once_with()
+            render.assert_called_once()
+
+    async def test_deliver_mode_report_replaces_unchanged_screenshots_with_note(self):
+        config = ReportFormatConfig(
+            modes={"KR": ModeFormatConfig(screenshot_targets=["kospi", "kosdaq"])}
+        )
+        results = [
+            ScreenshotResult(
+                target="kospi", png=b"kospi", image_hash="aa", unchanged=True
+            ),
+            ScreenshotResult(target="kosdaq", png=b"kosdaq", image_hash="bb"),
+        ]
+
+        with (
+            patch.dict(
+                os.environ,
+                {"TELEGRAM_BOT_TOKEN": "token", "TELEGRAM_CHAT_ID": "chat"},
+            ),
+            patch(
+                "macro_pulse.app.cli._capture_mode_screenshots",
+                return_value=results,
+            ),
+            patch(
+                "macro_pulse.app.cli.mark_unchanged_screenshots",
+                side_effect=lambda marked, _hashes: marked,
+            ),
+            patch(
+                "macro_pulse.app.cli.load_image_hashes",
+                return_value={"kospi": "aa"},
+            ),
+            patch("macro_pulse.app.cli.save_image_hashes") as save_hashes,
+            patch("macro_pulse.app.cli.load_media_cache", return_value={}),
+            patch("macro_pulse.app.cli.save_media_cache"),
+            patch(
+                "macro_pulse.app.cli.send_telegram_report",
+                new_callable=AsyncMock,
+                return_value=True,
+            ) as telegram,
+        ):
+            await app_main._deliver_mode_report({}, "KR", "summary", config)
+
+        telegram.assert_awaited_once_with(
+            "token",
+            "chat",
+            "summary\n\n지난 발송 이후 변화 없음: KOSPI",
+            images=[b"kosdaq"],
+            media_cache={},
+        )
+        save_hashes.assert_called_once_with({"kospi": "aa", "kosdaq": "bb"})
@@ -0,0 +1,117 @@
+import io
+import json
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+from PIL import Image
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.app import cli as app_main
+from macro_pulse.domain.models import MarketMapConstituent, ScreenshotResult
+from macro_pulse.reporting.market_treemap import (
+    TREEMAP_SIZE,
+    render_market_treemap,
+    render_native_screenshots,
+    resolve_market_map_source,
+    squarify,
+    take_market_treemap,
+)
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "market_maps")
+
+
+def load_fixture_constituents(market):
+    with open(os.path.join(FIXTURE_DIR, f"{market}.json"), encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return [MarketMapConstituent.from_mapping(item) for item in payload["constituents"]]
+
+
+class SquarifyTests(unittest.TestCase):
+    def test_squarify_fills_the_box_in_proportion(self):
+        values = [60, 25, 10, 5]
+
+        rects = squarify(values, 0, 0, 400, 200)
+
+        for value, (x, y, width, height) in zip(values, rects, strict=True):
+            self.assertAlmostEqual(width * height, 400 * 200 * value / 100)
+            self.assertGreaterEqual(x, 0)
+            self.assertGreaterEqual(y, 0)
+            self.assertLessEqual(x + width, 400 + 1e-9)
+            self.assertLessEqual(y + height, 200 + 1e-9)
+
+    def test_squarify_keeps_tiles_close_to_square(self):
+        rects = squarify([1] * 16, 0, 0, 400, 400)
+
+        for _x, _y, width, height in rects:
+            self.assertAlmostEqual(width / height, 1.0, places=6)
+
+
+class MarketTreemapTests(unittest.TestCase):
+    def test_fixture_markets_render_quickly_without_a_browser(self):
+        for market in ("kospi", "kosdaq"):
+            with self.subTest(market=market):
+                started_at = time.monotonic()
+                png = render_market_treemap(
+                    load_fixture_constituents(market), title=market, as_bytes=True
+                )
+                elapsed = time.monotonic() - started_at
+
+                with Image.open(io.BytesIO(png)) as image:
+                    self.assertEqual(image.size, TREEMAP_SIZE)
+                self.assertLess(elapsed, 1.0)
+
+    def test_market_map_source_resolution(self):
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(resolve_market_map_source())
+        self.assertIs(
+            resolve_market_map_source(load_fixture_constituents),
+            load_fixture_constituents,
+        )
+        self.assertIs(resolve_market_map_source("json:loads"), json.loads)
+        with self.assertRaises(ValueError):
+            resolve_market_map_source("fixture")
+
+    def test_market_map_needs_a_configured_source(self):
+        with patch.dict(os.environ, {}, clear=True):
+            with self.assertRaises(ValueError):
+                take_market_treemap("kospi", as_bytes=True)
+            self.assertEqual(render_native_screenshots(["kospi", "kosdaq"]), {})
+
+    def test_native_screenshots_cover_only_market_map_targets(self):
+        results = render_native_screenshots(
+            ["finviz", "kospi"], source=load_fixture_constituents
+        )
+
+        self.assertEqual(list(results), ["kospi"])
+        self.assertTrue(results["kospi"].png.startswith(b"\x89PNG"))
+
+    def test_cli_merges_native_and_browser_targets_in_order(self):
+        with (
+            patch.object(
+                app_main,
+                "render_native_screenshots",
+                return_value={"kospi": ScreenshotResult(target="kospi", png=b"k")},
+            ),
+            patch.object(
+                app_main, "request_service_screenshot_results", return_value=None
+            ),
+            patch.object(
+                app_main,
+                "capture_screenshot_results",
+                return_value=[ScreenshotResult(target="finviz", png=b"f")],
+            ) as capture,
+        ):
+            results = app_main._capture_mode_screenshots(["finviz", "kospi"])
+
+        capture.assert_called_once_with(["finviz"])
+        self.assertEqual([result.png for result in results], [b"f", b"k"])
+
+
+if __name__ == "__main__":
+    unittest.main()
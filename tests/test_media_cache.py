@@ -0,0 +1,163 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from telegram.error import BadRequest
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.delivery.media_cache import (
+    cached_file_ids,
+    load_media_cache,
+    media_cache_key,
+    record_file_ids,
+    resolve_media_cache_path,
+    save_media_cache,
+)
+from macro_pulse.delivery.notifier import close_telegram_bots, send_telegram_report
+
+
+NOW = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+
+
+def _photo_message(file_id):
+    return MagicMock(message_id=1, photo=[MagicMock(file_id=file_id)])
+
+
+class MediaCacheTests(unittest.TestCase):
+    def test_cache_key_uses_bot_id_and_content_only(self):
+        key = media_cache_key("12345:secret", b"png")
+
+        self.assertTrue(key.startswith("12345:"))
+        self.assertNotIn("secret", key)
+        self.assertEqual(key, media_cache_key("12345:other", b"png"))
+        self.assertNotEqual(key, media_cache_key("999:secret", b"png"))
+
+    def test_default_cache_path_is_outside_the_temp_directory(self):
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": "/var/cache/app"}, clear=True):
+            self.assertEqual(
+                resolve_media_cache_path(),
+                Path("/var/cache/app/macro-pulse/telegram-media.json"),
+            )
+        with patch.dict(os.environ, {"TELEGRAM_MEDIA_CACHE_PATH": "/state/media.json"}):
+            self.assertEqual(resolve_media_cache_path(), Path("/state/media.json"))
+
+    def test_entries_round_trip_and_expire(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "media.json"
+            cache = {}
+            record_file_ids(cache, "1:t", [b"new"], {0: "file-new"}, now=NOW)
+            record_file_ids(
+                cache, "1:t", [b"old"], {0: "file-old"}, now=NOW - timedelta(hours=30)
+            )
+            save_media_cache(cache, cache_path)
+
+            loaded = load_media_cache(cache_path, ttl_hours=24, now=NOW)
+            disabled = load_media_cache(cache_path, ttl_hours=0, now=NOW)
+
+        self.assertEqual(
+            cached_file_ids(loaded, "1:t", [b"new", b"old", "file-x"]),
+            ["file-new", b"old", "file-x"],
+        )
+        self.assertEqual(disabled, {})
+
+    def test_recording_keeps_the_first_upload_time(self):
+        cache = {}
+        record_file_ids(cache, "1:t", [b"png"], {0: "first"}, now=NOW)
+        record_file_ids(
+            cache, "1:t", [b"png"], {0: "second"}, now=NOW + timedelta(hours=1)
+        )
+
+        self.assertEqual(
+            list(cache.values()),
+            [{"file_id": "first", "uploaded_at": NOW.isoformat()}],
+        )
+
+
+class MediaCacheDeliveryTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await close_telegram_bots()
+
+    async def test_identical_images_are_uploaded_once_across_sends(self):
+        media_cache = {}
+        with patch("macro_pulse.delivery.notifier.Bot") as bot_cls:
+            bot = AsyncMock()
+            bot.send_photo.return_value = _photo_message("file-1")
+            bot_cls.return_value = bot
+
+            for _ in range(2):
+                await send_telegram_report(
+                    "1:t", "chat", "hi", images=[b"png"], media_cache=media_cache
+                )
+
+        self.assertEqual(
+            [call.kwargs["photo"] for call in bot.send_photo.await_args_list],
+            [b"png", "file-1"],
+        )
+
+    async def test_rejected_file_id_falls_back_to_uploading(self):
+        media_cache = {}
+        record_file_ids(media_cache, "1:t", [b"png"], {0: "stale"}, now=NOW)
+        with (
+            patch("macro_pulse.delivery.notifier.Bot") as bot_cls,
+            patch("macro_pulse.delivery.notifier.sleep", new=AsyncMock()),
+        ):
+            bot = AsyncMock()
+            bot.send_photo.side_effect = [
+                BadRequest("Wrong file identifier"),
+                _photo_message("fresh"),
+            ]
+            bot_cls.return_value = bot
+
+            result = await send_telegram_report(
+                "1:t", "chat", "hi", images=[b"png"], media_cache=media_cache
+            )
+
+        self.assertTrue(result)
+        self.assertEqual(
+            [call.kwargs["photo"] for call in bot.send_photo.await_args_list],
+            ["stale", b"png"],
+        )
+        bot.send_message.assert_awaited_once()
+        self.assertEqual(
+            [entry["file_id"] for entry in media_cache.values()], ["fresh"]
+        )
+
+    async def test_unrelated_bad_request_keeps_cached_file_ids(self):
+        await self._assert_bad_request_keeps_cache("Chat not found")
+
+    async def test_non_file_id_media_bad_request_keeps_cached_file_ids(self):
+        await self._assert_bad_request_keeps_cache("Media caption is too long")
+
+    async def _assert_bad_request_keeps_cache(self, message):
+        media_cache = {}
+        record_file_ids(media_cache, "1:t", [b"png"], {0: "cached"}, now=NOW)
+        with (
+            patch("macro_pulse.delivery.notifier.Bot") as bot_cls,
+            patch("macro_pulse.delivery.notifier.sleep", new=AsyncMock()),
+        ):
+            bot = AsyncMock()
+            bot.send_photo.side_effect = BadRequest(message)
+            bot_cls.return_value = bot
+
+            result = await send_telegram_report(
+                "1:t", "chat", "hi", images=[b"png"], media_cache=media_cache
+            )
+
+        self.assertFalse(result)
+        self.assertEqual(
+            [call.kwargs["photo"] for call in bot.send_photo.await_args_list],
+            ["cached", "cached"],
+        )
+        self.assertEqual(
+            [entry["file_id"] for entry in media_cache.values()], ["cached"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
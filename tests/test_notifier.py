@@ -1,15 +1,27 @@
 import os
 import sys
 import unittest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from telegram.error import RetryAfter
 
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
-from macro_pulse.delivery.notifier import send_telegram_report
+from macro_pulse.delivery.notifier import (
+    CAPTION_MAX_LENGTH,
+    MEDIA_GROUP_MAX_ITEMS,
+    close_telegram_bots,
+    resolve_telegram_delivery_mode,
+    send_telegram_report,
+    telegram_retry_delay,
+)
 
 
 class NotifierTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await close_telegram_bots()
+
     async def test_send_telegram_report_sends_message_and_images(self):
         with (
             patch("macro_pulse.delivery.notifier.Bot") as bot_cls,
@@ -30,3 +42,166 @@ class NotifierTests(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(result)
         bot.send_message.assert_awaited_once_with(chat_id="chat-id", text="hello")
         bot.send_photo.assert_awaited_once()
+
+    async def test_send_telegram_report_uploads_images_from_memory(self):
+        with patch("macro_pulse.delivery.notifier.Bot") as bot_cls:
+            bot = AsyncMock()
+            bot_cls.return_value = bot
+
+            result = await send_telegram_report(
+                "token", "chat-id", "hello", images=[b"png-1", b"png-2"], attempts=1
+            )
+
+        self.assertTrue(result)
+        self.assertEqual(
+            [call.kwargs["photo"] for call in bot.send_photo.await_args_list],
+            [b"png-1", b"png-2"],
+        )
+
+    async def test_media_group_mode_sends_one_captioned_album(self):
+        timings = {}
+        with patch("macro_pulse.delivery.notifier.Bot") as bot_cls:
+            bot = AsyncMock()
+            bot_cls.return_value = bot
+
+            result = await send_telegram_report(
+                "token",
+                "chat-id",
+                "hello",
+                images=[b"png-1", b"png-2", b"png-3"],
+                attempts=1,
+                delivery_mode="media_group",
+                timings=timings,
+            )
+
+        self.assertTrue(result)
+        bot.send_message.assert_not_awaited()
+        bot.send_photo.assert_not_awaited()
+        media = bot.send_media_group.await_args.kwargs["media"]
+        self.assertEqual(
+            [item.media.input_file_content for item in media],
+            [
+                b"png-1",
+                b"png-2",
+                b"png-3",
+            ],
+        )
+        self.assertEqual([item.caption for item in media], ["hello", None, None])
+        self.assertEqual(list(timings), ["send_media_group[1]"])
+
+    async def test_media_group_mode_splits_long_summaries_and_large_albums(self):
+        timings = {}
+        with patch("macro_pulse.delivery.notifier.Bot") as bot_cls:
+            bot = AsyncMock()
+            bot_cls.return_value = bot
+
+            result = await send_telegram_report(
+                "token",
+                "chat-id",
+                "x" * (CAPTION_MAX_LENGTH + 1),
+                images=[b"png"] * (MEDIA_GROUP_MAX_ITEMS + 1),
+                attempts=1,
+                delivery_mode="media_group",
+                timings=timings,
+            )
+
+        self.assertTrue(result)
+        bot.send_message.assert_awaited_once()
+        self.assertEqual(
+            len(bot.send_media_group.await_args.kwargs["media"]), MEDIA_GROUP_MAX_ITEMS
+        )
+        bot.send_photo.assert_awaited_once_with(
+            chat_id="chat-id", photo=b"png", caption=None
+        )
+        self.assertEqual(
+            list(timings), ["send_message", "send_media_group[1]", "send_photo[2]"]
+        )
+
+    def test_delivery_mode_comes_from_the_environment(self):
+        with patch.dict(os.environ, {"TELEGRAM_DELIVERY_MODE": "MEDIA_GROUP"}):
+            self.assertEqual(resolve_telegram_delivery_mode(), "media_group")
+        with self.assertRaises(ValueError):
+            resolve_telegram_delivery_mode("album")
+
+    async def test_bot_and_http_pool_are_reused_across_retries_and_reports(self):
+        with (
+            patch.dict(os.environ, {"TELEGRAM_POOL_SIZE": "4"}),
+            patch("macro_pulse.delivery.notifier.Bot") as bot_cls,
+            patch("macro_pulse.delivery.notifier.sleep", new=AsyncMock()),
+            patch("macro_pulse.delivery.notifier.HTTPXRequest") as request_cls,
+        ):
+            bot = AsyncMock()
+            bot.send_message.side_effect = [OSError("reset"), None, None, None]
+            bot_cls.return_value = bot
+
+            first = await send_telegram_report("token", "chat-id", "hello")
+            second = await send_telegram_report("token", "chat-id", "again")
+            await close_telegram_bots()
+            third = await send_telegram_report("token", "chat-id", "later")
+
+        self.assertEqual((first, second, third), (True, True, True))
+        self.assertEqual(bot_cls.call_count, 2)
+        self.assertEqual(request_cls.call_args.kwargs["connection_pool_size"], 4)
+        self.assertIs(bot_cls.call_args.kwargs["request"], request_cls.return_value)
+        bot.shutdown.assert_awaited_once()
+
+    async def test_retry_resumes_only_the_parts_that_failed(self):
+        journal = {}
+        with (
+            patch("macro_pulse.delivery.notifier.Bot") as bot_cls,
+            patch("macro_pulse.delivery.notifier.sleep", new=AsyncMock()) as sleep,
+        ):
+            bot = AsyncMock()
+            bot.send_message.return_value = MagicMock(message_id=10)
+            bot.send_photo.side_effect = [
+                MagicMock(message_id=11),
+                RetryAfter(7),
+                MagicMock(message_id=12),
+            ]
+            bot_cls.return_value = bot
+
+            result = await send_telegram_report(
+                "token",
+                "chat-id",
+                "hello",
+                images=[b"png-1", b"png-2"],
+                journal=journal,
+            )
+
+        self.assertTrue(result)
+        bot.send_message.assert_awaited_once()
+        self.assertEqual(
+            [call.kwargs["photo"] for call in bot.send_photo.await_args_list],
+            [b"png-1", b"png-2", b"png-2"],
+        )
+        sleep.assert_awaited_once_with(7.0)
+        self.assertEqual(
+            journal,
+            {"send_message": [10], "send_photo[1]": [11], "send_photo[2]": [12]},
+        )
+
+    async def test_parts_in_the_journal_are_not_sent_again(self):
+        with patch("macro_pulse.delivery.notifier.Bot") as bot_cls:
+            bot = AsyncMock()
+            bot_cls.return_value = bot
+
+            result = await send_telegram_report(
+                "token",
+                "chat-id",
+                "hello",
+                images=[b"png-1"],
+                attempts=1,
+                journal={"send_message": [10]},
+            )
+
+        self.assertTrue(result)
+        bot.send_message.assert_not_awaited()
+        bot.send_photo.assert_awaited_once()
+
+    def test_retry_delay_backs_off_exponentially_and_honours_retry_after(self):
+        self.assertEqual(
+            [telegram_retry_delay(OSError(), attempt) for attempt in (1, 2, 3)],
+            [1.0, 2.0, 4.0],
+        )
+        self.assertEqual(telegram_retry_delay(OSError(), 20), 60.0)
+        self.assertEqual(telegram_retry_delay(RetryAfter(30), 1), 30.0)
@@ -0,0 +1,74 @@
+import itertools
+import os
+import sys
+import time
+import unittest
+from unittest.mock import MagicMock
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.reporting.page_readiness import (
+    _RESOURCE_COUNT_SCRIPT,
+    wait_for_canvas_stable,
+    wait_for_network_idle,
+)
+
+
+def _driver_returning(*states):
+    driver = MagicMock()
+    driver.execute_script.side_effect = itertools.chain(
+        states, itertools.repeat(states[-1])
+    )
+    return driver
+
+
+class PageReadinessTests(unittest.TestCase):
+    def test_network_idle_waits_for_resource_count_to_settle(self):
+        driver = _driver_returning(1, 2, 3, 3)
+
+        waited = wait_for_network_idle(driver, idle_period=0.2, timeout=2.0)
+
+        self.assertGreaterEqual(waited, 0.2)
+        self.assertLess(waited, 2.0)
+        self.assertGreaterEqual(driver.execute_script.call_count, 4)
+
+    def test_network_idle_keeps_waiting_while_resources_load_past_the_buffer(self):
+        # The count climbs past the 250-entry timeline buffer for 0.3s and then
+        # settles, so the probe is ready only 0.2s after that.
+        started_at = time.monotonic()
+
+        def resource_count(script):
+            self.assertEqual(script, _RESOURCE_COUNT_SCRIPT)
+            elapsed = time.monotonic() - started_at
+            return 240 + int(elapsed * 100) if elapsed < 0.3 else 270
+
+        driver = MagicMock()
+        driver.execute_script.side_effect = resource_count
+
+        waited = wait_for_network_idle(driver, idle_period=0.2, timeout=2.0)
+
+        self.assertGreaterEqual(waited, 0.5)
+        self.assertLess(waited, 2.0)
+
+    def test_canvas_probe_ignores_blank_canvas_until_timeout(self):
+        driver = _driver_returning(0)
+
+        waited = wait_for_canvas_stable(
+            driver, MagicMock(), stable_period=0.1, timeout=0.3
+        )
+
+        self.assertGreaterEqual(waited, 0.3)
+
+    def test_canvas_probe_returns_once_pixels_stop_changing(self):
+        driver = _driver_returning(11, 12, 13, 13)
+
+        waited = wait_for_canvas_stable(
+            driver, MagicMock(), stable_period=0.2, timeout=2.0
+        )
+
+        self.assertLess(waited, 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.domain.models import AssetSnapshot, index_dataset
+from macro_pulse.reporting import generator, render_cache
+from macro_pulse.reporting.render_cache import (
+    RENDER_CACHE_VERSION,
+    RenderCache,
+    dataset_fingerprints,
+    diff_datasets,
+    load_render_cache,
+    save_render_cache,
+)
+
+
+def _dataset(bitcoin_price):
+    return index_dataset(
+        {
+            "crypto": [
+                AssetSnapshot(name="Bitcoin", price=bitcoin_price, change=1.0),
+                AssetSnapshot(name="Ethereum", price=2082.61, change=-1.0),
+            ]
+        }
+    )
+
+
+class RenderCacheTests(unittest.TestCase):
+    def test_render_dataset_only_rerenders_changed_rows(self):
+        cache = RenderCache()
+        generator.render_dataset(_dataset(71554.51), render_cache=cache)
+
+        with patch.object(
+            generator, "_render_item", wraps=generator._render_item
+        ) as render_item:
+            rendered = generator.render_dataset(_dataset(72000.0), render_cache=cache)
+
+        self.assertEqual(render_item.call_count, 1)
+        self.assertEqual(render_item.call_args.args[0].name, "Bitcoin")
+        self.assertEqual(
+            [row.price_str for row in rendered["crypto"]], ["72,000.00", "2,082.61"]
+        )
+
+    def test_render_dataset_fingerprints_each_row_once(self):
+        cache = RenderCache()
+        generator.render_dataset(_dataset(71554.51), render_cache=cache)
+
+        with patch(
+            "macro_pulse.reporting.render_cache.snapshot_fingerprint",
+            wraps=render_cache.snapshot_fingerprint,
+        ) as fingerprint:
+            generator.render_dataset(_dataset(72000.0), render_cache=cache)
+
+        self.assertEqual(fingerprint.call_count, 2)
+
+    def test_diff_datasets_reports_added_changed_and_removed_rows(self):
+        cache = RenderCache()
+        generator.render_dataset(_dataset(71554.51), render_cache=cache)
+        current = index_dataset(
+            {
+                "crypto": [
+                    AssetSnapshot(name="Bitcoin", price=72000.0, change=1.0),
+                    AssetSnapshot(name="Solana", price=150.0),
+                ]
+            }
+        )
+
+        diff = diff_datasets(cache.fingerprints, dataset_fingerprints(current))
+
+        self.assertEqual(diff.changed, [("crypto", "Bitcoin")])
+        self.assertEqual(diff.added, [("crypto", "Solana")])
+        self.assertEqual(diff.removed, [("crypto", "Ethereum")])
+        self.assertEqual(diff.unchanged, [])
+
+    def test_render_cache_round_trips_through_disk(self):
+        cache = RenderCache()
+        generator.render_dataset(_dataset(71554.51), render_cache=cache)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = os.path.join(temp_dir, "render-cache.json")
+            save_render_cache(cache, cache_path)
+            loaded = load_render_cache(cache_path)
+
+        self.assertEqual(loaded.fingerprints, cache.fingerprints)
+        self.assertEqual(loaded.rows, cache.rows)
+
+    def test_malformed_rows_fall_back_to_an_empty_cache(self):
+        rows = [
+            {"category": "crypto", "name": "Bitcoin", "rendered": {}},
+            {
+                "category": "crypto",
+                "name": "Bitcoin",
+                "fingerprint": "abc",
+                "rendered": {"unexpected": 1},
+            },
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = os.path.join(temp_dir, "render-cache.json")
+            for row in rows:
+                with open(cache_path, "w", encoding="utf-8") as handle:
+                    json.dump({"version": RENDER_CACHE_VERSION, "rows": [row]}, handle)
+
+                loaded = load_render_cache(cache_path)
+
+                self.assertEqual(loaded.fingerprints, {})
+                self.assertEqual(loaded.rows, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
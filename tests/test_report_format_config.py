@@ -8,6 +8,7 @@ import unittest
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
 from macro_pulse.config.report_formats import (
+    get_screenshot_target_config,
     get_screenshot_targets,
     get_workflow_schedule,
     load_report_format_config,
@@ -26,6 +27,18 @@ class ReportFormatConfigTests(unittest.TestCase):
         self.assertEqual(get_screenshot_targets("KR", config), ["kospi", "kosdaq"])
         self.assertEqual(get_screenshot_targets("US", config), ["finviz"])
 
+    def test_default_config_blocks_third_party_resources_per_target(self):
+        config = load_report_format_config()
+
+        for target in ("finviz", "kospi", "kosdaq"):
+            target_config = get_screenshot_target_config(target, config)
+            self.assertIn("*googletagmanager.com*", target_config.blocked_url_patterns)
+            self.assertEqual(target_config.allowed_hosts, [])
+            self.assertTrue(target_config.postprocess.enabled)
+        self.assertEqual(
+            get_screenshot_target_config("unknown", config).blocked_url_patterns, []
+        )
+
     def test_default_config_defines_expected_workflow_schedules(self):
         config = load_report_format_config()
 
@@ -1,7 +1,10 @@
 import copy
+import io
 import os
 import sys
+import tempfile
 import unittest
+from unittest.mock import patch
 
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
@@ -13,9 +16,15 @@ from macro_pulse.domain.models import (
     SummarySectionConfig,
     ValueFormat,
 )
+from macro_pulse.reporting import generator
 from macro_pulse.reporting.generator import (
+    clear_template_cache,
     generate_html_report,
     generate_telegram_summary,
+    get_template_environment,
+    precompile_templates,
+    resolve_sprite_path,
+    stream_html_report,
 )
 
 
@@ -39,6 +48,75 @@ class ReportGeneratorTests(unittest.TestCase):
         self.assertIn("4.321", html)
         self.assertEqual(data, original)
 
+    def test_stream_html_report_matches_string_render(self):
+        data = {
+            "crypto": [
+                {
+                    "name": "Bitcoin",
+                    "price": 71554.51,
+                    "change": 3100.0,
+                    "change_pct": 4.61,
+                    "history": [68000.0, 69000.0, 71554.51],
+                }
+            ]
+        }
+        buffer = io.StringIO()
+
+        written = stream_html_report(data, buffer)
+
+        self.assertEqual(buffer.getvalue(), generate_html_report(data))
+        self.assertEqual(written, len(buffer.getvalue().encode("utf-8")))
+
+    def test_failed_stream_keeps_the_previous_report(self):
+        data = {"crypto": [{"name": f"Coin {i}", "price": 1.0} for i in range(5)]}
+        calls = []
+        real_render_item = generator._render_item
+
+        def flaky_render(item):
+            calls.append(item)
+            if len(calls) == 3:
+                raise RuntimeError("render failed")
+            return real_render_item(item)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, "report.html")
+            with open(report_path, "w", encoding="utf-8") as handle:
+                handle.write("previous report")
+
+            with (
+                patch.object(generator, "_render_item", side_effect=flaky_render),
+                self.assertRaises(RuntimeError),
+            ):
+                stream_html_report(data, report_path)
+
+            with open(report_path, encoding="utf-8") as handle:
+                self.assertEqual(handle.read(), "previous report")
+            self.assertEqual(os.listdir(temp_dir), ["report.html"])
+
+    def test_sprite_modes_embed_one_image_for_all_sparklines(self):
+        data = {
+            "crypto": [
+                {"name": "Bitcoin", "price": 3.0, "history": [1.0, 2.0, 3.0]},
+                {"name": "Ethereum", "price": 1.0, "history": [3.0, 2.0, 1.0]},
+            ]
+        }
+
+        html = generate_html_report(data, sparkline_mode="sprite")
+
+        self.assertEqual(html.count("data:image/png;base64,"), 1)
+        self.assertIn("background-position: 0 -0px", html)
+        self.assertIn("background-position: 0 -25px", html)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, "report.html")
+            stream_html_report(data, report_path, sparkline_mode="external")
+
+            with open(report_path, encoding="utf-8") as handle:
+                external_html = handle.read()
+            self.assertTrue(resolve_sprite_path(report_path).exists())
+            self.assertIn('url("report_sparklines.png")', external_html)
+            self.assertNotIn("data:image/png;base64,", external_html)
+
     def test_generate_telegram_summary_uses_explicit_value_format(self):
         data = {
             "commodities_rates": [
@@ -68,3 +146,25 @@ class ReportGeneratorTests(unittest.TestCase):
         summary = generate_telegram_summary(data, "US", config)
 
         self.assertEqual(summary, "[채권]\nUS 10Y Treasury: 4.321 (-0.28%)")
+
+    def test_template_environment_is_cached_per_directory(self):
+        clear_template_cache()
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.dict(os.environ, {"JINJA_CACHE_DIR": cache_dir}):
+                env = get_template_environment()
+                self.assertIs(get_template_environment(), env)
+
+                self.assertEqual(precompile_templates(), ["report.html"])
+                self.assertTrue(os.listdir(cache_dir))
+
+        clear_template_cache()
+
+    def test_bytecode_cache_defaults_to_jinjas_private_directory(self):
+        with patch.dict(os.environ, {}, clear=True):
+            cache = generator._build_bytecode_cache()
+
+        self.assertNotEqual(
+            cache.directory, os.path.join(tempfile.gettempdir(), "macro-pulse-jinja")
+        )
+        self.assertEqual(os.stat(cache.directory).st_mode & 0o077, 0)
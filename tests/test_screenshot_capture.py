@@ -0,0 +1,278 @@
+import base64
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import ANY, MagicMock, patch
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.core.artifacts import cleanup_files
+from macro_pulse.domain.models import ScreenshotTargetConfig
+from macro_pulse.reporting import screenshots
+
+
+class ScreenshotCaptureTests(unittest.TestCase):
+    def test_capture_screenshots_shares_one_browser_session(self):
+        driver = MagicMock()
+        finviz = MagicMock(return_value=b"finviz-png")
+        kospi = MagicMock(return_value=b"kospi-png")
+
+        with (
+            patch.object(
+                screenshots, "get_chrome_driver", return_value=driver
+            ) as get_driver,
+            patch.dict(
+                screenshots.SCREENSHOT_HANDLERS,
+                {"finviz": finviz, "kospi": kospi},
+            ),
+        ):
+            paths = screenshots.capture_screenshots(["kospi", "unknown", "finviz"])
+        self.addCleanup(cleanup_files, paths)
+
+        self.assertEqual(
+            [Path(path).read_bytes() for path in paths], [b"kospi-png", b"finviz-png"]
+        )
+        get_driver.assert_called_once_with(allowed_hosts=None)
+        driver.quit.assert_called_once_with()
+        kospi.assert_called_once_with(driver=driver, waits=ANY, as_bytes=True)
+        finviz.assert_called_once_with(driver=driver, waits=ANY, as_bytes=True)
+        self.assertEqual(driver.switch_to.new_window.call_count, 2)
+        self.assertEqual(driver.close.call_count, 2)
+
+    def test_parallel_capture_keeps_configured_order(self):
+        drivers = [MagicMock(name="driver-1"), MagicMock(name="driver-2")]
+        release_first = threading.Event()
+
+        def slow_capture(driver, waits, as_bytes):
+            release_first.wait(timeout=5)
+            return b"kospi-png"
+
+        def fast_capture(driver, waits, as_bytes):
+            release_first.set()
+            return b"kosdaq-png"
+
+        with (
+            patch.object(screenshots, "get_chrome_driver", side_effect=drivers),
+            patch.dict(
+                screenshots.SCREENSHOT_HANDLERS,
+                {"kospi": slow_capture, "kosdaq": fast_capture},
+            ),
+        ):
+            results = screenshots.capture_screenshot_results(
+                ["kospi", "kosdaq"], pool_size=2, target_timeout=10
+            )
+
+        self.assertEqual(
+            [(result.target, result.png) for result in results],
+            [("kospi", b"kospi-png"), ("kosdaq", b"kosdaq-png")],
+        )
+        self.assertTrue(all(result.path is None for result in results))
+        for driver in drivers:
+            driver.quit.assert_called_once_with()
+
+    def test_capture_screenshots_drops_targets_that_time_out(self):
+        driver = MagicMock()
+        release = threading.Event()
+
+        def stuck_capture(driver, waits, as_bytes):
+            release.wait(timeout=5)
+            return b"stuck-png"
+
+        driver.quit.side_effect = lambda: release.set()
+
+        with (
+            patch.object(screenshots, "get_chrome_driver", return_value=driver),
+            patch.dict(screenshots.SCREENSHOT_HANDLERS, {"kospi": stuck_capture}),
+        ):
+            paths = screenshots.capture_screenshots(
+                ["kospi"], pool_size=1, target_timeout=0.1
+            )
+
+        self.assertEqual(paths, [])
+        driver.quit.assert_called_once_with()
+
+    def test_timed_out_target_kills_its_driver_processes(self):
+        service_process = subprocess.Popen(["sh", "-c", "sleep 30 & wait"])
+        self.addCleanup(service_process.kill)
+        driver = MagicMock()
+        driver.service.process.pid = service_process.pid
+        release = threading.Event()
+
+        def stuck_capture(driver, waits, as_bytes):
+            release.wait(timeout=5)
+            return b"stuck-png"
+
+        driver.quit.side_effect = lambda: release.set()
+
+        with (
+            patch.object(screenshots, "get_chrome_driver", return_value=driver),
+            patch.dict(screenshots.SCREENSHOT_HANDLERS, {"kospi": stuck_capture}),
+        ):
+            results = screenshots.capture_screenshot_results(
+                ["kospi"], pool_size=1, target_timeout=0.1
+            )
+
+        self.assertIsNone(results[0].png)
+        self.assertEqual(service_process.wait(timeout=5), -signal.SIGKILL)
+
+    def test_target_times_out_while_its_browser_is_starting(self):
+        driver = MagicMock()
+        release = threading.Event()
+        discarded = threading.Event()
+
+        def slow_driver(allowed_hosts=None):
+            release.wait(timeout=5)
+            return driver
+
+        capture = MagicMock(return_value=b"late-png")
+
+        with (
+            patch.object(screenshots, "get_chrome_driver", side_effect=slow_driver),
+            patch.object(
+                screenshots,
+                "_terminate_driver",
+                side_effect=lambda driver: discarded.set(),
+            ) as terminate,
+            patch.dict(screenshots.SCREENSHOT_HANDLERS, {"kospi": capture}),
+        ):
+            results = screenshots.capture_screenshot_results(
+                ["kospi"], pool_size=1, target_timeout=0.1
+            )
+            release.set()
+            self.assertTrue(discarded.wait(timeout=5))
+
+        self.assertIsNone(results[0].png)
+        terminate.assert_called_once_with(driver)
+        capture.assert_not_called()
+
+    def test_capture_screenshots_skips_browser_without_known_targets(self):
+        with patch.object(screenshots, "get_chrome_driver") as get_driver:
+            self.assertEqual(screenshots.capture_screenshots(["unknown"]), [])
+
+        get_driver.assert_not_called()
+
+    def test_take_screenshot_with_shared_driver_does_not_quit_it(self):
+        driver = MagicMock()
+
+        with patch.object(
+            screenshots, "_capture_finviz_map", return_value="finviz.png"
+        ):
+            path = screenshots.take_finviz_screenshot(driver=driver)
+
+        self.assertEqual(path, "finviz.png")
+        driver.quit.assert_not_called()
+
+    def test_capture_element_png_clips_full_page_screenshot(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = {
+            "x": 10,
+            "y": 900,
+            "width": 1800,
+            "height": 1200,
+        }
+        driver.execute_cdp_cmd.return_value = {
+            "data": base64.b64encode(b"png-bytes").decode("ascii")
+        }
+
+        png = screenshots.capture_element_png(driver, MagicMock())
+
+        self.assertEqual(png, b"png-bytes")
+        driver.execute_cdp_cmd.assert_called_once_with(
+            "Page.captureScreenshot",
+            {
+                "format": "png",
+                "captureBeyondViewport": True,
+                "clip": {"x": 10, "y": 900, "width": 1800, "height": 1200, "scale": 1},
+            },
+        )
+        driver.set_window_size.assert_not_called()
+
+    def test_capture_blocks_configured_urls_and_reports_network(self):
+        driver = MagicMock()
+        driver.get_log.side_effect = [
+            [_performance_entry("Network.requestWillBeSent")],
+            [
+                _performance_entry("Network.requestWillBeSent"),
+                _performance_entry("Network.requestWillBeSent"),
+                _performance_entry("Network.requestWillBeSent"),
+                _performance_entry("Network.loadingFinished", encodedDataLength=2048),
+                _performance_entry("Network.loadingFailed", blockedReason="inspector"),
+                _performance_entry(
+                    "Network.loadingFailed", errorText="net::ERR_CONNECTION_RESET"
+                ),
+            ],
+        ]
+        target_config = ScreenshotTargetConfig(
+            blocked_url_patterns=["*doubleclick.net*"]
+        )
+
+        with (
+            patch.object(screenshots, "get_chrome_driver", return_value=driver),
+            patch.object(
+                screenshots,
+                "get_screenshot_target_config",
+                return_value=target_config,
+            ),
+            patch.dict(
+                screenshots.SCREENSHOT_HANDLERS,
+                {"finviz": MagicMock(return_value=b"finviz-png")},
+            ),
+        ):
+            results = screenshots.capture_screenshot_results(["finviz"])
+
+        driver.execute_cdp_cmd.assert_any_call(
+            "Network.setBlockedURLs", {"urls": ["*doubleclick.net*"]}
+        )
+        self.assertEqual(
+            results[0].network,
+            {"requests": 3, "blocked": 1, "failed": 1, "loaded_bytes": 2048},
+        )
+
+    def test_allowlist_applies_only_when_every_target_defines_one(self):
+        finviz = ScreenshotTargetConfig(allowed_hosts=["finviz.com", "*.finviz.com"])
+        kospi = ScreenshotTargetConfig(allowed_hosts=["markets.hankyung.com"])
+
+        self.assertEqual(
+            screenshots.resolve_allowed_hosts({"finviz": finviz, "kospi": kospi}),
+            ["*.finviz.com", "finviz.com", "markets.hankyung.com"],
+        )
+        self.assertIsNone(
+            screenshots.resolve_allowed_hosts(
+                {"finviz": finviz, "kosdaq": ScreenshotTargetConfig()}
+            )
+        )
+
+    def test_resolve_screenshot_url_prefers_explicit_then_environment(self):
+        with patch.dict(
+            os.environ, {"SCREENSHOT_URL_KOSPI": "http://127.0.0.1:8000/map.html"}
+        ):
+            self.assertEqual(
+                screenshots.resolve_screenshot_url("kospi"),
+                "http://127.0.0.1:8000/map.html",
+            )
+            self.assertEqual(
+                screenshots.resolve_screenshot_url("kospi", "http://localhost/x"),
+                "http://localhost/x",
+            )
+            self.assertEqual(
+                screenshots.resolve_screenshot_url("finviz"), screenshots.FINVIZ_URL
+            )
+
+    def test_resolve_capture_mode_rejects_unknown_modes(self):
+        self.assertEqual(screenshots.resolve_capture_mode("CDP"), "cdp")
+        with self.assertRaises(ValueError):
+            screenshots.resolve_capture_mode("pdf")
+
+
+def _performance_entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+if __name__ == "__main__":
+    unittest.main()
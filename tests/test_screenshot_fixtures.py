@@ -0,0 +1,42 @@
+import os
+import sys
+import unittest
+from urllib.request import urlopen
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.app.benchmarks import (
+    SCREENSHOT_FIXTURE_PAGES,
+    measure_screenshot_timings,
+    serve_fixture_pages,
+)
+
+
+class ScreenshotFixtureTests(unittest.TestCase):
+    def test_fixture_server_serves_every_stand_in_page(self):
+        with serve_fixture_pages() as base_url:
+            for target, page in SCREENSHOT_FIXTURE_PAGES.items():
+                with self.subTest(target=target):
+                    with urlopen(f"{base_url}/{page}") as response:
+                        html = response.read().decode("utf-8")
+                    self.assertEqual(response.status, 200)
+                    self.assertTrue("canvas-wrapper" in html or "fiq-marketmap" in html)
+
+
+@unittest.skipUnless(
+    os.environ.get("RUN_SCREENSHOT_SMOKE_TESTS") == "1",
+    "Set RUN_SCREENSHOT_SMOKE_TESTS=1 to capture the offline stand-in pages.",
+)
+class ScreenshotFixtureCaptureTests(unittest.TestCase):
+    def test_every_target_captures_from_stand_in_pages(self):
+        results = measure_screenshot_timings()
+
+        for target, timings in results["targets"].items():
+            with self.subTest(target=target):
+                self.assertTrue(timings["captured"])
+                self.assertGreater(timings["readiness_seconds"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
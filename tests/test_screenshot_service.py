@@ -0,0 +1,113 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from macro_pulse.core.artifacts import cleanup_files
+from macro_pulse.domain.models import ScreenshotResult
+from macro_pulse.reporting import screenshot_service, screenshots
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.requested = []
+
+    def capture(self, targets):
+        self.requested.append(targets)
+        return [
+            (ScreenshotResult(target="kospi", waits={"dom_quiet": 0.5}), b"kospi-png"),
+            (ScreenshotResult(target="kosdaq"), b""),
+        ]
+
+    def health(self):
+        return {"status": "ok", "captures": 2}
+
+    def close(self):
+        pass
+
+
+class ScreenshotServiceTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.socket_path = os.path.join(temp_dir.name, "screenshots.sock")
+
+    def start_service(self, browser):
+        server = screenshot_service.create_service_server(self.socket_path, browser)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+    def test_client_receives_png_bytes_from_service(self):
+        browser = FakeBrowser()
+        self.start_service(browser)
+
+        paths = screenshot_service.request_service_screenshots(
+            ["kospi", "kosdaq"], self.socket_path
+        )
+        self.addCleanup(cleanup_files, paths)
+
+        self.assertEqual(browser.requested, [["kospi", "kosdaq"]])
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(Path(paths[0]).read_bytes(), b"kospi-png")
+        self.assertEqual(
+            screenshot_service.request_service_health(self.socket_path)["status"],
+            "ok",
+        )
+
+    def test_client_returns_none_without_a_running_service(self):
+        self.assertIsNone(
+            screenshot_service.request_service_screenshots(["kospi"], self.socket_path)
+        )
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(screenshot_service.request_service_screenshots(["kospi"]))
+
+    def test_warm_browser_recycles_after_failed_health_check(self):
+        stale, fresh = MagicMock(name="stale"), MagicMock(name="fresh")
+        stale.execute_script.side_effect = RuntimeError("browser crashed")
+        fresh.execute_script.return_value = 1
+        browser = screenshot_service.WarmBrowser(
+            profile_dir=os.path.dirname(self.socket_path)
+        )
+
+        with patch.object(
+            screenshots, "get_chrome_driver", side_effect=[stale, fresh]
+        ) as get_driver:
+            self.assertIs(browser._ensure_driver(), stale)
+            self.assertIs(browser._ensure_driver(), fresh)
+
+        stale.quit.assert_called_once_with()
+        self.assertEqual(browser.recycles, 1)
+        get_driver.assert_called_with(user_data_dir=os.path.dirname(self.socket_path))
+
+    def test_warm_browser_recycles_when_memory_grows(self):
+        first, second = MagicMock(name="first"), MagicMock(name="second")
+        first.execute_script.return_value = 1
+        browser = screenshot_service.WarmBrowser(
+            profile_dir=os.path.dirname(self.socket_path), max_rss_bytes=100
+        )
+
+        with (
+            patch.object(screenshots, "get_chrome_driver", side_effect=[first, second]),
+            patch.object(
+                screenshot_service, "process_tree_rss_bytes", return_value=101
+            ),
+        ):
+            browser._ensure_driver()
+            self.assertIs(browser._ensure_driver(), second)
+
+        first.quit.assert_called_once_with()
+
+    def test_process_tree_rss_includes_current_process(self):
+        self.assertGreater(screenshot_service.process_tree_rss_bytes(os.getpid()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,22 @@
+import gzip
+import json
 import os
 import sys
 import tempfile
 import unittest
+import unittest.mock
+from pathlib import Path
 
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
-from macro_pulse.core.artifacts import cleanup_files, resolve_output_path
+from macro_pulse.core.artifacts import (
+    check_size_budget,
+    cleanup_files,
+    finalize_report_artifact,
+    resolve_output_path,
+    write_compressed_siblings,
+)
 
 
 class ScreenshotUtilsTests(unittest.TestCase):
@@ -34,6 +44,66 @@ class ScreenshotUtilsTests(unittest.TestCase):
 
         self.assertFalse(os.path.exists(path))
 
+    def test_check_size_budget_flags_oversized_files(self):
+        path = resolve_output_path(None, "report")
+        try:
+            with open(path, "wb") as handle:
+                handle.write(b"x" * 100)
+
+            self.assertTrue(check_size_budget(path, budget_bytes=100))
+            self.assertFalse(check_size_budget(path, budget_bytes=99))
+        finally:
+            cleanup_files([path])
+
+    def test_finalize_report_artifact_writes_gzip_and_records_sizes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = Path(temp_dir) / "report.html"
+            report_path.write_text("<html>" + "x" * 1000 + "</html>")
+            log_path = Path(temp_dir) / "sizes.jsonl"
+
+            with unittest.mock.patch.dict(
+                os.environ, {"REPORT_SIZE_LOG": str(log_path)}
+            ):
+                entry = finalize_report_artifact(
+                    report_path, compression_formats=["gz"], compression_level=6
+                )
+
+            gzip_path = Path(temp_dir) / "report.html.gz"
+            self.assertEqual(
+                gzip.decompress(gzip_path.read_bytes()), report_path.read_bytes()
+            )
+            self.assertEqual(entry["raw_bytes"], report_path.stat().st_size)
+            self.assertEqual(entry["gz_bytes"], gzip_path.stat().st_size)
+            self.assertEqual(json.loads(log_path.read_text()), entry)
+
+    def test_unsupported_compression_format_is_rejected(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = Path(temp_dir) / "report.html"
+            report_path.write_text("<html></html>")
+
+            with self.assertRaises(ValueError):
+                write_compressed_siblings(report_path, ["br"])
+            self.assertEqual(list(Path(temp_dir).iterdir()), [report_path])
+
+    def test_report_sizes_are_only_logged_when_configured_and_capped(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = Path(temp_dir) / "report.html"
+            report_path.write_text("<html></html>")
+
+            with unittest.mock.patch.dict(os.environ, {}, clear=True):
+                finalize_report_artifact(report_path)
+            self.assertEqual(list(Path(temp_dir).glob("*.jsonl")), [])
+
+            with unittest.mock.patch.dict(
+                os.environ,
+                {"REPORT_SIZE_LOG": "sizes.jsonl", "REPORT_SIZE_LOG_MAX_ENTRIES": "2"},
+            ):
+                for _ in range(3):
+                    finalize_report_artifact(report_path)
+
+            lines = (Path(temp_dir) / "sizes.jsonl").read_text().splitlines()
+            self.assertEqual(len(lines), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,75 @@
+import io
+import os
+import sys
+import unittest
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from PIL import Image
+
+from macro_pulse.config.report_formats import (
+    get_summary_card_config,
+    load_report_format_config,
+)
+from macro_pulse.core.artifacts import cleanup_files
+from macro_pulse.domain.models import (
+    AssetSnapshot,
+    ModeFormatConfig,
+    ReportFormatConfig,
+    SummaryCardConfig,
+    SummarySectionConfig,
+)
+from macro_pulse.reporting.summary_card import render_summary_card
+
+
+class SummaryCardTests(unittest.TestCase):
+    def test_render_summary_card_writes_png_at_configured_width(self):
+        data = {
+            "crypto": [
+                AssetSnapshot(
+                    name="Bitcoin",
+                    price=71554.51,
+                    change=3100.0,
+                    change_pct=4.61,
+                    history=[68000.0, 69000.0, 71554.51],
+                )
+            ]
+        }
+        config = ReportFormatConfig(
+            modes={
+                "US": ModeFormatConfig(
+                    summary_sections=[
+                        SummarySectionConfig(
+                            title="Crypto", category="crypto", items=["Bitcoin"]
+                        )
+                    ],
+                    summary_card=SummaryCardConfig(enabled=True, width=800),
+                )
+            }
+        )
+
+        path = render_summary_card(data, "US", config)
+        try:
+            with Image.open(path) as image:
+                self.assertEqual(image.format, "PNG")
+                self.assertEqual(image.width, 800)
+        finally:
+            cleanup_files([path])
+
+        png = render_summary_card(data, "US", config, as_bytes=True)
+        with Image.open(io.BytesIO(png)) as image:
+            self.assertEqual(image.width, 800)
+
+    def test_default_config_defines_summary_card_per_mode(self):
+        config = load_report_format_config()
+
+        for mode in ("KR", "US"):
+            with self.subTest(mode=mode):
+                card = get_summary_card_config(mode, config)
+                self.assertIsNotNone(card)
+                self.assertFalse(card.enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()